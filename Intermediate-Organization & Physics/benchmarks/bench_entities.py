@@ -0,0 +1,114 @@
+# Memory per entity and attribute access speed: the old Planet (dataclass body behind
+# @property forwarders, own appearance dict) vs the slotted Planet vs a PhysicsWorld row.
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_entities            (100k entities)
+#   python -m benchmarks.bench_entities 10000
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from core.physics_world import PhysicsWorld
+from gameObjects.planet import Planet
+
+
+# --- what gameObjects/planet.py used to be ---
+@dataclass
+class OldBody:
+    x: float
+    y: float
+    vx: float = 0.0
+    vy: float = 0.0
+    mass: float = 1.0
+    radius: float = 8.0
+
+
+class OldPlanet:
+    def __init__(self, x, y, radius=40, color=(0, 120, 255), mass=5000, static=True):
+        self.body = OldBody(x, y, mass=mass, radius=radius)
+        self.appearance = {"type": "circle", "color": color}
+        self.static = static
+
+    @property
+    def x(self): return self.body.x
+    @x.setter
+    def x(self, v): self.body.x = v
+
+    @property
+    def y(self): return self.body.y
+    @y.setter
+    def y(self, v): self.body.y = v
+
+    @property
+    def vx(self): return self.body.vx
+    @vx.setter
+    def vx(self, v): self.body.vx = v
+
+    @property
+    def vy(self): return self.body.vy
+    @vy.setter
+    def vy(self, v): self.body.vy = v
+
+    @property
+    def mass(self): return self.body.mass
+
+    @property
+    def radius(self): return self.body.radius
+
+
+def build(kind, n):
+    if kind == "PhysicsWorld row":
+        pw = PhysicsWorld(G=1, capacity=n)
+        return [pw.add_body(float(i), float(i), 1.0, 1.0, mass=2.0, radius=3.0) for i in range(n)], pw
+    cls = OldPlanet if kind == "old (forwarders)" else Planet
+    items = []
+    for i in range(n):
+        p = cls(float(i), float(i), radius=3.0, mass=2.0, static=False)
+        p.vx = p.vy = 1.0
+        items.append(p)
+    return items, None
+
+
+def bytes_per_entity(kind, n):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    items, keep = build(kind, n)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / n
+
+
+def ns_per_access(items, reps=3):
+    """Best of `reps`: read x, y, vx, vy of every entity, then write x and y back."""
+    best_read = best_write = float("inf")
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        total = 0.0
+        for e in items:
+            total += e.x + e.y + e.vx + e.vy
+        best_read = min(best_read, time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for e in items:
+            e.x = e.x + e.vx
+            e.y = e.y + e.vy
+        best_write = min(best_write, time.perf_counter() - t0)
+    n = len(items)
+    return best_read / (4 * n) * 1e9, best_write / (6 * n) * 1e9
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n} entities")
+    print(f"{'storage':<20}{'bytes/entity':>14}{'read (ns)':>12}{'write (ns)':>12}")
+    for kind in ("old (forwarders)", "slotted Planet", "PhysicsWorld row"):
+        mem = bytes_per_entity(kind, n)
+        items, keep = build(kind, n)
+        read, write = ns_per_access(items)
+        print(f"{kind:<20}{mem:>14.0f}{read:>12.1f}{write:>12.1f}")
+    print("(read = 4 attribute reads, write = 4 reads + 2 writes, per entity; "
+          "PhysicsWorld is meant for whole-array NumPy math, not per-entity access)")
+
+
+if __name__ == "__main__":
+    main()
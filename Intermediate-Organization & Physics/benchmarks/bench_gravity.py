@@ -0,0 +1,57 @@
+# Accuracy vs speed: Barnes-Hut gravity compared to the exact pairwise solver.
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_gravity            (defaults)
+#   python -m benchmarks.bench_gravity 2000 0.3 0.5 1.0
+import math
+import random
+import sys
+import time
+
+from components.physics_body import PhysicsBody
+from core.physics import Physics
+
+
+def asteroid_field(n, seed=1):
+    """One heavy planet in the middle + n small rocks scattered in a disc around it."""
+    rng = random.Random(seed)
+    bodies = [PhysicsBody(0.0, 0.0, mass=5000, radius=40)]
+    for _ in range(n):
+        a = rng.uniform(0, 2 * math.pi)
+        d = rng.uniform(60, 2000)
+        bodies.append(PhysicsBody(d * math.cos(a), d * math.sin(a),
+                                  mass=rng.uniform(0.5, 5), radius=rng.uniform(2, 6)))
+    return bodies
+
+
+def timed(physics, bodies):
+    t0 = time.perf_counter()
+    ax, ay = physics.accelerations(bodies)
+    return time.perf_counter() - t0, ax, ay
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    thetas = [float(t) for t in sys.argv[2:]] or [0.3, 0.5, 0.8, 1.0]
+    bodies = asteroid_field(n)
+
+    t_exact, ax0, ay0 = timed(Physics(G=1, solver="pairwise"), bodies)
+    print(f"{len(bodies)} bodies")
+    print(f"{'solver':<18}{'time (ms)':>12}{'speedup':>10}{'mean err':>12}{'max err':>12}")
+    print(f"{'pairwise':<18}{t_exact * 1000:>12.1f}{1.0:>10.1f}{0.0:>12.2e}{0.0:>12.2e}")
+
+    for theta in thetas:
+        t, ax, ay = timed(Physics(G=1, solver="barnes_hut", theta=theta), bodies)
+        # relative error of the acceleration vector, per body
+        errs = []
+        for i in range(len(bodies)):
+            ref = math.hypot(ax0[i], ay0[i])
+            if ref > 0:
+                errs.append(math.hypot(ax[i] - ax0[i], ay[i] - ay0[i]) / ref)
+        mean_err = sum(errs) / len(errs) if errs else 0.0
+        max_err = max(errs) if errs else 0.0
+        print(f"{'barnes_hut θ=' + str(theta):<18}{t * 1000:>12.1f}{t_exact / t:>10.1f}"
+              f"{mean_err:>12.2e}{max_err:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Energy drift per integrator (core/integrators.py) on the orbit scene: a static planet
+# with moons on circular and eccentric orbits, run for the same simulated time at
+# several step sizes. Shows how big a step each integrator gets away with for a given
+# accuracy, and what that costs in steps/gravity evaluations per second.
+# (Adaptive's evaluations mostly cover just the few refined bodies, so wall time is
+# the number to compare.)
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_integrators              (tolerance 1e-3)
+#   python -m benchmarks.bench_integrators 1e-4
+import math
+import random
+import sys
+import time
+
+from components.physics_body import PhysicsBody
+from core.integrators import Adaptive
+from core.physics import Physics
+from core.sweep import total_energy
+
+G = 1.0
+PLANET = 5000
+SIM_TIME = 2000  # in 60 fps frames: ~8 orbits at r=200
+STEPS = (8, 4, 2, 1, 0.5, 0.25)
+
+
+def moons(n=12, seed=4):
+    """
+    Planet (index 0, static) + n light moons, inner ones on eccentric orbits dipping
+    close in, outer ones far out. The moons are tiny so they don't collide with each
+    other (the stick-on-contact response would eat energy and hide the integrator's).
+    """
+    rng = random.Random(seed)
+    bodies = [PhysicsBody(0.0, 0.0, mass=PLANET, radius=40)]
+    for k in range(n):
+        r = 150 * 1.2 ** k
+        a = 2 * math.pi * k / n
+        v = math.sqrt(G * PLANET / r) * rng.uniform(0.8, 1.1)
+        bodies.append(PhysicsBody(r * math.cos(a), r * math.sin(a), -v * math.sin(a), v * math.cos(a),
+                                  mass=0.01, radius=0.1))
+    return bodies
+
+
+def run(integrator, dt):
+    bodies = moons()
+    physics = Physics(G=G, integrator=integrator)
+    moving = list(range(1, len(bodies)))
+    e0 = total_energy(bodies, G)
+    worst = 0.0
+    steps = round(SIM_TIME / dt)
+    t = time.perf_counter()
+    for s in range(steps):
+        physics.step(bodies, dt, moving)
+        if s % max(1, steps // 200) == 0:
+            worst = max(worst, abs(total_energy(bodies, G) / e0 - 1))
+    wall = time.perf_counter() - t
+    worst = max(worst, abs(total_energy(bodies, G) / e0 - 1))
+    return worst, steps, physics.evaluations, wall
+
+
+def main(tolerance=1e-3):
+    integrators = {
+        "euler": "euler",
+        "verlet": "verlet",
+        "rk4": "rk4",
+        "adaptive verlet": Adaptive("verlet", eta=0.05),
+    }
+    print(f"max relative energy error over {SIM_TIME} frames of simulated time, "
+          f"{len(moons())} bodies")
+    print(f"{'integrator':<17}{'dt':>6}{'steps':>8}{'evals':>8}{'energy err':>12}{'wall (ms)':>11}")
+    best = {}
+    for name, integrator in integrators.items():
+        for dt in STEPS:
+            if not isinstance(integrator, str):
+                integrator = Adaptive(integrator.inner, eta=integrator.eta)
+            err, steps, evals, wall = run(integrator, dt)
+            print(f"{name:<17}{dt:>6}{steps:>8}{evals:>8}{err:>12.2e}{wall * 1000:>11.1f}")
+            if err <= tolerance and name not in best:
+                best[name] = (dt, steps, evals, wall)
+        print()
+
+    print(f"cheapest run with energy error <= {tolerance:g}:")
+    print(f"{'integrator':<17}{'dt':>6}{'evals':>8}{'wall (ms)':>11}{'sim frames/s':>14}")
+    for name in integrators:
+        if name not in best:
+            print(f"{name:<17}  none of the step sizes is accurate enough")
+            continue
+        dt, steps, evals, wall = best[name]
+        print(f"{name:<17}{dt:>6}{evals:>8}{wall * 1000:>11.1f}{SIM_TIME / wall:>14.0f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1e-3)
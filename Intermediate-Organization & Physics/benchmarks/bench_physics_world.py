@@ -0,0 +1,116 @@
+# Steps per second: object-based Physics.update vs the NumPy PhysicsWorld.
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_physics_world
+#   python -m benchmarks.bench_physics_world 500 5000 20000
+import math
+import random
+import sys
+import time
+
+from components.physics_body import PhysicsBody
+from core.physics import Physics
+from core.physics_world import PhysicsWorld
+from gameObjects.planet import Planet
+from gameObjects.player import Player
+
+
+def debris_ring(n, seed=1):
+    """(x, y, vx, vy, mass, radius) for n rocks in roughly circular orbits around (0, 0)."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        a = rng.uniform(0, 2 * math.pi)
+        d = rng.uniform(80, 3000)
+        v = math.sqrt(5000 / d)  # circular speed for G=1, M=5000
+        rows.append((d * math.cos(a), d * math.sin(a), -v * math.sin(a), v * math.cos(a),
+                     rng.uniform(0.5, 2), rng.uniform(2, 5)))
+    return rows
+
+
+def check_resting_contact():
+    """A body dropped onto a static planet has to come to rest on its surface."""
+    pw = PhysicsWorld(G=1)
+    pw.add_body(0, 0, mass=5000, radius=40, static=True)
+    body = pw.add_body(0, -200, mass=1, radius=10)
+    for _ in range(200):
+        pw.step(1.0)
+    assert abs(body.y + 50) < 0.5 and abs(body.vx) + abs(body.vy) < 1e-6, \
+        f"PhysicsWorld: dropped body didn't rest on the planet (y={body.y:.2f}, vy={body.vy:.2f})"
+    print(f"resting contact OK: body at y={body.y:.2f} (surface at -50)")
+
+
+def check_linked_objects():
+    """A Player added to a PhysicsWorld is its row: step() moves it, its writes reach the row."""
+    pw = PhysicsWorld(G=1)
+    planet = Planet(0, 0)
+    player = Player(0, -200, controller=None)
+    pw.add(planet)
+    row = pw.add(player)
+    assert player.body is row
+    for _ in range(10):
+        pw.step(1.0)
+    assert player.y > -200 and player.y == row.y, f"Player didn't move with its row (y={player.y})"
+    player.vx = 5.0
+    assert row.vx == 5.0, "writing player.vx didn't reach the row"
+    pw.remove(row)
+    y = player.y
+    pw.step(1.0)
+    assert player.body is None and player.y == y, "removed Player is still linked"
+    print(f"linked Player OK: fell to y={y:.2f} with its row")
+
+
+def check_solvers_agree():
+    """Physics and PhysicsWorld on the same contact scenes: resting drop, sliding,
+    a fast impact (moves 6x its radius per step -> swept) and a glancing one."""
+    for vx, vy in ((0, 0), (3, 0), (0, 60), (25, 40)):
+        pw = PhysicsWorld(G=1)
+        pw.add_body(0, 0, mass=5000, radius=40, static=True)
+        row = pw.add_body(0, -200, vx, vy, mass=1, radius=10)
+        bodies = [PhysicsBody(0, 0, mass=5000, radius=40), PhysicsBody(0, -200, vx, vy, mass=1, radius=10)]
+        physics = Physics(G=1)
+        for _ in range(200):
+            pw.step(1.0)
+            physics.step(bodies, 1.0, moving=[1])
+        obj = bodies[1]
+        diff = max(abs(row.x - obj.x), abs(row.y - obj.y), abs(row.vx - obj.vx), abs(row.vy - obj.vy))
+        assert diff < 1e-6, f"Physics and PhysicsWorld disagree (launched at {vx}, {vy}): off by {diff}"
+    print("Physics and PhysicsWorld agree on contact scenes OK")
+
+
+def steps_per_sec(step, budget=1.0):
+    step()  # warm up
+    n, t0 = 0, time.perf_counter()
+    while time.perf_counter() - t0 < budget:
+        step()
+        n += 1
+    return n / (time.perf_counter() - t0)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [200, 1000, 5000, 10000]
+    check_resting_contact()
+    check_linked_objects()
+    check_solvers_agree()
+    print(f"{'bodies':>8}{'Physics':>14}{'PW exact':>14}{'PW planets':>14}   (steps/sec, 60 = real time)")
+    for n in sizes:
+        rows = debris_ring(n)
+
+        if n <= 1000:  # the object version gets very slow past this
+            bodies = [PhysicsBody(0, 0, mass=5000, radius=40)] + [PhysicsBody(*r) for r in rows]
+            physics = Physics(G=1)
+            obj = f"{steps_per_sec(lambda: physics.update(bodies, 1.0)):>14.1f}"
+        else:
+            obj = f"{'-':>14}"
+
+        results = []
+        for min_mass in (0.0, 100.0):
+            pw = PhysicsWorld(G=1, capacity=n + 1, min_attractor_mass=min_mass)
+            pw.add_body(0, 0, mass=5000, radius=40, static=True)
+            for r in rows:
+                pw.add_body(*r)
+            results.append(steps_per_sec(lambda: pw.step(1.0)))
+        print(f"{n:>8}{obj}{results[0]:>14.1f}{results[1]:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# World.render and RenderSystem.draw (what main.py uses) cost vs world size, with a
+# fixed 1280x720 camera. With culling the time should follow what's on screen, not
+# how big the world is (static planets never need re-indexing).
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_render
+#   python -m benchmarks.bench_render 1000 100000
+import random
+import sys
+import time
+
+import pygame
+
+from components.appearance import Renderable, circle
+from components.physics_body import PhysicsBody, Static
+from core.camera import Camera
+from core.ecs import Registry
+from core.systems import RenderSystem
+from core.world import World
+from gameObjects.planet import Planet
+
+SCREEN_W, SCREEN_H = 1280, 720
+
+
+def scattered_world(n, density=2e-5, seed=1):
+    """n planets spread out so the number per screen stays about the same."""
+    rng = random.Random(seed)
+    side = (n / density) ** 0.5
+    world = World()
+    for _ in range(n):
+        world.add(Planet(rng.uniform(-side / 2, side / 2), rng.uniform(-side / 2, side / 2),
+                         radius=rng.randint(4, 30), color=(rng.randint(50, 255), 120, 200)))
+    return world
+
+
+def scattered_registry(world):
+    """The same planets as ECS entities, for RenderSystem."""
+    registry = Registry()
+    for p in world.objects:
+        e = registry.create(PhysicsBody(p.x, p.y, 0.0, 0.0, p.mass, p.radius), Renderable(circle(p.appearance["color"])))
+        if p.static:
+            registry.add(e, Static())
+    return registry
+
+
+def ms_per_frame(draw, screen, camera, frames=100):
+    draw(screen, camera)  # first frame fills the caches (sprites, RenderSystem's queue)
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+        draw(screen, camera)
+    return (time.perf_counter() - t0) / frames * 1000
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+    pygame.init()
+    screen = pygame.Surface((SCREEN_W, SCREEN_H))
+    camera = Camera(SCREEN_W, SCREEN_H, mode="free")
+
+    print(f"{'objects':>10}{'visible':>10}{'World (ms)':>14}{'RenderSystem (ms)':>20}")
+    for n in sizes:
+        world = scattered_world(n)
+        visible = len(world.index.query(*camera.view_rect(margin=64)))
+        system = RenderSystem(scattered_registry(world))
+        print(f"{n:>10}{visible:>10}{ms_per_frame(world.render, screen, camera):>14.3f}"
+              f"{ms_per_frame(system.draw, screen, camera):>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Replays a recorded session of main.py (RECORD_PATH, core/replay.py) headless at full
+# speed: no window, no drawing, just the fixed ticks with the recorded input.
+# Without a path it records a scripted 30 minute session first, then replays it twice
+# (same input -> same end state, checked against the recording's checkpoints).
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_replay               (scripted 30 min session)
+#   python -m benchmarks.bench_replay orbit.rply
+import os
+import random
+import sys
+import tempfile
+import time
+
+from components.controller import Controller
+from components.physics_body import PhysicsBody
+from core.ecs import Registry
+from core.physics import Physics
+from core.replay import CHECK_EVERY, Recorder, Replay, checksum
+from core.systems import ControllerSystem, PhysicsSystem
+from gameObjects.entities import spawn_scene
+
+STEP = 1 / 60
+
+
+def scene():
+    """main.py's world and tick, minus the window."""
+    registry = Registry()
+    controller = Controller()
+    player_id, _ = spawn_scene(registry, 1280, 720, controller)
+    controls = ControllerSystem(registry)
+    physics = PhysicsSystem(registry, Physics(G=1))
+
+    def tick(step):
+        dt = step * 60
+        controls.update(dt)
+        physics.update(dt)
+    return controller, registry.get(player_id, PhysicsBody), tick
+
+
+def record_scripted(path, ticks, seed=3):
+    """Hold random keys for random stretches, like a person steering around."""
+    rng = random.Random(seed)
+    controller, player, tick = scene()
+    rec = Recorder(path, STEP, seed)
+    held = 0
+    for i in range(ticks):
+        if held == 0:
+            controller.set_bits(rng.choice((0, 0, 0, 1, 2, 4, 8, 5, 10, 16)))
+            held = rng.randint(10, 240)
+        held -= 1
+        tick(STEP)
+        rec.tick(controller.bits)
+        if rec.ticks % CHECK_EVERY == 0:
+            rec.checkpoint(checksum(player.x, player.y, player.vx, player.vy))
+    rec.close()
+    return player
+
+
+def replay(path):
+    rec = Replay(path)
+    controller, player, tick = scene()
+    t = time.perf_counter()
+    for n, bits in enumerate(rec.inputs, 1):
+        controller.set_bits(bits)
+        tick(rec.step)
+        expected = rec.checkpoints.get(n)
+        if expected is not None and expected != checksum(player.x, player.y, player.vx, player.vy):
+            raise RuntimeError(f"replay diverged from the recording by tick {n}")
+    return rec, player, time.perf_counter() - t
+
+
+def main():
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+        runs = 1
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "scripted.rply")
+        live = record_scripted(path, 30 * 60 * 60)
+        print(f"recorded 30 min of scripted input: {os.path.getsize(path)} bytes, "
+              f"player ended at ({live.x:.3f}, {live.y:.3f})")
+        runs = 2
+    for _ in range(runs):
+        rec, player, s = replay(path)
+        print(f"replayed {len(rec)} ticks ({len(rec) * rec.step / 60:.1f} min) in {s:.2f} s, "
+              f"{len(rec) / s:.0f} ticks/s, {len(rec.checkpoints)} checkpoints OK, "
+              f"player at ({player.x:.3f}, {player.y:.3f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Snapshot/restore of 100k bodies (core/snapshot.py): a PhysicsWorld (one memcpy per
+# field), a list of slotted PhysicsBody objects, and pickle of that list for scale.
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_snapshot            (100k bodies)
+#   python -m benchmarks.bench_snapshot 1000000
+import pickle
+import random
+import sys
+import time
+
+import numpy as np
+
+from components.physics_body import PhysicsBody
+from core.physics_world import PhysicsWorld
+from core.snapshot import load_bodies, restore_bodies, snapshot_bodies
+
+
+def timed(fn, repeat=5):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t)
+    return best * 1000, result
+
+
+def main(n=100_000):
+    rng = random.Random(1)
+    bodies = [PhysicsBody(rng.uniform(-1e4, 1e4), rng.uniform(-1e4, 1e4), rng.gauss(0, 2),
+                          rng.gauss(0, 2), rng.uniform(0.5, 5), rng.uniform(2, 6)) for _ in range(n)]
+    world = PhysicsWorld(G=1, capacity=n, min_attractor_mass=1e9)
+    for b in bodies:
+        world.add(b)
+
+    print(f"{n} bodies{'':14}{'save (ms)':>10}{'restore (ms)':>14}{'size (MiB)':>12}")
+
+    # PhysicsWorld: snapshot, step, roll back -> must be bit-identical
+    ms_save, blob = timed(world.snapshot)
+    before = world.x.copy()
+    world.step(1.0)
+    ms_restore, _ = timed(lambda: world.restore(blob))
+    assert np.array_equal(world.x, before), "PhysicsWorld restore is not exact"
+    ms_fork, fork = timed(lambda: PhysicsWorld.from_snapshot(blob))
+    assert np.array_equal(fork.vy, world.vy) and not fork.views  # views come on demand
+    print(f"{'PhysicsWorld':24}{ms_save:10.2f}{ms_restore:14.2f}{len(blob) / 2**20:12.2f}")
+    print(f"{'  fork (from_snapshot)':24}{'':10}{ms_fork:14.2f}")
+
+    # Objects
+    ms_save, blob = timed(lambda: snapshot_bodies(bodies), 3)
+    saved = [(b.x, b.y, b.vx) for b in bodies[:1000]]
+    for b in bodies:
+        b.x += 1
+    ms_restore, _ = timed(lambda: restore_bodies(bodies, blob), 3)
+    assert [(b.x, b.y, b.vx) for b in bodies[:1000]] == saved, "restore_bodies is not exact"
+    ms_load, copies = timed(lambda: load_bodies(blob), 3)
+    print(f"{'PhysicsBody list':24}{ms_save:10.2f}{ms_restore:14.2f}{len(blob) / 2**20:12.2f}")
+    print(f"{'  fork (load_bodies)':24}{'':10}{ms_load:14.2f}")
+
+    ms_save, pickled = timed(lambda: pickle.dumps(bodies, protocol=pickle.HIGHEST_PROTOCOL), 3)
+    ms_load, _ = timed(lambda: pickle.loads(pickled), 3)
+    print(f"{'pickle (list)':24}{ms_save:10.2f}{ms_load:14.2f}{len(pickled) / 2**20:12.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,45 @@
+# pygame.draw every frame vs blitting shapes pre-drawn by SpriteCache.
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_sprites
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # convert() needs a display, not a window
+
+import pygame
+
+from core.sprite_cache import SpriteCache
+
+N = 20000
+
+
+def us_per_call(fn):
+    t0 = time.perf_counter()
+    for _ in range(N):
+        fn()
+    return (time.perf_counter() - t0) / N * 1e6
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    cache = SpriteCache()
+    color = (90, 210, 140)
+
+    print(f"{'shape':<26}{'draw (us)':>12}{'cached (us)':>14}")
+    for r in (5, 20, 40):
+        surf, ox, oy = cache.circle(color, r)
+        d = us_per_call(lambda: pygame.draw.circle(screen, color, (300, 300), r))
+        c = us_per_call(lambda: screen.blit(surf, (300 + ox, 300 + oy)))
+        print(f"{'circle r=' + str(r):<26}{d:>12.2f}{c:>14.2f}")
+
+    for w, h, br in ((50, 60, 10), (60, 80, 6)):
+        surf, _, _ = cache.rect(color, w, h, br)
+        rect = pygame.Rect(100, 100, w, h)
+        d = us_per_call(lambda: pygame.draw.rect(screen, color, rect, border_radius=br))
+        c = us_per_call(lambda: screen.blit(surf, rect.topleft))
+        print(f"{f'rect {w}x{h} radius={br}':<26}{d:>12.2f}{c:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
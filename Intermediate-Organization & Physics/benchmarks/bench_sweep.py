@@ -0,0 +1,53 @@
+# A 1000-run parameter sweep of the orbit scene (G x orbit speed x distance) through
+# core/sweep.py: one process vs the process pool, plus a check that both agree.
+# Run from the "Intermediate-Organization & Physics" folder:
+#   python -m benchmarks.bench_sweep                 (1000 runs x 600 steps, all cores)
+#   python -m benchmarks.bench_sweep 200 300 4       (runs, steps, workers)
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+
+from core.sweep import RunConfig, orbit, run_sweep
+
+
+def configs(runs, steps):
+    grid = itertools.product((0.5, 0.75, 1.0, 1.5, 2.0),          # G
+                             np.linspace(0.7, 1.3, 20),           # speed / circular speed
+                             np.linspace(120, 600, 10))           # distance
+    out = []
+    for G, speed, distance in itertools.islice(itertools.cycle(grid), runs):
+        out.append(RunConfig(orbit(G=G, speed=float(speed), distance=float(distance), moons=3),
+                             G=G, dt=1.0, steps=steps))
+    return out
+
+
+def main(runs=1000, steps=600, workers=None):
+    workers = workers or os.cpu_count() or 1
+    cfgs = configs(runs, steps)
+
+    sample = cfgs[:max(1, runs // 20)]
+    t = time.perf_counter()
+    with run_sweep(sample, workers=0) as serial:
+        serial_final = serial.final.copy()
+    serial_s = (time.perf_counter() - t) / len(sample)
+
+    t = time.perf_counter()
+    with run_sweep(cfgs, workers=workers) as result:
+        wall = time.perf_counter() - t
+        assert np.array_equal(result.final[:len(sample)], serial_final), "pool disagrees with serial"
+        drift = np.abs(result.energy[:, 1] / result.energy[:, 0] - 1)
+        bound = np.isfinite(result.r_max).all(axis=1) & (result.r_max[:, 1:].max(axis=1) < 5000)
+
+    print(f"{runs} runs x {steps} steps x {len(cfgs[0].bodies)} bodies, {workers} worker(s)")
+    print(f"one process    {serial_s * runs:8.1f} s   (estimated from {len(sample)} runs)")
+    print(f"process pool   {wall:8.1f} s   {runs / wall:7.1f} runs/s   "
+          f"speedup {serial_s * runs / wall:.1f}x")
+    print(f"stayed in orbit: {int(bound.sum())}/{runs}, median energy drift {np.median(drift):.2e}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Appearance dicts are shared: every circle of the same color gets the SAME dict,
+# so 100k planets don't carry 100k copies. Treat them as read-only; to change how
+# something looks, assign a new appearance instead of editing the dict.
+
+
+@lru_cache(maxsize=None)
+def circle(color=(255, 255, 255)) -> dict:
+    return {"type": "circle", "color": color}
+
+
+@dataclass(slots=True, eq=False)
+class Renderable:
+    """ECS component: draw this entity (at its PhysicsBody position)."""
+    appearance: dict
+    z: float = 0
+    layer: int = 0
@@ -13,4 +13,24 @@ class Controller:
         self.down  = 1 if keys[pygame.K_DOWN]  or keys[pygame.K_s] else 0
         self.shift = 1 if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT] else 0
 
+    # The same state as 5 bits, for recording and replaying input (core/replay.py)
+    @property
+    def bits(self) -> int:
+        return self.left | self.right << 1 | self.up << 2 | self.down << 3 | self.shift << 4
+
+    def set_bits(self, bits: int) -> None:
+        self.left = bits & 1
+        self.right = bits >> 1 & 1
+        self.up = bits >> 2 & 1
+        self.down = bits >> 3 & 1
+        self.shift = bits >> 4 & 1
+
+class Thrust:
+    """ECS component: how hard a controlled entity pushes (per tick) and brakes."""
+    __slots__ = ("power", "brake")
+
+    def __init__(self, power=0.1, brake=0.92):
+        self.power = power
+        self.brake = brake
+
 import pygame  # at bottom to avoid circular import issues
@@ -1,10 +1,20 @@
 from dataclasses import dataclass
 
-@dataclass
+# slots=True: fields live in fixed slots instead of a per-instance __dict__
+#             (less memory, faster attribute access).
+# eq=False:   bodies compare/hash by identity, so they can be dict keys and set
+#             members (spatial index, render queue, loop snapshots).
+# Game objects subclass this, so Physics reads player.x directly - no forwarding.
+@dataclass(slots=True, eq=False)
 class PhysicsBody:
     x: float
     y: float
     vx: float = 0.0
     vy: float = 0.0
     mass: float = 1.0
-    radius: float = 8.0
\ No newline at end of file
+    radius: float = 8.0
+
+
+class Static:
+    """ECS tag: this body pulls and collides but never moves (planets)."""
+    __slots__ = ()
@@ -0,0 +1,139 @@
+import math
+from typing import List, Sequence
+
+# Barnes-Hut = approximate N-body gravity.
+# Instead of every body pulling on every other body (n^2), we drop all bodies into
+# a quadtree. Each square of the tree remembers its total mass and center of mass,
+# so a far-away clump of bodies can be treated as ONE body. How "far" is far enough
+# is controlled by theta (the opening angle):
+#   size_of_square / distance < theta  ->  use the clump
+#   otherwise                          ->  look inside (open) the square
+# theta = 0 means "always open" (exact, but slow); ~0.5 is the classic sweet spot.
+
+MAX_DEPTH = 24  # stop splitting here (bodies sitting on top of each other share a leaf)
+
+
+class _Node:
+    __slots__ = ("cx", "cy", "half", "mass", "mx", "my", "children", "items")
+
+    def __init__(self, cx, cy, half):
+        self.cx, self.cy = cx, cy      # center of this square
+        self.half = half               # half of the side length
+        self.mass = 0.0                # total mass inside
+        self.mx = self.my = 0.0        # mass-weighted position sums (com = mx / mass)
+        self.children = None           # 4 sub-squares once split
+        self.items = []                # body indices (leaves only)
+
+
+class QuadTree:
+    """
+    Built fresh every physics step from flat lists of x, y, mass, radius.
+    Bodies are referred to by their index in those lists.
+    """
+    def __init__(self, xs: Sequence[float], ys: Sequence[float],
+                 ms: Sequence[float], rs: Sequence[float]):
+        self.xs, self.ys, self.ms, self.rs = xs, ys, ms, rs
+        self.root = None
+        if not xs:
+            return
+
+        # Square bounds around everything (square keeps theta meaningful)
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+        half = max(max_x - min_x, max_y - min_y) / 2 + 1e-6
+        self.root = _Node((min_x + max_x) / 2, (min_y + max_y) / 2, half)
+
+        for i in range(len(xs)):
+            self._insert(self.root, i, 0)
+
+    def _child_for(self, node, i):
+        # children order: 0 = top-left, 1 = top-right, 2 = bottom-left, 3 = bottom-right
+        k = (1 if self.xs[i] >= node.cx else 0) + (2 if self.ys[i] >= node.cy else 0)
+        return node.children[k]
+
+    def _split(self, node):
+        q = node.half / 2
+        node.children = [
+            _Node(node.cx - q, node.cy - q, q),
+            _Node(node.cx + q, node.cy - q, q),
+            _Node(node.cx - q, node.cy + q, q),
+            _Node(node.cx + q, node.cy + q, q),
+        ]
+
+    def _insert(self, node, i, depth):
+        m = self.ms[i]
+        while True:
+            node.mass += m
+            node.mx += m * self.xs[i]
+            node.my += m * self.ys[i]
+
+            if node.children is None:
+                if not node.items or depth >= MAX_DEPTH:
+                    node.items.append(i)
+                    return
+                # Leaf already holds a body: split and push the resident down a level
+                self._split(node)
+                for j in node.items:
+                    self._insert(self._child_for(node, j), j, depth + 1)
+                node.items = []
+
+            node = self._child_for(node, i)
+            depth += 1
+
+    def accel(self, i: int, G: float, theta: float):
+        """Gravitational acceleration on body i from everything else in the tree."""
+        xs, ys, ms, rs = self.xs, self.ys, self.ms, self.rs
+        x, y, r = xs[i], ys[i], rs[i]
+        theta2 = theta * theta
+        ax = ay = 0.0
+
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.mass == 0:
+                continue
+
+            if node.children is None:
+                # Leaf: exact body-body interactions (same rules as the pairwise solver)
+                for j in node.items:
+                    if j == i:
+                        continue
+                    dx = xs[j] - x
+                    dy = ys[j] - y
+                    r2 = dx*dx + dy*dy
+                    if r2 == 0:
+                        continue
+                    d = math.sqrt(r2)
+                    if d < r + rs[j]:  # avoid extreme forces inside overlap
+                        continue
+                    a_mag = G * ms[j] / r2
+                    ax += a_mag * dx / d
+                    ay += a_mag * dy / d
+                continue
+
+            dx = node.mx / node.mass - x
+            dy = node.my / node.mass - y
+            r2 = dx*dx + dy*dy
+            size = 2 * node.half
+            outside = abs(x - node.cx) > node.half or abs(y - node.cy) > node.half
+            if outside and size*size < theta2 * r2:
+                # Far enough away: the whole square acts like one body at its center of mass
+                d = math.sqrt(r2)
+                a_mag = G * node.mass / r2
+                ax += a_mag * dx / d
+                ay += a_mag * dy / d
+            else:
+                stack.extend(node.children)
+
+        return ax, ay
+
+
+def barnes_hut_accels(xs: List[float], ys: List[float], ms: List[float], rs: List[float],
+                      G: float, theta: float):
+    """Acceleration (ax, ay) lists for every body, using one freshly built quadtree."""
+    tree = QuadTree(xs, ys, ms, rs)
+    ax_list = [0.0] * len(xs)
+    ay_list = [0.0] * len(xs)
+    for i in range(len(xs)):
+        ax_list[i], ay_list[i] = tree.accel(i, G, theta)
+    return ax_list, ay_list
@@ -0,0 +1,92 @@
+import statistics
+from collections import defaultdict
+from typing import Iterable, List, Sequence, Tuple
+
+# Broad phase = a cheap "who MIGHT be touching?" pass before the real collision test.
+# Checking every pair is n^2/2 tests, but in a big world almost nobody is near anybody.
+# A broad phase hands back only candidate pairs (i, j) with i < j (indices into the
+# xs/ys/rs lists). Physics then runs the exact circle test (the narrow phase) on those.
+#
+# All of them share one method:
+#   pairs(xs, ys, rs) -> iterable of (i, j)
+
+Pair = Tuple[int, int]
+
+
+class BruteForce:
+    """Every pair. Fine for a handful of bodies, and the reference for the others."""
+    def pairs(self, xs: Sequence[float], ys: Sequence[float], rs: Sequence[float]) -> Iterable[Pair]:
+        n = len(xs)
+        for i in range(n):
+            for j in range(i + 1, n):
+                yield i, j
+
+
+class SpatialHash:
+    """
+    Uniform grid stored in a dict: cell (cx, cy) -> body indices.
+    Each body goes into every cell its bounding box touches, so only bodies
+    sharing a cell become candidates.
+
+    cell_size: side of a cell in world units. None = 2 * median radius (a typical
+               body fits in about one cell; a big planet just covers a few).
+    """
+    def __init__(self, cell_size: float = None):
+        self.cell_size = cell_size
+
+    def pairs(self, xs, ys, rs) -> List[Pair]:
+        n = len(xs)
+        if n < 2:
+            return []
+        size = self.cell_size or 2 * max(statistics.median(rs), 1e-6)
+        inv = 1.0 / size
+
+        grid = defaultdict(list)
+        for i in range(n):
+            x, y, r = xs[i], ys[i], rs[i]
+            x0, x1 = int((x - r) * inv // 1), int((x + r) * inv // 1)
+            y0, y1 = int((y - r) * inv // 1), int((y + r) * inv // 1)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    grid[(cx, cy)].append(i)
+
+        found = set()
+        for cell in grid.values():
+            k = len(cell)
+            if k < 2:
+                continue
+            for a in range(k):
+                i = cell[a]
+                for b in range(a + 1, k):
+                    found.add((i, cell[b]))  # cells are filled in index order -> i < j
+        return sorted(found)
+
+
+class SweepAndPrune:
+    """
+    Sort bodies by their left edge (x - r), then sweep left to right keeping an
+    "active" list of bodies whose x-span is still open. Only bodies overlapping
+    on x (and on y, checked with a quick box test) become candidates.
+    """
+    def pairs(self, xs, ys, rs) -> List[Pair]:
+        order = sorted(range(len(xs)), key=lambda i: xs[i] - rs[i])
+        active = []
+        out = []
+        for i in order:
+            left = xs[i] - rs[i]
+            # drop everything that ends before this body starts
+            active = [j for j in active if xs[j] + rs[j] >= left]
+            y, r = ys[i], rs[i]
+            for j in active:
+                if abs(ys[j] - y) <= rs[j] + r:
+                    out.append((j, i) if j < i else (i, j))
+            active.append(i)
+        out.sort()  # same order as BruteForce -> same results
+        return out
+
+
+BROADPHASES = {
+    "brute_force": BruteForce,
+    "spatial_hash": SpatialHash,
+    "sweep_and_prune": SweepAndPrune,
+}
@@ -5,12 +5,22 @@ class Camera:
         self.mode = mode
         self.target = target
 
-    def update(self, dt):
+    def update(self, dt, positions=None):
+        # positions: optional o -> (x, y) lookup (e.g. FixedTimestep.lerp) so the
+        # camera follows where the target is DRAWN, not where it was last simulated
         if self.mode == "follow" and self.target is not None:
             # simple follow; later you can add smoothing
-            self.x = self.target.x
-            self.y = self.target.y
+            if positions is not None:
+                self.x, self.y = positions(self.target)
+            else:
+                self.x = self.target.x
+                self.y = self.target.y
         # else: free-fly or scripted camera leaves x,y as-is
 
     def world_to_screen(self, wx, wy):
         return (wx - self.x + self.screenW/2, wy - self.y + self.screenH/2)
+
+    def view_rect(self, margin=0):
+        """World-space (left, top, right, bottom) the screen currently shows."""
+        hw, hh = self.screenW / 2 + margin, self.screenH / 2 + margin
+        return (self.x - hw, self.y - hh, self.x + hw, self.y + hh)
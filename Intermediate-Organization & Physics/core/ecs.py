@@ -0,0 +1,136 @@
+# ECS = Entity Component System.
+#   entity    = just an id (int)
+#   component = plain data attached to an entity (PhysicsBody, Renderable, Controller...)
+#   system    = code that runs over every entity having some set of components
+#               (see core/systems.py)
+#
+# Instead of asking each object "do you have a mass? are you static?" every step,
+# each component type lives in its own SparseSet: a dense list of components plus
+# entity -> position lookup. "All bodies" is then just that dense list, and
+# "bodies that are not Static" is a query that walks the smaller set and checks
+# membership in the others.
+#
+#   reg = Registry()
+#   e = reg.create(PhysicsBody(0, 0), Renderable(circle((255, 0, 0))))
+#   reg.add(e, Static())
+#   for e, body, r in reg.query(PhysicsBody, Renderable, exclude=(Static,)):
+#       ...
+
+
+class SparseSet:
+    """Storage for one component type. Removal swaps the last entry into the hole."""
+    __slots__ = ("entities", "components", "index")
+
+    def __init__(self):
+        self.entities = []     # dense: entity ids
+        self.components = []   # dense: components, same order as entities
+        self.index = {}        # entity -> position in the dense lists
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, entity):
+        return entity in self.index
+
+    def add(self, entity, component) -> None:
+        i = self.index.get(entity)
+        if i is not None:
+            self.components[i] = component  # replace
+            return
+        self.index[entity] = len(self.entities)
+        self.entities.append(entity)
+        self.components.append(component)
+
+    def remove(self, entity) -> None:
+        i = self.index.pop(entity)
+        last = len(self.entities) - 1
+        if i != last:
+            moved = self.entities[last]
+            self.entities[i] = moved
+            self.components[i] = self.components[last]
+            self.index[moved] = i
+        self.entities.pop()
+        self.components.pop()
+
+    def get(self, entity, default=None):
+        i = self.index.get(entity)
+        return default if i is None else self.components[i]
+
+
+class Registry:
+    def __init__(self):
+        self.stores = {}      # component type -> SparseSet
+        self._alive = set()
+        self._next_id = 0
+        self.version = 0      # bumps on every add/remove, so systems know to re-cache
+
+    def __len__(self):
+        return len(self._alive)
+
+    # --- entities ---
+    def create(self, *components) -> int:
+        """New entity holding `components` (each stored under its own type)."""
+        entity = self._next_id
+        self._next_id += 1
+        self._alive.add(entity)
+        for c in components:
+            self.add(entity, c)
+        return entity
+
+    def destroy(self, entity) -> None:
+        for store in self.stores.values():
+            if entity in store.index:
+                store.remove(entity)
+        self._alive.discard(entity)
+        self.version += 1
+
+    # --- components ---
+    def store(self, ctype) -> SparseSet:
+        s = self.stores.get(ctype)
+        if s is None:
+            s = self.stores[ctype] = SparseSet()
+        return s
+
+    def add(self, entity, component, ctype=None) -> None:
+        """ctype: store under this type instead of type(component) (e.g. a Player as PhysicsBody)."""
+        if entity not in self._alive:
+            raise KeyError(f"no entity {entity}")
+        self.store(ctype or type(component)).add(entity, component)
+        self.version += 1
+
+    def remove(self, entity, ctype) -> None:
+        self.store(ctype).remove(entity)
+        self.version += 1
+
+    def get(self, entity, ctype, default=None):
+        return self.store(ctype).get(entity, default)
+
+    def has(self, entity, ctype) -> bool:
+        return entity in self.store(ctype).index
+
+    def components(self, ctype) -> list:
+        """Dense list of every component of this type (the live list: don't modify it)."""
+        return self.store(ctype).components
+
+    # --- queries ---
+    def query(self, *ctypes, exclude=()):
+        """
+        Yields (entity, component1, component2, ...) for every entity that has ALL
+        of ctypes and NONE of exclude. Don't add/remove components while iterating.
+        """
+        stores = [self.store(t) for t in ctypes]
+        driver = min(stores, key=len)  # walk the smallest set, look up the rest
+        indexes = [s.index for s in stores]
+        dense = [s.components for s in stores]
+        excluded = [self.store(t).index for t in exclude]
+        for e in driver.entities:
+            if any(e in ex for ex in excluded):
+                continue
+            row = [e]
+            for idx, comps in zip(indexes, dense):
+                i = idx.get(e)
+                if i is None:
+                    break
+                row.append(comps[i])
+            else:
+                yield tuple(row)
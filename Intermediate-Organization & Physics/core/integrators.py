@@ -0,0 +1,132 @@
+import math
+from typing import Callable, List, Sequence, Tuple
+
+# Integrator = how one physics step turns accelerations into new velocities/positions.
+# Gravity is a function of positions only, so an integrator may evaluate it as often
+# as it likes during a step; better ones spend more evaluations per step, but hold
+# orbits together at much bigger steps:
+#
+#   euler   semi-implicit Euler, v += a*dt, x += v*dt          1 evaluation / step
+#           (symplectic, so orbits don't spiral out, but they wobble/precess)
+#   verlet  velocity Verlet (= leapfrog, kick-drift-kick)      1 (the end-of-step one
+#           2nd order + symplectic: energy error stays bounded   is reused next step)
+#   rk4     classic Runge-Kutta, 4th order                     4 evaluations / step
+#           very accurate per step, but not symplectic: energy slowly drifts
+#
+# Adaptive(inner) wraps any of them with per-body substeps: bodies feeling a strong
+# pull (close encounters) take several small steps, everything else one big one.
+#
+# All of them share one method, working in place on plain lists:
+#   step(accel, xs, ys, vxs, vys, rs, moving, dt)
+#     accel(xs, ys, idx) -> (axs, ays): gravity on the bodies in idx at those positions
+#     moving: indices of the bodies to advance; the others stay exactly where they are
+
+Accel = Callable[[List[float], List[float], Sequence[int]], Tuple[List[float], List[float]]]
+
+
+class SemiImplicitEuler:
+    """What Physics has always done."""
+    def step(self, accel: Accel, xs, ys, vxs, vys, rs, moving, dt) -> None:
+        axs, ays = accel(xs, ys, moving)
+        for i in moving:
+            vxs[i] += axs[i] * dt
+            vys[i] += ays[i] * dt
+            xs[i] += vxs[i] * dt
+            ys[i] += vys[i] * dt
+
+
+class VelocityVerlet:
+    """Half kick, drift, half kick with the new positions' gravity."""
+    def step(self, accel: Accel, xs, ys, vxs, vys, rs, moving, dt) -> None:
+        h = 0.5 * dt
+        axs, ays = accel(xs, ys, moving)
+        for i in moving:
+            vxs[i] += axs[i] * h
+            vys[i] += ays[i] * h
+            xs[i] += vxs[i] * dt
+            ys[i] += vys[i] * dt
+        # Physics caches this evaluation: if nothing moves the bodies before the next
+        # step (no collision), its first accel() call is free
+        axs, ays = accel(xs, ys, moving)
+        for i in moving:
+            vxs[i] += axs[i] * h
+            vys[i] += ays[i] * h
+
+
+class RK4:
+    def step(self, accel: Accel, xs, ys, vxs, vys, rs, moving, dt) -> None:
+        x0, y0, vx0, vy0 = xs[:], ys[:], vxs[:], vys[:]
+        sx = [0.0] * len(xs)  # weighted sums of the 4 slopes
+        sy = [0.0] * len(xs)
+        svx = [0.0] * len(xs)
+        svy = [0.0] * len(xs)
+        px, py = xs[:], ys[:]  # probe positions (static bodies never change)
+        for weight, probe in ((1, 0.5), (2, 0.5), (2, 1.0), (1, None)):
+            axs, ays = accel(px, py, moving)
+            for i in moving:
+                kvx, kvy = vxs[i], vys[i]  # velocity at this probe
+                sx[i] += weight * kvx
+                sy[i] += weight * kvy
+                svx[i] += weight * axs[i]
+                svy[i] += weight * ays[i]
+                if probe is not None:
+                    px[i] = x0[i] + kvx * dt * probe
+                    py[i] = y0[i] + kvy * dt * probe
+                    vxs[i] = vx0[i] + axs[i] * dt * probe
+                    vys[i] = vy0[i] + ays[i] * dt * probe
+        k = dt / 6
+        for i in moving:
+            xs[i] = x0[i] + sx[i] * k
+            ys[i] = y0[i] + sy[i] * k
+            vxs[i] = vx0[i] + svx[i] * k
+            vys[i] = vy0[i] + svy[i] * k
+
+
+class Adaptive:
+    """
+    Per-body substepping: a body with speed v and acceleration a wants steps of about
+    eta * v / a, a fraction eta of the time it takes gravity to turn its velocity
+    around (for a circular orbit, eta radians of the orbit per step; a body at rest
+    uses eta * sqrt(radius / a) instead). Bodies are put in
+    power-of-two levels (1, 2, 4, ... substeps, at most max_substeps) and each level is
+    stepped with `inner`, coarse levels first; while a level steps, the others hold still.
+    That is exact for bodies around static planets; between two moving bodies on
+    different levels, the coupling is only first order.
+    """
+    def __init__(self, inner="verlet", eta: float = 0.05, max_substeps: int = 64):
+        self.inner = INTEGRATORS[inner]() if isinstance(inner, str) else inner
+        self.eta = eta
+        self.max_level = max(0, int(math.log2(max_substeps)))
+        self.substeps = 0  # body-substeps taken in the last step (how much refining went on)
+
+    def step(self, accel: Accel, xs, ys, vxs, vys, rs, moving, dt) -> None:
+        axs, ays = accel(xs, ys, moving)
+        levels = {}
+        for i in moving:
+            a = math.hypot(axs[i], ays[i])
+            level = 0
+            if a > 0:
+                v = math.hypot(vxs[i], vys[i])
+                time_scale = v / a if v > 0 else math.sqrt(max(rs[i], 1e-9) / a)
+                wanted = dt / (self.eta * time_scale)
+                if wanted > 1:
+                    level = min(self.max_level, math.ceil(math.log2(wanted)))
+            levels.setdefault(level, []).append(i)
+
+        self.substeps = 0
+        inner = self.inner
+        for level in sorted(levels):
+            idx = levels[level]
+            n = 1 << level
+            sub = dt / n
+            for _ in range(n):
+                inner.step(accel, xs, ys, vxs, vys, rs, idx, sub)
+            self.substeps += n * len(idx)
+
+
+INTEGRATORS = {
+    "euler": SemiImplicitEuler,
+    "verlet": VelocityVerlet,
+    "leapfrog": VelocityVerlet,
+    "rk4": RK4,
+}
@@ -1,5 +1,12 @@
 import math
-from typing import Iterable, Protocol
+from typing import Iterable, List, Protocol
+
+from core.barnes_hut import barnes_hut_accels
+from core.broadphase import BROADPHASES
+from core.ccd import swept_circle_toi
+from core.integrators import INTEGRATORS
+
+SOLVERS = ("pairwise", "barnes_hut")
 
 class IPhysicsBody(Protocol):
     x: float; y: float
@@ -10,103 +17,276 @@ class Physics:
     """
     Newtonian gravity + simple collision resolution (stick-to-surface).
     - Gravity: a = G * m / r^2 toward each other body
-    - Integration: semi-implicit Euler (v += a*dt, x += v*dt)
+               (exact pairwise, or Barnes-Hut approximation for big crowds)
+    - Integration: semi-implicit Euler (v += a*dt, x += v*dt) by default;
+                   velocity Verlet, RK4 and adaptive substeps in core/integrators.py
     - Collision: if overlapping, separate along the normal and
                  remove inward normal velocity (no bounce yet).
+                 Bodies that moved further than their radius this step are swept
+                 first (core/ccd.py), so fast movers can't tunnel through others.
     """
-    def __init__(self, G: float = 0.5):
+    def __init__(self, G: float = 0.5, solver: str = "pairwise", theta: float = 0.5,
+                 broadphase="brute_force", integrator="euler"):
+        """
+        solver: "pairwise"   -> exact O(n^2) gravity (every body vs every body)
+                "barnes_hut" -> quadtree approximation, O(n log n); theta trades
+                                accuracy (small) for speed (large). See core/barnes_hut.py
+        broadphase: which pairs get the overlap test. A name from core/broadphase.py
+                    ("brute_force", "spatial_hash", "sweep_and_prune") or any object
+                    with a pairs(xs, ys, rs) method.
+        integrator: a name from core/integrators.py ("euler", "verlet"/"leapfrog", "rk4")
+                    or an integrator object, e.g. Adaptive("verlet", eta=0.5).
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"unknown gravity solver {solver!r}, expected one of {SOLVERS}")
+        if isinstance(broadphase, str):
+            if broadphase not in BROADPHASES:
+                raise ValueError(f"unknown broadphase {broadphase!r}, expected one of {tuple(BROADPHASES)}")
+            broadphase = BROADPHASES[broadphase]()
+        if isinstance(integrator, str):
+            if integrator not in INTEGRATORS:
+                raise ValueError(f"unknown integrator {integrator!r}, expected one of {tuple(INTEGRATORS)}")
+            integrator = INTEGRATORS[integrator]()
         self.G = G
+        self.solver = solver
+        self.theta = theta
+        self.broadphase = broadphase
+        self.integrator = integrator
+        self.evaluations = 0     # gravity evaluations so far (cache hits don't count)
+        self._last_accel = None  # (idx, xs, ys, ms, rs, axs, ays) of the latest evaluation
 
-    def update(self, bodies: Iterable[IPhysicsBody], dt: float) -> None:
-        bodies = list(bodies)
+        # Collision counters from the last update (to see what the broad phase saves)
+        self.pairs_tested = 0
+        self.pairs_overlapping = 0
 
-        # 1) Accumulate gravitational acceleration for each body
+    def accelerations(self, bodies: List[IPhysicsBody]):
+        """Gravitational acceleration for each body -> (ax_list, ay_list)."""
         ax_list = [0.0] * len(bodies)
         ay_list = [0.0] * len(bodies)
 
-        for i, a in enumerate(bodies):
-            if not hasattr(a, "mass"):  # skip non-physical
-                continue
+        # Look up everything ONCE, so the hot loops only touch plain lists
+        idx = [i for i, b in enumerate(bodies) if hasattr(b, "mass")]  # skip non-physical
+        xs = [bodies[i].x for i in idx]
+        ys = [bodies[i].y for i in idx]
+        ms = [bodies[i].mass for i in idx]
+        rs = [getattr(bodies[i], "radius", 0) for i in idx]
+
+        axs, ays = self._solve(xs, ys, ms, rs)
+
+        for k, i in enumerate(idx):
+            ax_list[i] = axs[k]
+            ay_list[i] = ays[k]
+        return ax_list, ay_list
+
+    def _solve(self, xs, ys, ms, rs, idx=None):
+        """idx: only these bodies need their acceleration (the rest may come back 0)."""
+        if self.solver == "barnes_hut":
+            return barnes_hut_accels(xs, ys, ms, rs, self.G, self.theta)
+        return self._pairwise(xs, ys, ms, rs, idx)
+
+    def _accel(self, xs, ys, ms, rs, idx):
+        """_solve() for the integrators, remembering the latest result: the same query
+        twice in a row (Verlet's end-of-step -> next step's start) is computed once."""
+        last = self._last_accel
+        if last is not None and last[0] == idx and last[1] == xs and last[2] == ys \
+                and last[3] == ms and last[4] == rs:
+            return last[5], last[6]
+        axs, ays = self._solve(xs, ys, ms, rs, idx)
+        self.evaluations += 1
+        self._last_accel = (list(idx), xs[:], ys[:], ms, rs, axs, ays)
+        return axs, ays
+
+    def _pairwise(self, xs, ys, ms, rs, idx=None):
+        n = len(xs)
+        G = self.G
+        axs = [0.0] * n
+        ays = [0.0] * n
+        for i in range(n) if idx is None else idx:
+            x, y, r = xs[i], ys[i], rs[i]
             ax = ay = 0.0
-            for j, b in enumerate(bodies):
-                if i == j or not hasattr(b, "mass"):
+            for j in range(n):
+                if i == j:
                     continue
-                dx = b.x - a.x
-                dy = b.y - a.y
+                dx = xs[j] - x
+                dy = ys[j] - y
                 r2 = dx*dx + dy*dy
                 if r2 == 0:
                     continue
-                r = math.sqrt(r2)
+                dist = math.sqrt(r2)
                 # avoid extreme forces inside overlap
-                if r < getattr(a, "radius", 0) + getattr(b, "radius", 0):
+                if dist < r + rs[j]:
                     continue
-                a_mag = self.G * b.mass / r2
-                ax += a_mag * dx / r
-                ay += a_mag * dy / r
-            ax_list[i] = ax
-            ay_list[i] = ay
-
-        # 2) Integrate velocities & positions
-        for i, a in enumerate(bodies):
-            if getattr(a, "static", False):  # <-- don't move static bodies
-                continue
-            if hasattr(a, "vx"):
-                a.vx += ax_list[i] * dt
-                a.vy += ay_list[i] * dt
+                a_mag = G * ms[j] / r2
+                ax += a_mag * dx / dist
+                ay += a_mag * dy / dist
+            axs[i] = ax
+            ays[i] = ay
+        return axs, ays
+
+    def update(self, bodies: Iterable[IPhysicsBody], dt: float) -> None:
+        bodies = list(bodies)
+
+        # 1) Who pulls (has a mass) and who moves (has a velocity and isn't static)
+        pulling = [b for b in bodies if hasattr(b, "mass")]  # skip non-physical
+        moving = [k for k, b in enumerate(pulling)
+                  if hasattr(b, "vx") and not getattr(b, "static", False)]
+
+        # 2) Gravity + integration (the integrator evaluates gravity as often as it needs)
+        fast = self._integrate(pulling, moving, dt)
+        still = {id(b) for b in bodies} - {id(pulling[k]) for k in moving}
+        for a in bodies:  # massless movers just drift
+            if not hasattr(a, "mass") and hasattr(a, "vx") and not getattr(a, "static", False):
+                x0, y0 = a.x, a.y
                 a.x += a.vx * dt
                 a.y += a.vy * dt
+                still.discard(id(a))
+                r = getattr(a, "radius", None)
+                if r is not None and (a.x - x0) ** 2 + (a.y - y0) ** 2 > r * r:
+                    fast.append((a, x0, y0))
 
         # 3) Resolve overlaps (project apart + kill inward normal speed)
-        n = len(bodies)
-        for i in range(n):
+        solid = [b for b in bodies if hasattr(b, "radius")]
+        if fast:
+            self._sweep(fast, solid, dt, still)
+        self._resolve(solid)
+
+    def step(self, bodies: List[IPhysicsBody], dt: float, moving=None) -> None:
+        """
+        update() for callers that already know what everything is (e.g. the ECS
+        PhysicsSystem): every body has x/y/vx/vy/mass/radius, so no per-body
+        hasattr/getattr. moving: indices of the bodies to integrate (default: all;
+        the others are static but still pull and collide).
+        """
+        fast = self._integrate(bodies, range(len(bodies)) if moving is None else moving, dt)
+        if fast:
+            still = set() if moving is None else \
+                {id(b) for b in bodies} - {id(bodies[i]) for i in moving}
+            self._sweep(fast, bodies, dt, still)
+        self._resolve(bodies)
+
+    def _integrate(self, bodies, moving, dt) -> list:
+        """
+        Advance bodies[i] for i in moving by dt with self.integrator; everything in
+        bodies pulls. Returns the fast movers: (body, x before, y before) for bodies
+        that moved further than their radius (for _sweep).
+        """
+        xs = [b.x for b in bodies]
+        ys = [b.y for b in bodies]
+        ms = [b.mass for b in bodies]
+        rs = [getattr(b, "radius", 0) for b in bodies]
+        vxs = [getattr(b, "vx", 0.0) for b in bodies]
+        vys = [getattr(b, "vy", 0.0) for b in bodies]
+        moving = list(moving)
+
+        self.integrator.step(lambda px, py, idx: self._accel(px, py, ms, rs, idx),
+                             xs, ys, vxs, vys, rs, moving, dt)
+
+        fast = []
+        for i in moving:
             a = bodies[i]
-            if not hasattr(a, "radius"): continue
-            for j in range(i+1, n):
-                b = bodies[j]
-                if not hasattr(b, "radius"): continue
+            x0, y0 = a.x, a.y
+            a.x, a.y, a.vx, a.vy = xs[i], ys[i], vxs[i], vys[i]
+            r = getattr(a, "radius", None)
+            if r is not None and (a.x - x0) ** 2 + (a.y - y0) ** 2 > r * r:
+                fast.append((a, x0, y0))
+        return fast
 
-                dx = b.x - a.x
-                dy = b.y - a.y
-                r2 = dx*dx + dy*dy
-                if r2 == 0:
-                    # on top of each other; nudge
-                    dx, dy, r2 = 1e-6, 0.0, 1e-12
-                dist = math.sqrt(r2)
-                min_dist = a.radius + b.radius
-                if dist >= min_dist:
+    def _sweep(self, fast, solid, dt, still) -> None:
+        """
+        Continuous collision for fast movers: find the first body each one touched
+        during the step (swept circles, relative motion) and put it back at that
+        contact, a hair inside, so _resolve() applies the usual stick response.
+        still: ids of bodies that didn't move this step.
+        """
+        starts = {id(a): (x0, y0) for a, x0, y0 in fast}
+        for a, x0, y0 in fast:
+            dax, day = a.x - x0, a.y - y0
+            first = None
+            for b in solid:
+                if b is a:
                     continue
+                # where b started this step
+                if id(b) in still:
+                    bx0, by0 = b.x, b.y
+                elif id(b) in starts:
+                    bx0, by0 = starts[id(b)]
+                else:
+                    bx0, by0 = b.x - b.vx * dt, b.y - b.vy * dt
+                dbx, dby = b.x - bx0, b.y - by0
+                # a relative to b at the start of the step, and the relative motion
+                px, py = x0 - bx0, y0 - by0
+                dx, dy = dax - dbx, day - dby
+                t = swept_circle_toi(px, py, dx, dy, a.radius + b.radius)
+                if t is not None and (first is None or t < first[0]):
+                    first = (t, b, bx0 + dbx * t, by0 + dby * t, px + dx * t, py + dy * t)
+            if first is not None:
+                # both go back to where they were at the moment of contact
+                _, b, bx, by, cx, cy = first
+                if id(b) not in still:
+                    b.x, b.y = bx, by
+                a.x = bx + cx * (1 - 1e-6)
+                a.y = by + cy * (1 - 1e-6)
 
-                # Normalized collision normal from a -> b
-                nx = dx / dist
-                ny = dy / dist
-                overlap = min_dist - dist
-
-                # Distribute separation (heavier moves less)
-                ma = max(a.mass, 1e-6)
-                mb = max(b.mass, 1e-6)
-                total = ma + mb
-                # If one body is much heavier (e.g., a planet), move the lighter almost entirely
-                move_a = overlap * (mb / total)
-                move_b = overlap * (ma / total)
-
-                # Project out of overlap
-                a.x -= nx * move_a
-                a.y -= ny * move_a
-                b.x += nx * move_b
-                b.y += ny * move_b
-
-                # Remove inward normal component of velocity (stick/no-bounce)
-                # vn = v · n
-                vna = a.vx * nx + a.vy * ny
-                vnb = b.vx * nx + b.vy * ny
-
-                # Only kill if moving toward each other along the normal
-                rel_vn = vna - vnb
-                if rel_vn > 0:  # a moving away from b along n -> ok
-                    continue
+    def resolve_overlaps(self, bodies: List[IPhysicsBody]) -> None:
+        self._resolve([b for b in bodies if hasattr(b, "radius")])
+
+    def _resolve(self, solid: List[IPhysicsBody]) -> None:
+        xs = [b.x for b in solid]
+        ys = [b.y for b in solid]
+        rs = [b.radius for b in solid]
+
+        tested = overlapping = 0
+        for i, j in self.broadphase.pairs(xs, ys, rs):
+            tested += 1
+            a = solid[i]
+            b = solid[j]
+
+            dx = b.x - a.x
+            dy = b.y - a.y
+            r2 = dx*dx + dy*dy
+            if r2 == 0:
+                # on top of each other; nudge
+                dx, dy, r2 = 1e-6, 0.0, 1e-12
+            dist = math.sqrt(r2)
+            min_dist = a.radius + b.radius
+            if dist >= min_dist:
+                continue
+            overlapping += 1
+
+            # Normalized collision normal from a -> b
+            nx = dx / dist
+            ny = dy / dist
+            overlap = min_dist - dist
+
+            # Distribute separation (heavier moves less)
+            ma = max(a.mass, 1e-6)
+            mb = max(b.mass, 1e-6)
+            total = ma + mb
+            # If one body is much heavier (e.g., a planet), move the lighter almost entirely
+            move_a = overlap * (mb / total)
+            move_b = overlap * (ma / total)
+
+            # Project out of overlap
+            a.x -= nx * move_a
+            a.y -= ny * move_a
+            b.x += nx * move_b
+            b.y += ny * move_b
+
+            # Remove inward normal component of velocity (stick/no-bounce)
+            # vn = v · n
+            vna = a.vx * nx + a.vy * ny
+            vnb = b.vx * nx + b.vy * ny
+
+            # Only kill if moving toward each other along the normal
+            rel_vn = vna - vnb
+            if rel_vn < 0:  # n points a -> b, so a negative closing speed = separating -> ok
+                continue
+
+            # Zero normal component (perfectly inelastic along the normal)
+            a.vx -= vna * nx
+            a.vy -= vna * ny
+            b.vx -= vnb * nx
+            b.vy -= vnb * ny
 
-                # Zero normal component (perfectly inelastic along the normal)
-                a.vx -= vna * nx
-                a.vy -= vna * ny
-                b.vx -= vnb * nx
-                b.vy -= vnb * ny
+        self.pairs_tested = tested
+        self.pairs_overlapping = overlapping
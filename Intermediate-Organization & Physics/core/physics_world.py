@@ -0,0 +1,344 @@
+import numpy as np
+
+from core.snapshot import KIND_PHYSICS_WORLD, pack, unpack
+
+# PhysicsWorld = the same physics as core/physics.py, but "structure of arrays".
+# Instead of a list of objects each holding x, y, vx, ... we keep ONE array per field:
+#   x = [x0, x1, x2, ...]   y = [y0, y1, y2, ...]   ...
+# so gravity and integration become a handful of NumPy operations over all bodies
+# at once, instead of a Python loop with a property call per a.x.
+#
+# Game objects stay linked to their row: add(player) stores the BodyView in
+# player.body and switches player to a "linked" subclass of its own class whose
+# x/y/vx/vy/mass/radius read and write the row (what the old forwarders did).
+# So step() moves the player, and player.vx -= thrust pushes the row.
+# Objects not in a PhysicsWorld keep plain slot access; remove() copies the row
+# back into the object's slots and unlinks it.
+
+CHUNK = 1 << 20  # max (bodies x attractors) pairs computed at once (~8 MB per temp array)
+
+
+class BodyView:
+    """Handle to one row of a PhysicsWorld. Quacks like components.PhysicsBody."""
+    __slots__ = ("world", "index")
+
+    def __init__(self, world, index):
+        self.world = world
+        self.index = index
+
+    @property
+    def x(self): return self.world.x[self.index]
+    @x.setter
+    def x(self, v): self.world.x[self.index] = v
+
+    @property
+    def y(self): return self.world.y[self.index]
+    @y.setter
+    def y(self, v): self.world.y[self.index] = v
+
+    @property
+    def vx(self): return self.world.vx[self.index]
+    @vx.setter
+    def vx(self, v): self.world.vx[self.index] = v
+
+    @property
+    def vy(self): return self.world.vy[self.index]
+    @vy.setter
+    def vy(self, v): self.world.vy[self.index] = v
+
+    @property
+    def mass(self): return self.world.mass[self.index]
+    @mass.setter
+    def mass(self, v): self.world.mass[self.index] = v
+
+    @property
+    def radius(self): return self.world.radius[self.index]
+    @radius.setter
+    def radius(self, v): self.world.radius[self.index] = v
+
+
+def _row_field(name):
+    return property(lambda self: getattr(self.body, name),
+                    lambda self, v: setattr(self.body, name, v))
+
+
+_linked_classes = {}
+
+
+def _linked(cls):
+    """cls with its physics fields forwarded to self.body (same slots -> same layout)."""
+    linked = _linked_classes.get(cls)
+    if linked is None:
+        fields = {f: _row_field(f) for f in PhysicsWorld.FIELDS}
+        linked = type(cls.__name__, (cls,), {"__slots__": (), "_unlinked": cls, **fields})
+        _linked_classes[cls] = linked
+    return linked
+
+
+class PhysicsWorld:
+    """
+    Vectorized Newtonian gravity + semi-implicit Euler, same rules as Physics:
+    - Gravity: a = G * m / r^2 toward every attractor (pairs that overlap are skipped)
+    - Integration: v += a*dt, x += v*dt (static bodies don't move)
+    - Collision: overlapping bodies are pushed out of attractors and lose their
+                 inward normal speed (stick-to-surface). Rows that moved further
+                 than their radius are swept against the attractors first
+                 (core/ccd.py), so they can't tunnel through a planet.
+
+    min_attractor_mass: only bodies at least this heavy pull on others. The default
+    (0) is exact all-pairs gravity. For crowds of debris around a few planets, set it
+    above the debris mass: gravity drops from O(n^2) to O(n * planets), which is what
+    makes thousands of bodies per frame affordable.
+    """
+    FIELDS = ("x", "y", "vx", "vy", "mass", "radius")
+
+    def __init__(self, G: float = 0.5, capacity: int = 256, min_attractor_mass: float = 0.0):
+        self.G = G
+        self.min_attractor_mass = min_attractor_mass
+        self.count = 0
+        self.views = {}  # row -> its BodyView, only for rows someone asked for (view())
+        self.linked = {}  # view -> the game object linked to it by add()
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        old = {f: getattr(self, f, None) for f in self.FIELDS + ("static",)}
+        for f in self.FIELDS:
+            setattr(self, "_" + f, np.zeros(capacity, dtype=np.float64))
+        self._static = np.zeros(capacity, dtype=bool)
+        if old["x"] is not None:
+            for f, arr in old.items():
+                getattr(self, "_" + f)[:self.count] = arr
+        self._expose()
+
+    def _expose(self):
+        # Public arrays are views of the live rows only (no copies)
+        n = self.count
+        for f in self.FIELDS + ("static",):
+            setattr(self, f, getattr(self, "_" + f)[:n])
+
+    # --- bodies ---
+    def add_body(self, x, y, vx=0.0, vy=0.0, mass=1.0, radius=8.0, static=False) -> BodyView:
+        if self.count == len(self._x):
+            self._alloc(max(16, 2 * len(self._x)))
+        i = self.count
+        self._x[i], self._y[i] = x, y
+        self._vx[i], self._vy[i] = vx, vy
+        self._mass[i], self._radius[i] = mass, radius
+        self._static[i] = static
+        self.count += 1
+        self._expose()
+        return self.view(i)
+
+    def view(self, i: int) -> BodyView:
+        """The handle for row i (made on first request; one per row)."""
+        view = self.views.get(i)
+        if view is None:
+            if not 0 <= i < self.count:
+                raise IndexError(f"row {i} out of range (count={self.count})")
+            view = self.views[i] = BodyView(self, i)
+        return view
+
+    def add(self, obj) -> BodyView:
+        """
+        Copy a body into a new row. Objects with a `body` slot (Player, Planet) stay
+        linked to it: obj.body is the view and obj.x etc. read/write the row.
+        Plain PhysicsBody objects have no slot for it: they're copied, use the view.
+        """
+        view = self.add_body(obj.x, obj.y, obj.vx, obj.vy, obj.mass, obj.radius,
+                             static=getattr(obj, "static", False))
+        if hasattr(type(obj), "body"):
+            obj.body = view
+            obj.__class__ = _linked(type(obj))
+            self.linked[view] = obj
+        return view
+
+    def _unlink(self, view) -> None:
+        obj = self.linked.pop(view, None)
+        if obj is not None:
+            values = [float(getattr(view, f)) for f in self.FIELDS]
+            obj.__class__ = obj._unlinked
+            obj.x, obj.y, obj.vx, obj.vy, obj.mass, obj.radius = values
+            obj.body = None
+
+    def remove(self, view: BodyView) -> None:
+        """Swap-remove: the last row moves into the hole (its view is re-pointed)."""
+        self._unlink(view)
+        i, last = view.index, self.count - 1
+        del self.views[i]
+        if i != last:
+            for f in self.FIELDS + ("static",):
+                arr = getattr(self, "_" + f)
+                arr[i] = arr[last]
+            moved = self.views.pop(last, None)
+            if moved is not None:
+                moved.index = i
+                self.views[i] = moved
+        self.count -= 1
+        view.world = None
+        self._expose()
+
+    # --- snapshots (core/snapshot.py) ---
+    def snapshot(self) -> bytes:
+        """All rows as one compact blob: one memcpy per field."""
+        arrays = {f: getattr(self, f) for f in self.FIELDS + ("static",)}
+        return pack(KIND_PHYSICS_WORLD, arrays, self.count, self.G)
+
+    def restore(self, data) -> None:
+        """
+        Roll back to a snapshot() of this world: one memcpy per field. Views keep
+        pointing at their row; views of rows the snapshot doesn't have die. Rows
+        get no view until view(i) asks for one, so forking 100k bodies makes no
+        Python objects.
+        """
+        _, _, arrays = unpack(data, KIND_PHYSICS_WORLD)
+        n = len(arrays["x"])
+        if n > len(self._x):
+            self._alloc(n)
+        dead = [i for i in self.views if i >= n] if n < self.count else []
+        for view in map(self.views.pop, dead):
+            self._unlink(view)  # keeps the values it had before the rollback
+            view.world = None
+        for f, arr in arrays.items():
+            getattr(self, "_" + f)[:n] = arr
+        self.count = n
+        self._expose()
+
+    @classmethod
+    def from_snapshot(cls, data, min_attractor_mass: float = 0.0) -> "PhysicsWorld":
+        """Fork: a new, independent world holding a copy of the snapshot."""
+        _, G, arrays = unpack(data, KIND_PHYSICS_WORLD)
+        world = cls(G=G, capacity=max(16, len(arrays["x"])), min_attractor_mass=min_attractor_mass)
+        world.restore(data)
+        return world
+
+    # --- simulation ---
+    def accelerations(self):
+        """Gravitational acceleration for every row -> (ax, ay) arrays."""
+        n = self.count
+        ax = np.zeros(n)
+        ay = np.zeros(n)
+        attract = np.flatnonzero((self.mass > 0) & (self.mass >= self.min_attractor_mass))
+        if n == 0 or attract.size == 0:
+            return ax, ay
+
+        gx, gy = self.x[attract], self.y[attract]
+        gm, gr = self.G * self.mass[attract], self.radius[attract]
+
+        # Rows are processed in chunks so the (rows x attractors) temporaries stay small
+        step = max(1, CHUNK // attract.size)
+        for s in range(0, n, step):
+            e = min(n, s + step)
+            dx = gx[None, :] - self.x[s:e, None]
+            dy = gy[None, :] - self.y[s:e, None]
+            r2 = dx*dx + dy*dy
+            dist = np.sqrt(r2)
+            # Skip self (r2 == 0) and overlapping pairs, same as the pairwise solver
+            ok = (r2 > 0) & (dist >= self.radius[s:e, None] + gr[None, :])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                k = np.where(ok, gm[None, :] / (r2 * dist), 0.0)
+            ax[s:e] = (k * dx).sum(axis=1)
+            ay[s:e] = (k * dy).sum(axis=1)
+        return ax, ay
+
+    def step(self, dt: float) -> None:
+        if self.count == 0:
+            return
+
+        # 1) Gravity
+        ax, ay = self.accelerations()
+
+        # 2) Integrate (static rows get a zero multiplier)
+        moving = ~self.static
+        x0, y0 = self.x.copy(), self.y.copy()
+        self.vx += ax * dt * moving
+        self.vy += ay * dt * moving
+        self.x += self.vx * dt * moving
+        self.y += self.vy * dt * moving
+
+        # 3) Sweep fast movers, then resolve overlaps against attractors
+        moved2 = (self.x - x0) ** 2 + (self.y - y0) ** 2
+        fast = np.flatnonzero(moved2 > self.radius * self.radius)
+        if fast.size:
+            self._sweep(fast, x0, y0)
+        self._resolve_overlaps()
+
+    def _sweep(self, fast, x0, y0):
+        """
+        Physics._sweep for rows: put each fast row back at its first contact with an
+        attractor during the step (a hair inside, so _resolve_overlaps applies the
+        usual stick response). Same time-of-impact math as core/ccd.py's
+        swept_circle_toi, done for all (fast row x attractor) pairs at once.
+        """
+        attract = np.flatnonzero((self.mass > 0) & (self.mass >= self.min_attractor_mass))
+        if attract.size == 0:
+            return
+        x, y, r = self.x, self.y, self.radius
+        dbx, dby = x[attract] - x0[attract], y[attract] - y0[attract]
+        step = max(1, CHUNK // attract.size)
+        for s in range(0, fast.size, step):
+            rows = fast[s:s + step]
+            # a relative to b at the start of the step, and the relative motion
+            px = x0[rows, None] - x0[None, attract]
+            py = y0[rows, None] - y0[None, attract]
+            dx = (x[rows] - x0[rows])[:, None] - dbx[None, :]
+            dy = (y[rows] - y0[rows])[:, None] - dby[None, :]
+            rr = r[rows, None] + r[None, attract]
+            c = px * px + py * py - rr * rr
+            a = dx * dx + dy * dy
+            b = 2 * (px * dx + py * dy)
+            disc = b * b - 4 * a * c
+            approaching = (a != 0) & (b < 0) & (rows[:, None] != attract[None, :])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = np.where(c <= 0, 0.0, (-b - np.sqrt(np.maximum(disc, 0))) / (2 * a))
+            hit = approaching & ((c <= 0) | ((disc >= 0) & (t <= 1)))
+            t = np.where(hit, t, np.inf)
+            first = t.argmin(axis=1)
+            for k in np.flatnonzero(np.isfinite(t[np.arange(rows.size), first])).tolist():
+                i, col = int(rows[k]), int(first[k])
+                j, tk = int(attract[col]), t[k, col]
+                bx, by = x0[j] + dbx[col] * tk, y0[j] + dby[col] * tk
+                if not self.static[j]:
+                    x[j], y[j] = bx, by
+                x[i] = bx + (px[k, col] + dx[k, col] * tk) * (1 - 1e-6)
+                y[i] = by + (py[k, col] + dy[k, col] * tk) * (1 - 1e-6)
+
+    def _resolve_overlaps(self):
+        attract = np.flatnonzero((self.mass > 0) & (self.mass >= self.min_attractor_mass))
+        done = np.zeros(self.count, dtype=bool)  # each pair is resolved only once
+        for j in attract:
+            done[j] = True
+            dx = self.x - self.x[j]          # from attractor j -> every body
+            dy = self.y - self.y[j]
+            dist = np.sqrt(dx*dx + dy*dy)
+            min_dist = self.radius + self.radius[j]
+            hit = (dist < min_dist) & ~done
+            if not hit.any():
+                continue
+            rows = np.flatnonzero(hit)
+            d = np.maximum(dist[rows], 1e-6)
+            nx = np.where(dist[rows] > 0, dx[rows] / d, 1.0)
+            ny = np.where(dist[rows] > 0, dy[rows] / d, 0.0)
+            overlap = min_dist[rows] - dist[rows]
+
+            # Distribute separation (heavier moves less)
+            ma = max(self.mass[j], 1e-6)
+            mb = np.maximum(self.mass[rows], 1e-6)
+            total = ma + mb
+            move_b = overlap * (ma / total)
+            move_a = overlap * (mb / total)
+            self.x[rows] += nx * move_b
+            self.y[rows] += ny * move_b
+            self.x[j] -= (nx * move_a).sum()
+            self.y[j] -= (ny * move_a).sum()
+
+            # Kill the normal velocity of pairs that are moving toward each other
+            # (n points j -> row, so j gaining on row along n = closing; same as Physics)
+            vna = self.vx[j] * nx + self.vy[j] * ny
+            vnb = self.vx[rows] * nx + self.vy[rows] * ny
+            closing = (vna - vnb) > 0
+            vnb = np.where(closing, vnb, 0.0)
+            vna = np.where(closing, vna, 0.0)
+            self.vx[rows] -= vnb * nx
+            self.vy[rows] -= vnb * ny
+            self.vx[j] -= (vna * nx).sum()
+            self.vy[j] -= (vna * ny).sum()
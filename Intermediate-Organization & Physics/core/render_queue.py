@@ -0,0 +1,113 @@
+from bisect import bisect_right, insort
+
+# RenderQueue = the drawing order, kept sorted all the time instead of re-sorted every frame.
+#   - objects live in layers (o.layer, default 0); lower layers are drawn first
+#   - inside a layer: lower o.z first, then bigger radius first (planets under small stuff)
+# Adding an object inserts it in the right spot (binary search). If an object's layer
+# or z changes, call World.set_z / RenderSystem.set_z so it's moved once, right then.
+
+
+def z_key(o):
+    return (getattr(o, "z", 0), -getattr(o, "radius", 0))
+
+
+class RenderQueue:
+    def __init__(self):
+        self.order = []    # layer ids, ascending
+        self.layers = {}   # layer -> objects in draw order
+        self._keys = {}    # layer -> z_key of each object (parallel list, for bisect)
+        self._rank = {}    # object -> (layer position, index) ; rebuilt only after changes
+        self._dirty = False
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, o) -> None:
+        layer = getattr(o, "layer", 0)
+        if layer not in self.layers:
+            insort(self.order, layer)
+            self.layers[layer] = []
+            self._keys[layer] = []
+        k = z_key(o)
+        keys = self._keys[layer]
+        i = bisect_right(keys, k)  # after equal keys -> keeps insertion order stable
+        keys.insert(i, k)
+        self.layers[layer].insert(i, o)
+        self.count += 1
+        self._dirty = True
+
+    def extend(self, objs) -> None:
+        """add() for many objects at once: one sort per layer instead of n list inserts."""
+        new = {}
+        for o in objs:
+            new.setdefault(getattr(o, "layer", 0), []).append(o)
+        for layer, added in new.items():
+            if layer not in self.layers:
+                insort(self.order, layer)
+                self.layers[layer] = []
+                self._keys[layer] = []
+            # existing objects first, and a stable sort -> same order as add() one by one
+            pairs = list(zip(self._keys[layer], self.layers[layer]))
+            pairs.extend((z_key(o), o) for o in added)
+            pairs.sort(key=lambda p: p[0])
+            self._keys[layer] = [k for k, _ in pairs]
+            self.layers[layer] = [o for _, o in pairs]
+            self.count += len(added)
+        if new:
+            self._dirty = True
+
+    def remove(self, o) -> None:
+        layer = getattr(o, "layer", 0)
+        objs = self.layers[layer]
+        i = objs.index(o)
+        del objs[i]
+        del self._keys[layer][i]
+        self.count -= 1
+        self._dirty = True
+
+    def update(self, o, z=None, layer=None) -> None:
+        """Change o's z and/or layer and move it to its new place in the queue."""
+        self.remove(o)
+        if z is not None:
+            o.z = z
+        if layer is not None:
+            o.layer = layer
+        self.add(o)
+
+    def _ranks(self):
+        if self._dirty:
+            rank = {}
+            for li, layer in enumerate(self.order):
+                for i, o in enumerate(self.layers[layer]):
+                    rank[o] = (li, i)
+            self._rank = rank
+            self._dirty = False
+        return self._rank
+
+    def draw_lists(self, visible=None):
+        """
+        Yields (layer, objects) in draw order, only the objects in `visible` if given.
+        Few visible -> sort just those by their stored rank.
+        Most visible -> walk the queue (already in order) and skip the hidden ones.
+        """
+        if visible is None:
+            for layer in self.order:
+                yield layer, self.layers[layer]
+            return
+
+        if len(visible) * 8 < self.count:
+            rank = self._ranks()
+            batch, current = [], None
+            for o in sorted(visible, key=rank.__getitem__):
+                layer = self.order[rank[o][0]]
+                if layer != current and batch:
+                    yield current, batch
+                    batch = []
+                current = layer
+                batch.append(o)
+            if batch:
+                yield current, batch
+        else:
+            for layer in self.order:
+                yield layer, [o for o in self.layers[layer] if o in visible]
@@ -0,0 +1,99 @@
+import pygame
+
+# Renderer = sits between the game's draw calls and the display.
+#   - blit() calls are collected and sent in ONE Surface.blits() batch
+#   - mode "flip":  repaint the background, draw, pygame.display.flip() (whole window)
+#   - mode "dirty": only erase what was drawn last frame, draw, and push just the
+#                   changed rectangles with pygame.display.update(rects)
+# In a game with a mostly static background, "dirty" sends a tiny fraction of the pixels.
+#
+# A Renderer has blit()/blits() like a Surface, so anything that draws with
+# surf.blit(...) can be handed a Renderer instead of the screen.
+#
+# Per frame:
+#   renderer.begin()        erase last frame (or repaint everything)
+#   ... direct draws on renderer.screen (call mark(rect) for what they touch) ...
+#   ... renderer.blit(...)  batched, always ends up ON TOP of direct draws ...
+#   renderer.present()
+#
+# Also copied into the other game; keep the copies in sync (benchmarks/check_copies.py).
+
+MODES = ("flip", "dirty")
+
+
+class Renderer:
+    def __init__(self, screen: pygame.Surface, mode: str = "flip", background=(0, 0, 0)):
+        """background: a color, or a Surface the size of the screen (static backdrop)."""
+        if mode not in MODES:
+            raise ValueError(f"unknown render mode {mode!r}, expected one of {MODES}")
+        self.screen = screen
+        self.mode = mode
+        self.background = background
+        self.batch = []        # (surface, dest[, area]) waiting for blits()
+        self.dirty = []        # rects changed this frame
+        self._drawn = []       # rects drawn through the batch this frame
+        self._last = []        # rects drawn last frame -> erased by the next begin()
+        self._blits = 0
+        self._full = True      # next frame repaints and flips everything
+
+        # Metrics for the last presented frame
+        self.pixels = 0        # pixels pushed to the display
+        self.blit_count = 0    # surfaces drawn through the batch
+
+    def invalidate(self) -> None:
+        """Repaint and flip the whole screen next frame (state change, window exposed...)."""
+        self._full = True
+
+    def _paint(self, rect=None) -> None:
+        bg = self.background
+        if isinstance(bg, pygame.Surface):
+            if rect is None:
+                self.screen.blit(bg, (0, 0))
+            else:
+                self.screen.blit(bg, rect, rect)
+        else:
+            self.screen.fill(bg, rect)
+
+    def begin(self) -> None:
+        if self.mode == "flip" or self._full:
+            self._paint()
+        else:
+            for r in self._last:
+                self._paint(r)
+            self.dirty.extend(self._last)
+
+    # --- Surface-like drawing ---
+    def blit(self, source, dest, area=None) -> None:
+        self.batch.append((source, dest) if area is None else (source, dest, area))
+
+    def blits(self, blit_sequence, doreturn=False) -> None:
+        self.batch.extend(blit_sequence)
+
+    def mark(self, rect) -> None:
+        """Tell the renderer a direct draw changed this rect."""
+        self.dirty.append(pygame.Rect(rect))
+
+    def flush(self) -> None:
+        """Draw the pending batch now (e.g. before direct draws that must go on top)."""
+        if self.batch:
+            drawn = self.screen.blits(self.batch)
+            self._blits += len(self.batch)
+            self.dirty.extend(drawn)
+            self._drawn.extend(drawn)
+            self.batch.clear()
+
+    def present(self) -> None:
+        self.flush()
+        if self.mode == "flip" or self._full:
+            pygame.display.flip()
+            self.pixels = self.screen.get_width() * self.screen.get_height()
+            self._full = False
+        else:
+            bounds = self.screen.get_rect()
+            rects = [r.clip(bounds) for r in self.dirty]
+            pygame.display.update(rects)
+            self.pixels = sum(r.w * r.h for r in rects)
+        self._last = self._drawn
+        self._drawn = []
+        self.dirty = []
+        self.blit_count, self._blits = self._blits, 0
@@ -0,0 +1,81 @@
+import struct
+from operator import attrgetter
+
+import numpy as np
+
+from components.physics_body import PhysicsBody
+
+# Snapshots = the physics state of many bodies as one compact, versioned bytes blob.
+# Good for quick-save (write the bytes to a file), rollback (restore into the same
+# bodies) and forking a copy of the simulation for lookahead.
+#
+#   header   magic "SNAP", version, kind, body count, G
+#   arrays   x[count], y[count], vx, vy, mass, radius (float64), static[count] (uint8)
+#
+# One array per field ("structure of arrays", like core/physics_world.py), so a
+# PhysicsWorld is saved with one memcpy per field, and unpack() hands back NumPy views
+# straight into the blob (no copy until they're written somewhere).
+# Only physics state is saved: appearances, controllers etc. stay with the objects.
+
+MAGIC = b"SNAP"
+VERSION = 1
+KIND_BODIES = 1         # a list of body objects (snapshot_bodies)
+KIND_PHYSICS_WORLD = 2  # PhysicsWorld.snapshot()
+HEADER = struct.Struct("<4sHHQd")  # magic, version, kind, count, G (0 if not known)
+FIELDS = ("x", "y", "vx", "vy", "mass", "radius")
+
+
+def pack(kind: int, arrays: dict, count: int, G: float = 0.0) -> bytes:
+    """arrays: FIELDS (float64) + "static" (bool), each at least `count` long."""
+    parts = [HEADER.pack(MAGIC, VERSION, kind, count, G)]
+    for f in FIELDS:
+        parts.append(np.ascontiguousarray(arrays[f][:count], dtype="<f8").data)
+    parts.append(np.ascontiguousarray(arrays["static"][:count], dtype=np.uint8).data)
+    return b"".join(parts)
+
+
+def unpack(data, kind: int = None):
+    """-> (kind, G, {field: array}). The arrays are read-only views into data."""
+    magic, version, k, count, G = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a snapshot")
+    if version != VERSION:
+        raise ValueError(f"snapshot version {version}, expected {VERSION}")
+    if kind is not None and k != kind:
+        raise ValueError(f"snapshot of kind {k}, expected {kind}")
+    arrays = {}
+    offset = HEADER.size
+    for f in FIELDS:
+        arrays[f] = np.frombuffer(data, dtype="<f8", count=count, offset=offset)
+        offset += 8 * count
+    arrays["static"] = np.frombuffer(data, dtype=np.uint8, count=count, offset=offset).view(bool)
+    return k, G, arrays
+
+
+_get_fields = attrgetter(*FIELDS)
+
+
+def snapshot_bodies(bodies) -> bytes:
+    """Physics state of a list of bodies (PhysicsBody, Player, Planet...), in list order."""
+    n = len(bodies)
+    rows = np.fromiter((v for b in bodies for v in _get_fields(b)), dtype=np.float64, count=6 * n)
+    rows = rows.reshape(n, 6)
+    arrays = {f: rows[:, i] for i, f in enumerate(FIELDS)}
+    arrays["static"] = np.fromiter((getattr(b, "static", False) for b in bodies), dtype=bool, count=n)
+    return pack(KIND_BODIES, arrays, n)
+
+
+def restore_bodies(bodies, data) -> None:
+    """Rollback: write a snapshot_bodies() blob back into the same bodies (same order)."""
+    _, _, a = unpack(data, KIND_BODIES)
+    if len(a["x"]) != len(bodies):
+        raise ValueError(f"snapshot has {len(a['x'])} bodies, got {len(bodies)}")
+    columns = zip(*(a[f].tolist() for f in FIELDS))
+    for b, (x, y, vx, vy, mass, radius) in zip(bodies, columns):
+        b.x, b.y, b.vx, b.vy, b.mass, b.radius = x, y, vx, vy, mass, radius
+
+
+def load_bodies(data) -> list:
+    """Fork: new PhysicsBody objects from a snapshot (static flags are dropped; see Static)."""
+    _, _, a = unpack(data)
+    return [PhysicsBody(*row) for row in zip(*(a[f].tolist() for f in FIELDS))]
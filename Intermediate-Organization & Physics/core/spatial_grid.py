@@ -0,0 +1,63 @@
+from collections import defaultdict
+
+# SpatialGrid = "which objects are in this part of the world?" without looking at all of them.
+# The world is cut into square cells; each cell remembers the objects touching it.
+# A rectangle query (like the camera's view) then only visits the cells it covers.
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: float = 256):
+        self.cell_size = cell_size
+        self.cells = defaultdict(set)  # (cx, cy) -> objects touching that cell
+        self.spans = {}                # object -> (cx0, cy0, cx1, cy1) cells it's in now
+
+    def _span(self, o):
+        r = getattr(o, "radius", 0)
+        s = self.cell_size
+        return (int((o.x - r) // s), int((o.y - r) // s),
+                int((o.x + r) // s), int((o.y + r) // s))
+
+    def insert(self, o) -> None:
+        span = self._span(o)
+        self.spans[o] = span
+        self._fill(o, span, add=True)
+
+    def remove(self, o) -> None:
+        span = self.spans.pop(o, None)
+        if span is not None:
+            self._fill(o, span, add=False)
+
+    def move(self, o) -> None:
+        """Call after o moved. Cheap when it's still in the same cell(s)."""
+        span = self._span(o)
+        old = self.spans.get(o)
+        if span == old:
+            return
+        if old is not None:
+            self._fill(o, old, add=False)
+        self.spans[o] = span
+        self._fill(o, span, add=True)
+
+    def _fill(self, o, span, add):
+        cx0, cy0, cx1, cy1 = span
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                if add:
+                    self.cells[(cx, cy)].add(o)
+                else:
+                    cell = self.cells[(cx, cy)]
+                    cell.discard(o)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+    def query(self, left, top, right, bottom) -> set:
+        """Objects whose cells overlap the rectangle (may include a few just outside it)."""
+        s = self.cell_size
+        found = set()
+        cells = self.cells
+        for cx in range(int(left // s), int(right // s) + 1):
+            for cy in range(int(top // s), int(bottom // s) + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found |= cell
+        return found
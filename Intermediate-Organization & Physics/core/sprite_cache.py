@@ -0,0 +1,114 @@
+from collections import OrderedDict
+
+import pygame
+
+# SpriteCache = draw each distinct shape ONCE into its own little Surface, then just
+# blit that Surface every frame. Blitting a ready-made image is much cheaper than
+# asking pygame.draw to rasterize a circle / rounded rect / polygon from scratch.
+#
+# Shapes are identified by everything that changes their pixels
+# (type, color, size, border_radius, points). The least recently used entries are
+# thrown away once there are more than max_entries of them.
+#
+# Solid colors use a colorkey (one "see-through" color) + RLE, which blits faster than
+# per-pixel alpha for flat shapes. Colors with alpha (r, g, b, a<255) get convert_alpha.
+#
+# Also copied into the other game; keep the copies in sync (benchmarks/check_copies.py).
+
+
+def _canvas(color, w, h):
+    """Blank surface to draw one shape on. Returns (surface, colorkey or None)."""
+    if len(color) == 4 and color[3] < 255:
+        return pygame.Surface((w, h), pygame.SRCALPHA), None
+    key = (255, 0, 255) if tuple(color[:3]) != (255, 0, 255) else (0, 255, 0)
+    surf = pygame.Surface((w, h))
+    surf.fill(key)
+    return surf, key
+
+
+def _finish(surf, key):
+    # Convert to the screen's pixel format -> fastest blits.
+    # Needs a display; headless runs (no set_mode yet) keep the plain surface.
+    if key is not None:
+        surf.set_colorkey(key, pygame.RLEACCEL)
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert() if key is not None else surf.convert_alpha()
+
+
+class SpriteCache:
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._items = OrderedDict()  # key -> (surface, offset_x, offset_y)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def _get(self, key, build):
+        items = self._items
+        entry = items.get(key)
+        if entry is not None:
+            items.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = build()
+        items[key] = entry
+        if len(items) > self.max_entries:
+            items.popitem(last=False)  # evict least recently used
+        return entry
+
+    # --- shapes ---
+    # Each returns (surface, ox, oy): blit at (x + ox, y + oy) where (x, y) is the
+    # shape's anchor (center for circles/polygons/sprites, top-left for rects).
+    def circle(self, color, radius: int):
+        def build():
+            surf, key = _canvas(color, 2 * radius, 2 * radius)
+            pygame.draw.circle(surf, color, (radius, radius), radius)
+            return _finish(surf, key), -radius, -radius
+        return self._get(("circle", tuple(color), radius), build)
+
+    def rect(self, color, w: int, h: int, border_radius: int = 0):
+        def build():
+            surf, key = _canvas(color, w, h)
+            pygame.draw.rect(surf, color, (0, 0, w, h), border_radius=border_radius)
+            return _finish(surf, key), 0, 0
+        return self._get(("rect", tuple(color), w, h, border_radius), build)
+
+    def polygon(self, color, points):
+        points = tuple((int(px), int(py)) for px, py in points)  # relative to the center
+
+        def build():
+            min_x = min(p[0] for p in points)
+            min_y = min(p[1] for p in points)
+            w = max(p[0] for p in points) - min_x + 1
+            h = max(p[1] for p in points) - min_y + 1
+            surf, key = _canvas(color, w, h)
+            pygame.draw.polygon(surf, color, [(px - min_x, py - min_y) for px, py in points])
+            return _finish(surf, key), min_x, min_y
+        return self._get(("polygon", tuple(color), points), build)
+
+    def sprite(self, surface):
+        # Already an image: just remember its centering offset (no get_rect per draw)
+        def build():
+            w, h = surface.get_size()
+            return surface, -(w // 2), -(h // 2)
+        return self._get(("sprite", id(surface)), build)
+
+    def appearance(self, app, radius=8):
+        """Cached (surface, ox, oy) for an appearance dict, or None if it can't be cached."""
+        kind = app.get("type")
+        color = app.get("color", (255, 255, 255))
+        if kind == "circle":
+            return self.circle(color, int(radius))
+        if kind == "rect":
+            w, h = app["size"]
+            surf, _, _ = self.rect(color, w, h, app.get("border_radius", 0))
+            return surf, -(w // 2), -(h // 2)  # world objects are anchored at their center
+        if kind == "polygon":
+            return self.polygon(color, app["points"])
+        if kind == "sprite" and app.get("surface"):
+            return self.sprite(app["surface"])
+        return None
@@ -0,0 +1,189 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from time import perf_counter
+from typing import List, Tuple
+
+import numpy as np
+
+from components.physics_body import PhysicsBody
+from core.physics import Physics
+
+# Batch runner for parameter sweeps: the same Physics as the game, many scenes, no window.
+#
+#   configs = [RunConfig(bodies=orbit(G), G=G, dt=1.0, steps=3000) for G in ...]
+#   with run_sweep(configs, record_every=10) as result:
+#       result.energy[:, 1] / result.energy[:, 0]     # drift per run
+#       result.trajectory[run, frame, body]           # (x, y) every 10th step
+#
+# Runs are spread over a ProcessPoolExecutor (one process per core by default).
+# Results don't come back as pickled bodies: the parent allocates the output arrays
+# in shared memory, each worker attaches to them once and writes its run's rows
+# straight in, and only the run index travels back.
+
+Body = Tuple[float, float, float, float, float, float, bool]  # x, y, vx, vy, mass, radius, static
+
+
+@dataclass
+class RunConfig:
+    bodies: List[Body]
+    G: float = 1.0
+    dt: float = 1.0
+    steps: int = 600
+    physics: dict = field(default_factory=dict)  # extra Physics(...) arguments (solver, theta...)
+
+
+# name -> (shape, dtype) of every output array; runs/frames/n are filled in by run_sweep
+def _layout(runs, frames, n):
+    return {
+        "final": ((runs, n, 4), np.float64),       # x, y, vx, vy after the last step
+        "r_min": ((runs, n), np.float64),          # closest / furthest distance from body 0
+        "r_max": ((runs, n), np.float64),          #   (the planet) over the run
+        "energy": ((runs, 2), np.float64),         # total energy at the start and at the end
+        "seconds": ((runs,), np.float64),          # wall time of the run
+        "trajectory": ((runs, frames, n, 2), np.float64),
+    }
+
+
+class SweepResult:
+    """The output arrays (NumPy views on shared memory). close() frees them; or use `with`."""
+    def __init__(self, runs, frames, n):
+        self._shm = []
+        for name, (shape, dtype) in _layout(runs, frames, n).items():
+            size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            self._shm.append(shm)
+            arr = np.ndarray(shape, dtype, buffer=shm.buf)
+            arr.fill(np.nan)
+            setattr(self, name, arr)
+        self.names = [s.name for s in self._shm]
+        self.shape = (runs, frames, n)
+
+    def close(self) -> None:
+        for name in _layout(0, 0, 0):
+            setattr(self, name, None)  # drop the views before the buffers go away
+        for shm in self._shm:
+            shm.close()
+            shm.unlink()
+        self._shm = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --- worker side ---
+_out = None  # name -> array, attached once per worker process
+
+
+def _attach(names, shape):
+    global _out
+    runs, frames, n = shape
+    _out = {"_shm": []}
+    for shm_name, (name, (arr_shape, dtype)) in zip(names, _layout(runs, frames, n).items()):
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _out["_shm"].append(shm)
+        _out[name] = np.ndarray(arr_shape, dtype, buffer=shm.buf)
+
+
+def _detach():
+    global _out
+    if _out is not None:
+        for shm in _out["_shm"]:
+            shm.close()
+    _out = None
+
+
+def total_energy(bodies, G) -> float:
+    """Kinetic + gravitational potential energy (same softening-free rule as Physics)."""
+    e = 0.0
+    for i, a in enumerate(bodies):
+        e += 0.5 * a.mass * (a.vx * a.vx + a.vy * a.vy)
+        for b in bodies[i + 1:]:
+            r = math.hypot(b.x - a.x, b.y - a.y)
+            if r > 0:
+                e -= G * a.mass * b.mass / r
+    return e
+
+
+def _run(job) -> int:
+    run, config, record_every = job
+    bodies = [PhysicsBody(x, y, vx, vy, mass, radius) for x, y, vx, vy, mass, radius, _ in config.bodies]
+    moving = [i for i, b in enumerate(config.bodies) if not b[6]]
+    physics = Physics(G=config.G, **config.physics)
+    n = len(bodies)
+    r_min = np.full(n, np.inf)
+    r_max = np.zeros(n)
+    trajectory = _out["trajectory"][run]
+    frame = 0
+
+    t = perf_counter()
+    e0 = total_energy(bodies, config.G)
+    for s in range(config.steps):
+        physics.step(bodies, config.dt, moving)
+        cx, cy = bodies[0].x, bodies[0].y
+        for i, b in enumerate(bodies):
+            r = math.hypot(b.x - cx, b.y - cy)
+            if r < r_min[i]:
+                r_min[i] = r
+            if r > r_max[i]:
+                r_max[i] = r
+        if record_every and s % record_every == 0 and frame < trajectory.shape[0]:
+            trajectory[frame, :n] = [(b.x, b.y) for b in bodies]
+            frame += 1
+
+    _out["final"][run, :n] = [(b.x, b.y, b.vx, b.vy) for b in bodies]
+    _out["r_min"][run, :n] = r_min
+    _out["r_max"][run, :n] = r_max
+    _out["energy"][run] = (e0, total_energy(bodies, config.G))
+    _out["seconds"][run] = perf_counter() - t
+    return run
+
+
+def run_sweep(configs: List[RunConfig], workers: int = None, record_every: int = 0,
+              chunksize: int = None) -> SweepResult:
+    """
+    Run every config to completion and return a SweepResult (row i = configs[i]).
+    Runs with fewer bodies than the biggest one leave the rest of their row NaN.
+    record_every: also store (x, y) of every body every that many steps (0 = don't).
+    workers: processes (default: all cores); 0 runs in this process (debugging/profiling).
+    """
+    runs = len(configs)
+    n = max((len(c.bodies) for c in configs), default=0)
+    frames = max((math.ceil(c.steps / record_every) for c in configs), default=0) if record_every else 0
+    result = SweepResult(runs, frames, n)
+    jobs = [(i, c, record_every) for i, c in enumerate(configs)]
+    try:
+        if workers == 0:
+            _attach(result.names, result.shape)
+            try:
+                for job in jobs:
+                    _run(job)
+            finally:
+                _detach()
+        else:
+            workers = workers or os.cpu_count() or 1
+            chunksize = chunksize or max(1, runs // (workers * 4))
+            with ProcessPoolExecutor(workers, initializer=_attach,
+                                     initargs=(result.names, result.shape)) as pool:
+                for _ in pool.map(_run, jobs, chunksize=chunksize):
+                    pass
+    except BaseException:
+        result.close()
+        raise
+    return result
+
+
+def orbit(G=1.0, planet_mass=5000, planet_radius=40, distance=200, speed=1.0, moons=1, radius=10):
+    """A static planet and `moons` bodies on circular orbits (speed=1) around it."""
+    v = math.sqrt(G * planet_mass / distance) * speed
+    bodies = [(0.0, 0.0, 0.0, 0.0, planet_mass, planet_radius, True)]
+    for k in range(moons):
+        a = 2 * math.pi * k / moons
+        bodies.append((distance * math.cos(a), distance * math.sin(a),
+                       -v * math.sin(a), v * math.cos(a), 1.0, radius, False))
+    return bodies
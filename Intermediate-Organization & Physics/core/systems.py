@@ -0,0 +1,159 @@
+from components.appearance import Renderable
+from components.controller import Controller, Thrust
+from components.physics_body import PhysicsBody, Static
+from core.render_queue import RenderQueue
+from core.spatial_grid import SpatialGrid
+from core.sprite_cache import SpriteCache
+
+# Systems = the per-frame/per-tick code of the ECS (core/ecs.py).
+# Each one remembers which entities it cares about and only rebuilds that list when
+# the registry changed (registry.version), so a normal tick is a loop over plain lists.
+
+
+class PhysicsSystem:
+    """Gravity + integration + overlaps for every PhysicsBody; Static ones don't move."""
+    def __init__(self, registry, physics):
+        self.registry = registry
+        self.physics = physics
+        self.bodies = registry.components(PhysicsBody)  # live dense list
+        self.moving = []      # indices into bodies that are not Static
+        self._version = -1
+
+    def _refresh(self):
+        reg = self.registry
+        if self._version == reg.version:
+            return
+        store = reg.store(PhysicsBody)
+        static = reg.store(Static).index
+        self.bodies = store.components
+        self.moving = [i for i, e in enumerate(store.entities) if e not in static]
+        self._version = reg.version
+
+    def update(self, dt):
+        self._refresh()
+        self.physics.step(self.bodies, dt, self.moving)
+
+
+class ControllerSystem:
+    """Controller input -> thrust on the entity's body (what Player.update does)."""
+    def __init__(self, registry):
+        self.registry = registry
+        self.rows = []
+        self._version = -1
+
+    def update(self, dt):
+        reg = self.registry
+        if self._version != reg.version:
+            self.rows = [row[1:] for row in reg.query(Controller, Thrust, PhysicsBody)]
+            self._version = reg.version
+        for c, thrust, body in self.rows:
+            p = thrust.power
+            if c.up:
+                body.vy -= p
+            if c.down:
+                body.vy += p
+            if c.left:
+                body.vx -= p
+            if c.right:
+                body.vx += p
+            if c.shift:
+                body.vx *= thrust.brake
+                body.vy *= thrust.brake
+
+
+class Drawable:
+    """RenderQueue / SpatialGrid entry: an entity's body + Renderable (fields read live)."""
+    __slots__ = ("body", "renderable")
+
+    def __init__(self, body, renderable):
+        self.body = body
+        self.renderable = renderable
+
+    @property
+    def x(self): return self.body.x
+
+    @property
+    def y(self): return self.body.y
+
+    @property
+    def layer(self): return self.renderable.layer
+
+    @property
+    def z(self): return self.renderable.z
+
+    @property
+    def radius(self): return self.body.radius
+
+
+class RenderSystem:
+    """
+    Draws every PhysicsBody + Renderable inside the camera view, back to front
+    (layer, then z, then bigger radius first), with appearances from a SpriteCache.
+    Same machinery as World.render: a SpatialGrid finds what the camera sees (only
+    non-Static entities are re-indexed per frame), and the order lives in a
+    RenderQueue that entities enter once, so nothing is sorted per frame.
+    """
+    def __init__(self, registry, sprites=None, cell_size=256):
+        self.registry = registry
+        self.sprites = sprites or SpriteCache()
+        self.queue = RenderQueue()
+        self.index = SpatialGrid(cell_size)
+        self.items = {}       # entity -> its Drawable
+        self.movers = []      # Drawables of non-Static entities: re-indexed every frame
+        self._version = -1
+
+    def _refresh(self):
+        reg = self.registry
+        if self._version == reg.version:
+            return
+        queue, index, old, items, added = self.queue, self.index, self.items, {}, []
+        for e, body, r in reg.query(PhysicsBody, Renderable):
+            d = old.pop(e, None)
+            if d is not None and (d.body is not body or d.renderable is not r):
+                queue.remove(d)  # component replaced
+                index.remove(d)
+                d = None
+            if d is None:
+                d = Drawable(body, r)
+                added.append(d)
+                index.insert(d)
+            items[e] = d
+        for d in old.values():  # destroyed, or no longer drawable
+            queue.remove(d)
+            index.remove(d)
+        queue.extend(added)
+        static = reg.store(Static).index
+        self.items = items
+        self.movers = [d for e, d in items.items() if e not in static]
+        self._version = reg.version
+
+    def set_z(self, entity, z=None, layer=None):
+        """Change an entity's draw order (the only time it moves in the queue)."""
+        self._refresh()
+        d = self.items[entity]
+        self.queue.remove(d)
+        if z is not None:
+            d.renderable.z = z
+        if layer is not None:
+            d.renderable.layer = layer
+        self.queue.add(d)
+
+    def draw(self, screen, camera, positions=None, margin=64):
+        """screen: a Surface or core.renderer.Renderer. positions: optional body -> (x, y)."""
+        self._refresh()
+        index = self.index
+        for d in self.movers:
+            index.move(d)
+        # Margin covers entities drawn a little off their indexed spot (interpolation)
+        visible = index.query(*camera.view_rect(margin))
+
+        sprites = self.sprites
+        for _, batch in self.queue.draw_lists(visible):
+            for d in batch:
+                body = d.body
+                cached = sprites.appearance(d.renderable.appearance, body.radius)
+                if cached is not None:
+                    surf, ox, oy = cached
+                    x, y = positions(body) if positions is not None else (body.x, body.y)
+                    sx, sy = camera.world_to_screen(x, y)
+                    screen.blit(surf, (int(sx) + ox, int(sy) + oy))
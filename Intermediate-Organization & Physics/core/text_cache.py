@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+import pygame
+
+# font.render() rasterizes the whole string every call, even if it's the same text
+# as last frame. Two ways around that:
+#   TextCache  - remembers finished text surfaces by (font, text, color, antialias).
+#                Great for titles, tips, headers, "Best: 1234"... anything that
+#                rarely changes. Least recently used entries get dropped.
+#   GlyphAtlas - renders each CHARACTER once and builds strings by blitting the
+#                characters side by side. For text that changes every frame
+#                (score counters, debug readouts) where caching whole strings won't help.
+#
+# Also copied into the other game; keep the copies in sync (benchmarks/check_copies.py).
+
+
+class TextCache:
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        items = self._items
+        surf = items.get(key)
+        if surf is not None:
+            items.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        items[key] = surf
+        if len(items) > self.max_entries:
+            items.popitem(last=False)  # evict least recently used
+        return surf
+
+
+class GlyphAtlas:
+    """All glyphs of one font + color. draw() blits a string glyph by glyph."""
+    def __init__(self, font: pygame.font.Font, color, antialias: bool = True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.glyphs = {}  # char -> (surface, advance)
+        self.height = font.get_height()
+
+    def _glyph(self, ch):
+        g = self.glyphs.get(ch)
+        if g is None:
+            g = (self.font.render(ch, self.antialias, self.color), self.font.size(ch)[0])
+            self.glyphs[ch] = g
+        return g
+
+    def width(self, text: str) -> int:
+        return sum(self._glyph(ch)[1] for ch in text)
+
+    def draw(self, target, text: str, pos) -> int:
+        """Blit text at pos (top-left) on a Surface or Renderer. Returns the width drawn."""
+        x, y = pos
+        start = x
+        batch = []
+        for ch in text:
+            surf, advance = self._glyph(ch)
+            batch.append((surf, (x, y)))
+            x += advance
+        target.blits(batch, doreturn=False)
+        return x - start
@@ -1,12 +1,50 @@
 # World = the universe/orchestrator (no physics inside yet)
 # For me I want to think of it like the Marvel Universe we live in the totality of the story we want to have our
 # objects live in
+from core.render_queue import RenderQueue
+from core.snapshot import restore_bodies, snapshot_bodies
+from core.spatial_grid import SpatialGrid
+from core.sprite_cache import SpriteCache
+
 class World:
-    def __init__(self):
+    def __init__(self, cell_size=256):
         self.objects = []  # everything that exists in the universe
+        # Where the drawable things are, so render only looks at what the camera sees
+        self.index = SpatialGrid(cell_size)
+        self.movers = []   # drawable + not static -> need re-indexing after they move
+        # Drawing order, kept sorted as things are added (no sorting per frame)
+        self.render_queue = RenderQueue()
+        # Appearances rasterized once, blitted every frame
+        self.sprites = SpriteCache()
 
     def add(self, obj):
         self.objects.append(obj)
+        if hasattr(obj, "appearance"):
+            self.index.insert(obj)
+            self.render_queue.add(obj)
+            if not getattr(obj, "static", False):
+                self.movers.append(obj)
+
+    def update_index(self):
+        # Call once per frame after physics moved things (static objects never need it)
+        for o in self.movers:
+            self.index.move(o)
+
+    def bodies(self):
+        """The objects with physics state (what snapshot() saves), in add order."""
+        return [o for o in self.objects if hasattr(o, "vx")]
+
+    def snapshot(self) -> bytes:
+        # Physics state only (core/snapshot.py); the objects themselves stay as they are
+        return snapshot_bodies(self.bodies())
+
+    def restore(self, data) -> None:
+        restore_bodies(self.bodies(), data)
+        self.update_index()
+
+    def set_z(self, obj, z=None, layer=None):
+        # Change draw order of one object (only time the queue is re-sorted)
+        self.render_queue.update(obj, z=z, layer=layer)
 
     def update(self, dt):
         # If you want World-driven updates, call them here.
@@ -15,36 +53,35 @@ class World:
             if hasattr(o, "world_update"):
                 o.world_update(dt)
 
-    def render(self, screen, camera):
+    def render(self, screen, camera, positions=None):
         """
         Orchestrates drawing:
+        - Asks the spatial index which objects are inside the camera's view (culling)
         - Queries each object for its 'appearance' & position (world space)
         - Transforms to screen coords via camera
-        - Draws in a simple back-to-front order (by optional 'z' or radius)
+        - Blits the appearance pre-drawn by the sprite cache
+        - Draws back-to-front from the persistent render queue: layer by layer,
+          then by optional 'z', then larger radius first
+        positions: optional o -> (x, y) lookup, e.g. FixedTimestep.lerp to draw
+                   objects smoothly between physics ticks
+        screen: a Surface, or a core.renderer.Renderer to batch the blits into one
+                Surface.blits call (and track dirty rects)
         """
-        import pygame
-
-        # Simple z-order: larger radius first (planets under smaller stuff)
-        def z_key(o):
-            return getattr(o, "radius", 0)
-
-        for o in sorted(self.objects, key=z_key, reverse=True):
-            if not hasattr(o, "appearance"):
-                continue
-            app = o.appearance
-            sx, sy = camera.world_to_screen(o.x, o.y)
-
-            # Minimal appearance protocol: type + params
-            if app.get("type") == "circle":
-                color = app.get("color", (255, 255, 255))
-                r = int(getattr(o, "radius", 8))
-                pygame.draw.circle(screen, color, (int(sx), int(sy)), r)
-
-            elif app.get("type") == "sprite":
-                # Future: blit sprite with angle/scale, etc.
-                sprite = app.get("surface")
-                if sprite:
-                    rect = sprite.get_rect(center=(int(sx), int(sy)))
-                    screen.blit(sprite, rect)
-
-            # You can extend with polygons, lines, text, etc.
+        sprites = self.sprites
+
+        # Margin covers objects drawn a little off their indexed spot (interpolation)
+        visible = self.index.query(*camera.view_rect(margin=64))
+
+        for layer, batch in self.render_queue.draw_lists(visible):
+            for o in batch:
+                wx, wy = positions(o) if positions is not None else (o.x, o.y)
+                sx, sy = camera.world_to_screen(wx, wy)
+
+                # Minimal appearance protocol: type + params
+                # ("circle", "rect", "polygon", "sprite"; see core/sprite_cache.py)
+                cached = sprites.appearance(o.appearance, getattr(o, "radius", 8))
+                if cached is not None:
+                    surf, ox, oy = cached
+                    screen.blit(surf, (int(sx) + ox, int(sy) + oy))
+
+                # You can extend with lines, text, etc.
@@ -0,0 +1,34 @@
+# The game objects as ECS entities (core/ecs.py): same data as Player/Planet/Camera,
+# split into components so systems can find them without hasattr checks.
+
+from components.appearance import Renderable, circle
+from components.controller import Thrust
+from components.physics_body import PhysicsBody, Static
+from core.camera import Camera
+
+
+def spawn_player(registry, x, y, controller, color=(255, 255, 0), radius=10, mass=1.0) -> int:
+    return registry.create(PhysicsBody(x, y, mass=mass, radius=radius),
+                           controller, Thrust(), Renderable(circle(color)))
+
+
+def spawn_planet(registry, x, y, radius=40, color=(0, 120, 255), mass=5000, static=True) -> int:
+    e = registry.create(PhysicsBody(x, y, mass=mass, radius=radius), Renderable(circle(color)))
+    if static:
+        registry.add(e, Static())
+    return e
+
+
+def spawn_camera(registry, screenW, screenH, target=None, mode="follow") -> int:
+    """target: an entity id; the camera follows that entity's PhysicsBody."""
+    body = registry.get(target, PhysicsBody) if target is not None else None
+    return registry.create(Camera(screenW, screenH, mode=mode, target=body))
+
+
+def spawn_scene(registry, screenW, screenH, controller):
+    """The demo scene of main.py: a player orbiting one planet, the camera on the player.
+    Returns (player, camera) entity ids. Replays (core/replay.py) rebuild it from here."""
+    player = spawn_player(registry, 0, 0, controller)
+    camera = spawn_camera(registry, screenW, screenH, target=player)
+    spawn_planet(registry, 200, 150, radius=40, color=(0, 120, 255), mass=5000)
+    return player, camera
@@ -1,10 +1,16 @@
 import pygame
-from gameObjects.player import Player
 from components.controller import Controller
+from components.physics_body import PhysicsBody
 from core.camera import Camera
-from core.world import World
+from core.ecs import Registry
+from core.systems import ControllerSystem, PhysicsSystem, RenderSystem
 from core.physics import Physics
-from gameObjects.planet import Planet
+from core.loop import FixedTimestep
+from core.renderer import Renderer
+from core.text_cache import GlyphAtlas
+from core.profiler import FrameProfiler, ProfilerOverlay
+from core.replay import CHECK_EVERY, Recorder, checksum
+from gameObjects.entities import spawn_scene
 
 pygame.init()
 
@@ -14,57 +20,112 @@ screenH = 9 * 80
 screen = pygame.display.set_mode((screenW, screenH))
 clock = pygame.time.Clock()
 
-# Game Objects
-controller = Controller()
-player = Player(0, 0, controller)
-camera = Camera(screenW, screenH, mode="follow", target=player)
-world = World()
-physics = Physics(G=1)
+# Simulation runs at a fixed TICK_RATE; drawing runs as fast as RENDER_FPS allows
+TICK_RATE = 60
+RENDER_FPS = 0  # 0 = uncapped
+RENDER_MODE = "dirty"  # "flip" = redraw whole window, "dirty" = only what changed (core/renderer.py)
+TRACE_PATH = "frame_trace.json"  # F4 starts/stops recording a Chrome trace here
+RECORD_PATH = None  # e.g. "orbit.rply": record every tick's input (replay: benchmarks/bench_replay.py)
 
-world.add(camera)
+# Game Objects (entities = ids; their data lives in the registry's component stores)
+registry = Registry()
+controller = Controller()
+player_id, camera_id = spawn_scene(registry, screenW, screenH, controller)  # player + a planet
+player = registry.get(player_id, PhysicsBody)
+camera = registry.get(camera_id, Camera)
 
-# Example planet (for later physics)
-earth = Planet(200, 150, radius=40, color=(0, 120, 255), mass=5000)
+# Systems (core/systems.py)
+controls = ControllerSystem(registry)
+physics = PhysicsSystem(registry, Physics(G=1))  # Physics(G=1, solver="barnes_hut", theta=0.5) for big asteroid fields
+render = RenderSystem(registry)
 
-# Register objects in the world
-world.add(player)
-world.add(earth)
+loop = FixedTimestep(tick_rate=TICK_RATE, max_substeps=5)
+renderer = Renderer(screen, mode=RENDER_MODE, background=(0, 0, 0))
 
 # Font (used for debugging and info display)
 font = pygame.font.SysFont("Arial", 20)
+hud = GlyphAtlas(font, (255, 255, 255))  # debug line changes every frame -> draw it from glyphs
 message = None
 
+# F3 = performance overlay (frame graph, time per loop phase)
+profiler = FrameProfiler()
+overlay = ProfilerOverlay(profiler)
+
+
+recorder = Recorder(RECORD_PATH, loop.step, 0) if RECORD_PATH else None
+
+
+def tick(step):
+    # Physics speaks in "60 fps frames" (dt = 1.0 per 1/60 s), so convert seconds
+    dt = step * 60
+    controls.update(dt)
+    physics.update(dt)
+    if recorder is not None:
+        recorder.tick(controller.bits)
+        if recorder.ticks % CHECK_EVERY == 0:
+            recorder.checkpoint(checksum(player.x, player.y, player.vx, player.vy))
+
+
 running = True
 while running:
+    profiler.begin_frame()
+    profiler.phase("Events")
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            renderer.invalidate()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            overlay.toggle()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            if profiler.recording:
+                n = profiler.stop_trace(TRACE_PATH)
+                print(f"wrote {n} trace events to {TRACE_PATH}")
+            else:
+                profiler.start_trace()
 
     # MAIN GAME LOOP
-    # 1 Time
-    dt = clock.tick(60) / (1000 / 60)
+    # 1 Time (real seconds since last frame)
+    profiler.phase("Time")
+    frame_time = clock.tick(RENDER_FPS) / 1000
 
     # 2 Controls
+    profiler.phase("Controls")
     controller.update(pygame.key.get_pressed())
 
-    # 3 Physics
-    player.update(dt)
-    physics.update(world.objects, dt)
+    # 3 Physics (zero or more fixed ticks, see core/loop.py)
+    profiler.phase("Physics")
+    loop.advance(frame_time, tick, physics.bodies)
 
     # 4 Update Coordinates
+    profiler.phase("Update")
+    # (nothing to sync: systems read positions straight from the PhysicsBody components)
 
     # 5 Handle Interactions
+    profiler.phase("Interactions")
     # (Future: collisions, pickups, damage, etc.)
 
     # 6 Camera
-    camera.update(player)
+    profiler.phase("Camera")
+    camera.update(frame_time, loop.lerp)
 
-    # 7 Draw (Paint your pixels each frame)
-    screen.fill((0, 0, 0))
-    world.render(screen, camera)  # camera passed in, not owned by world
+    # 7 Draw (Paint your pixels each frame, blended between the last two ticks)
+    profiler.phase("Draw")
+    renderer.begin()
+    render.draw(renderer, camera, loop.lerp)  # camera passed in, not owned by the render system
 
     # Optional: Print debug info
-    message = f"PlayerX: {player.x:.2f}  PlayerY: {player.y:.2f}"
-    screen.blit(font.render(message, True, (255, 255, 255)), (20, 20))
-
-    pygame.display.flip()
+    message = f"PlayerX: {player.x:.2f}  PlayerY: {player.y:.2f}  px/frame: {renderer.pixels}"
+    hud.draw(renderer, message, (20, 20))
+    panel = overlay.draw()
+    if panel is not None:
+        renderer.blit(panel, (screenW - panel.get_width() - 10, 10))
+
+    profiler.phase("Present")
+    renderer.present()
+    profiler.count("entities", len(registry))
+    profiler.count("draw calls", renderer.blit_count)
+    profiler.end_frame()
+
+if recorder is not None:
+    recorder.close()
@@ -0,0 +1,69 @@
+# World.get_ground_height_at on a generated level: the old scan over every platform
+# vs the x-bucket index, one query at a time and batched (get_ground_heights).
+# Run from the MyPlayground folder:
+#   python -m benchmarks.bench_ground            (10k platforms)
+#   python -m benchmarks.bench_ground 100000
+import random
+import sys
+import time
+
+from gameObject.world import World
+from levels import generate_platforms
+
+GROUND = 860
+
+
+def old_ground_height_at(platforms, ground_level, player_x, player_y, velocity_y):
+    """What World.get_ground_height_at used to do."""
+    ground_candidates = []
+    for p in platforms:
+        within_x = p.world_x <= player_x <= p.world_x + p.width
+        above_platform = player_y <= p.world_y
+        falling = velocity_y >= 0
+        if within_x and above_platform and falling:
+            ground_candidates.append(p.world_y)
+    ground_candidates.append(ground_level)
+    return min(ground_candidates)
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, result
+
+
+def main(count=10_000, queries=2_000):
+    t = time.perf_counter()
+    world = World(ground_level=GROUND)
+    for p in generate_platforms(count, seed=1, ground_level=GROUND):
+        world.add_platform(p)
+    build = time.perf_counter() - t
+
+    rng = random.Random(2)
+    end = max(p.world_x + p.width for p in world.platforms)
+    qs = [(rng.uniform(0, end), rng.uniform(300, GROUND), rng.choice((-1.0, 0.0, 2.5)))
+          for _ in range(queries)]
+    # exact platform edges too: the ends are inclusive
+    qs += [(p.world_x + p.width, p.world_y - 1, 1.0) for p in world.platforms[:200]]
+
+    t_old, old = timed(lambda: [old_ground_height_at(world.platforms, GROUND, *q) for q in qs], 1)
+    t_one, one = timed(lambda: [world.get_ground_height_at(*q) for q in qs])
+    t_batch, batch = timed(lambda: world.get_ground_heights(qs))
+    assert old == one == batch, "index disagrees with the linear scan"
+
+    n = len(qs)
+    per_bucket = sum(map(len, world.buckets.values())) / len(world.buckets)
+    print(f"{count} platforms, index built in {build * 1000:.1f} ms, "
+          f"{len(world.buckets)} buckets, {per_bucket:.1f} platforms per bucket")
+    print(f"{'':18}{'us/query':>10}")
+    print(f"{'linear scan':18}{t_old / n * 1e6:10.2f}")
+    print(f"{'index':18}{t_one / n * 1e6:10.2f}")
+    print(f"{'index, batched':18}{t_batch / n * 1e6:10.2f}")
+    print(f"{n} queries agree")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,87 @@
+# Streaming a generated 1M-platform level (levels.py + gameObject/streaming.py) vs
+# loading all of it into the World: memory held, and per-frame time on the main
+# thread while the camera scrolls through the level (hitches = slow frames).
+# Run from the MyPlayground folder:
+#   python -m benchmarks.bench_streaming            (1M platforms)
+#   python -m benchmarks.bench_streaming 100000
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from gameObject.camera import Camera
+from gameObject.platform import Platform
+from gameObject.streaming import ChunkStreamer
+from gameObject.world import World
+from levels import LevelFile, generate_rows, write_level
+
+GROUND = 860
+SCROLL = 40       # camera px per frame (20x the walking speed, to cross many chunks)
+FRAMES = 20_000
+
+
+def scroll(streamer, world, camera, frames):
+    """Per-frame main-thread times (ns) and how often the ground under the camera was missing."""
+    times = []
+    missing = 0
+    for i in range(frames):
+        camera.camera_x = i * SCROLL
+        t = time.perf_counter_ns()
+        streamer.update(camera)
+        world.get_ground_height_at(camera.camera_x + camera.width / 2, 0, 1)
+        times.append(time.perf_counter_ns() - t)
+        mid = int((camera.camera_x + camera.width / 2) // streamer.level.chunk_width)
+        if mid in streamer.level.chunks and mid not in streamer.resident:
+            missing += 1
+        time.sleep(0)  # let the loader run, as the real frame's clock.tick would
+    return times, missing
+
+
+def main(count=1_000_000):
+    path = os.path.join(tempfile.mkdtemp(), "level.plvl")
+    t = time.perf_counter()
+    write_level(path, generate_rows(count, seed=1, ground_level=GROUND))
+    print(f"generated {count} platforms in {time.perf_counter() - t:.1f} s, "
+          f"{os.path.getsize(path) / 2**20:.1f} MiB on disk")
+
+    # All in memory (what World did before)
+    tracemalloc.start()
+    t = time.perf_counter()
+    full = World(ground_level=GROUND)
+    level = LevelFile(path)
+    for c in sorted(level.chunks):
+        rows = level.chunk(c)
+        for i in range(0, len(rows), 4):
+            full.add_platform(Platform(rows[i], rows[i + 1], rows[i + 2], rows[i + 3]))
+    full_s = time.perf_counter() - t
+    full_kib = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+    del full
+
+    # Streamed
+    world = World(ground_level=GROUND)
+    camera = Camera(1600, 900)
+    tracemalloc.start()
+    streamer = ChunkStreamer(world, level)
+    times, missing = scroll(streamer, world, camera, FRAMES)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    streamer.close()
+    level.close()
+
+    times.sort()
+    p99 = times[int(len(times) * 0.99)] / 1000
+    print(f"{'load everything':22}{full_s * 1000:10.0f} ms   {full_kib:10.0f} KiB resident")
+    print(f"{'streamed':22}{'':13}{current / 1024:10.0f} KiB resident "
+          f"(peak {peak / 1024:.0f}), {len(world.platforms)} platforms")
+    print(f"scrolled {FRAMES} frames ({FRAMES * SCROLL / 1e6:.1f}M px): "
+          f"{streamer.loads} chunk loads, {streamer.evictions} evictions, "
+          f"{missing} frames with the chunk under the camera missing")
+    print(f"main-thread frame cost: p50 {times[len(times) // 2] / 1000:.1f} us, "
+          f"p99 {p99:.1f} us, worst {times[-1] / 1000:.1f} us")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -65,41 +65,79 @@ DB_PATH = user_data_dir() / "scores.db"
 # SQLite helpers
 # ------------------------------
 
-def db_connect():
-    conn = sqlite3.connect(DB_PATH)
-    with conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS scores(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                player TEXT NOT NULL,
-                points INTEGER NOT NULL,
-                ts DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-            """
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player TEXT NOT NULL,
+    points INTEGER NOT NULL,
+    ts DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_scores_points ON scores(points DESC, ts ASC);
+"""
+
+
+class ScoreStore:
+    """
+    One long-lived SQLite connection + an in-memory copy of the leaderboard
+    (same idea as v2/db.py). The HUD asks for the best score every frame; that
+    comes from memory, and the database is only read again after add_score().
+    """
+
+    def __init__(self, path=DB_PATH, cache_size: int = 10):
+        self.conn = sqlite3.connect(path)
+        # WAL: writers don't block readers, and commits are cheaper
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        self.cache_size = cache_size
+        self._top = None  # best `cache_size` rows, None = needs reloading
+
+    def add_score(self, player: str, points: int) -> None:
+        player = player.strip() or "Player"
+        with self.conn:
+            self.conn.execute("INSERT INTO scores(player, points) VALUES (?, ?)", (player, points))
+        self._top = None
+
+    def _load(self, limit: int) -> List[Tuple[str, int]]:
+        cur = self.conn.execute(
+            "SELECT player, points FROM scores ORDER BY points DESC, ts ASC LIMIT ?",
+            (limit,),
         )
-    return conn
+        return list(cur.fetchall())
+
+    def top_scores(self, limit: int = 5) -> List[Tuple[str, int]]:
+        if limit > self.cache_size:
+            return self._load(limit)
+        if self._top is None:
+            self._top = self._load(self.cache_size)
+        return self._top[:limit]
+
+    def best_score(self) -> int:
+        top = self.top_scores(1)
+        return top[0][1] if top else 0
+
+
+_store = None
+
+
+def store() -> ScoreStore:
+    global _store
+    if _store is None:
+        _store = ScoreStore()
+    return _store
+
 
 def add_score(player: str, points: int) -> None:
-    player = player.strip() or "Player"
-    with db_connect() as conn:
-        conn.execute("INSERT INTO scores(player, points) VALUES (?, ?)", (player, points))
+    store().add_score(player, points)
 
 
 def best_score() -> int:
-    with db_connect() as conn:
-        cur = conn.execute("SELECT MAX(points) FROM scores")
-        (mx,) = cur.fetchone()
-        return mx or 0
+    return store().best_score()
 
 
 def top_scores(limit: int = 5) -> List[Tuple[str, int]]:
-    with db_connect() as conn:
-        cur = conn.execute(
-            "SELECT player, points FROM scores ORDER BY points DESC, ts ASC LIMIT ?",
-            (limit,),
-        )
-        return list(cur.fetchall())
+    return store().top_scores(limit)
 
 
 # ------------------------------
@@ -0,0 +1,49 @@
+import pygame
+
+from settings import WIDTH, HEIGHT, GROUND_Y, GROUND, BG, STRIPE_COLOR
+
+
+def _finish(surf: pygame.Surface) -> pygame.Surface:
+    # Same pixel format as the screen = fastest blits (needs a display to exist)
+    return surf.convert() if pygame.display.get_surface() is not None else surf
+
+
+def build_static() -> pygame.Surface:
+    """Sky + ground, drawn once. Never changes, never moves."""
+    surf = pygame.Surface((WIDTH, HEIGHT))
+    surf.fill(BG)
+    pygame.draw.rect(surf, GROUND, (0, GROUND_Y, WIDTH, HEIGHT - GROUND_Y))
+    return _finish(surf)
+
+
+class ParallaxLayer:
+    """
+    A horizontal band that repeats every `period` pixels and scrolls at
+    `factor` x the world speed (1.0 = moves with the ground, 0.3 = far away).
+
+    The band is drawn ONCE into a strip one period wider than the screen;
+    scrolling is just blitting that strip further left (offset wraps at one period).
+    """
+    def __init__(self, tile: pygame.Surface, y: int, factor: float = 1.0):
+        self.y = y
+        self.factor = factor
+        self.period = tile.get_width()
+        h = tile.get_height()
+        strip = pygame.Surface((WIDTH + self.period, h), tile.get_flags(), tile)
+        for x in range(0, WIDTH + self.period, self.period):
+            strip.blit(tile, (x, 0))
+        self.strip = _finish(strip) if not tile.get_flags() & pygame.SRCALPHA else strip
+        self.rect = pygame.Rect(0, y, WIDTH, h)  # screen area it covers (dirty rect)
+
+    def draw(self, screen: pygame.Surface, scroll: float) -> pygame.Rect:
+        offset = int(scroll * self.factor) % self.period
+        screen.blit(self.strip, (-offset, self.y))
+        return self.rect
+
+
+def ground_stripes() -> ParallaxLayer:
+    """The dashed line on the ground: 30 px stripe + 10 px gap, moving with the world."""
+    tile = pygame.Surface((40, 5))
+    tile.fill(GROUND)
+    tile.fill(STRIPE_COLOR, (0, 0, 30, 5))
+    return ParallaxLayer(tile, GROUND_Y + 30, factor=1.0)
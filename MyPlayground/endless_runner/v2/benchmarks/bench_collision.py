@@ -0,0 +1,73 @@
+# Player vs obstacles: the old check (a new Rect per obstacle + colliderect on all of
+# them) vs ObstaclePool.collidelist (one batched call over reused Rects) vs
+# ObstaclePool.first_hit (walk by x, stop past the player, no Rects at all).
+# Obstacles are packed into dense streams to make the difference visible.
+# Run from the endless_runner/v2 folder:
+#   python -m benchmarks.bench_collision
+#   python -m benchmarks.bench_collision 10 100 1000
+import random
+import sys
+import time
+
+import pygame
+
+from entities import ObstaclePool, Player
+from settings import GROUND_Y, PLAYER_W, PLAYER_H, OB_MIN_W, OB_MAX_W, OB_MIN_H, OB_MAX_H
+
+QUERIES = 2000
+
+
+def dense_stream(n, seed=1):
+    """n obstacles spaced 10..40 px apart, starting off the left edge."""
+    rng = random.Random(seed)
+    pool = ObstaclePool(capacity=n + 1)
+    x = -10.0
+    for _ in range(n):
+        w = rng.randint(OB_MIN_W, OB_MAX_W)
+        pool.spawn(x, w, rng.randint(OB_MIN_H, OB_MAX_H))
+        x += w + rng.randint(10, 40)
+    return pool
+
+
+def per_query_us(fn, queries):
+    t0 = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - t0) / len(queries) * 1e6
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10, 100, 1000, 10000]
+    rng = random.Random(2)
+    print(f"{'obstacles':>10}{'rect each (us)':>16}{'collidelist (us)':>18}{'sweep (us)':>12}{'speedup':>10}")
+    for n in sizes:
+        pool = dense_stream(n)
+        # player at its usual x, anywhere from on the ground to mid-jump
+        players = [Player(120, GROUND_Y - PLAYER_H - rng.uniform(0, 150)) for _ in range(QUERIES)]
+
+        def old(p):
+            pr = p.rect()
+            for ob in pool:
+                if pr.colliderect(ob.rect()):
+                    return ob
+            return None
+
+        def batched(p):
+            return pool.collidelist(p.rect())
+
+        def sweep(p):
+            x, y = int(p.x), int(p.y)
+            return pool.first_hit(x, y, x + PLAYER_W, y + PLAYER_H)
+
+        for p in players:  # all three must agree
+            assert old(p) is batched(p) is sweep(p)
+        reps = players if n <= 1000 else players[:200]
+        t_old = per_query_us(old, reps)
+        t_batch = per_query_us(batched, reps)
+        t_sweep = per_query_us(sweep, reps)
+        print(f"{n:>10}{t_old:>16.2f}{t_batch:>18.2f}{t_sweep:>12.2f}{t_old / t_sweep:>9.0f}x")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    main()
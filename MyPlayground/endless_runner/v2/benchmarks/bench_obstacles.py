@@ -0,0 +1,93 @@
+# Obstacle bookkeeping: the old list version (copy + filter every tick, max() to find
+# the rightmost edge, new Obstacle per spawn) vs the ObstaclePool ring in world.py.
+# Checks the pool's steady state with tracemalloc: no new Obstacle objects, no memory
+# growth, and the per-tick allocation peak (what's left is float arithmetic).
+# Run from the endless_runner/v2 folder:
+#   python -m benchmarks.bench_obstacles            (36000 ticks = 10 min of play)
+#   python -m benchmarks.bench_obstacles 5000
+import random
+import sys
+import time
+import tracemalloc
+
+from entities import Obstacle
+from settings import WIDTH, OB_MIN_W, OB_MAX_W, OB_MIN_H, OB_MAX_H, OB_GAP_MIN
+from world import World
+
+DT = 1 / 60
+
+
+class ListWorld(World):
+    """World.update_play / maybe_spawn as they were before the pool."""
+    def __init__(self):
+        super().__init__()
+        self.obstacles = []
+
+    def maybe_spawn(self, speed):
+        w = random.randint(OB_MIN_W, OB_MAX_W)
+        h = random.randint(OB_MIN_H, OB_MAX_H)
+        rightmost = max(ob.x + ob.w for ob in self.obstacles) if self.obstacles else 0
+        desired_gap = max(140, OB_GAP_MIN - (speed * 6))
+        if rightmost < WIDTH - desired_gap:
+            self.obstacles.append(Obstacle(WIDTH + random.randint(0, 60), w, h))
+
+    def update_play(self, dt):
+        speed = self.current_speed()
+        step = speed * dt * 60
+        self.distance += step
+        for ob in list(self.obstacles):
+            ob.update(step)
+        self.obstacles = [o for o in self.obstacles if o.x + o.w > -10]
+        self.time_since_spawn += dt
+        if self.time_since_spawn >= self.spawn_cooldown(speed):
+            self.maybe_spawn(speed)
+            self.time_since_spawn = 0.0
+        self.scroll += step
+
+
+def run(world, ticks):
+    getattr(world, "rng", random).seed(7)  # World spawns from its own generator
+    for _ in range(600):  # warm up: fill the screen, let the pool reach its size
+        world.update_play(DT)
+
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        world.update_play(DT)
+    us = (time.perf_counter() - t0) / ticks * 1e6
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    worst = 0
+    for _ in range(ticks):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        world.update_play(DT)
+        worst = max(worst, tracemalloc.get_traced_memory()[1] - before)
+    growth = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return us, worst, growth
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 36_000
+    print(f"{ticks} ticks")
+    print(f"{'obstacles':<14}{'us/tick':>10}{'worst tick peak (B)':>22}{'growth (B)':>12}")
+    us, worst, growth = run(ListWorld(), ticks)
+    print(f"{'list':<14}{us:>10.2f}{worst:>22}{growth:>12}")
+
+    world = World()
+    us, worst, growth = run(world, ticks)
+    created = world.obstacles.created
+    print(f"{'ObstaclePool':<14}{us:>10.2f}{worst:>22}{growth:>12}")
+    print(f"pool: {len(world.obstacles.slots)} slots, {created} Obstacle objects ever created")
+
+    # Steady state check: another stretch of play must not create anything
+    before = world.obstacles.created
+    _, _, growth = run(world, ticks)
+    assert world.obstacles.created == before, "pool created Obstacles in steady state"
+    assert growth <= 0, f"pool grew memory in steady state ({growth} bytes)"
+    print("steady state: no new Obstacles, no memory growth  OK")
+
+
+if __name__ == "__main__":
+    main()
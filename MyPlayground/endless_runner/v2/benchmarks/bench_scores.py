@@ -0,0 +1,78 @@
+# Saving scores: old connect-per-call vs one ScoreStore connection vs the ScoreWriter thread.
+# Uses a throwaway database in a temp folder (your real scores are not touched).
+# Run from the endless_runner/v2 folder:
+#   python -m benchmarks.bench_scores            (100k scores)
+#   python -m benchmarks.bench_scores 20000
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from db import SCHEMA, ScoreStore
+from score_writer import ScoreWriter
+
+LEGACY_SAMPLE = 2000  # connect-per-call is too slow to run 100k times; time a sample
+
+
+def legacy_add(path, player, points):
+    # What db.add_score used to do: new connection + schema check every call
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executescript(SCHEMA)
+    with conn:
+        conn.execute("INSERT INTO scores(player, points) VALUES (?, ?)", (player, points))
+    conn.close()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tmp = Path(tempfile.mkdtemp())
+    print(f"{'method':<26}{'rows':>9}{'seconds':>10}{'rows/sec':>12}{'p99 call (ms)':>15}{'worst (ms)':>12}")
+
+    def report(name, rows, seconds, calls):
+        calls = sorted(calls)
+        p99, worst = calls[int(len(calls) * 0.99)], calls[-1]
+        print(f"{name:<26}{rows:>9}{seconds:>10.2f}{rows / seconds:>12.0f}"
+              f"{p99 * 1000:>15.3f}{worst * 1000:>12.3f}")
+
+    # 1) connection per call
+    path = tmp / "legacy.db"
+    rows = min(n, LEGACY_SAMPLE)
+    calls, t0 = [], time.perf_counter()
+    for i in range(rows):
+        c = time.perf_counter()
+        legacy_add(path, "bench", i)
+        calls.append(time.perf_counter() - c)
+    report("connect per call (sample)", rows, time.perf_counter() - t0, calls)
+
+    # 2) one connection, still one commit per score, on the calling thread
+    store = ScoreStore(tmp / "store.db")
+    calls, t0 = [], time.perf_counter()
+    for i in range(n):
+        c = time.perf_counter()
+        store.add_score("bench", i)
+        calls.append(time.perf_counter() - c)
+    report("ScoreStore.add_score", n, time.perf_counter() - t0, calls)
+    store.close()
+
+    # 3) background writer: submit() cost is what the game thread pays
+    writer = ScoreWriter(tmp / "writer.db")
+    calls, t0 = [], time.perf_counter()
+    for i in range(n):
+        c = time.perf_counter()
+        writer.submit("bench", i)
+        calls.append(time.perf_counter() - c)
+    t_submit = time.perf_counter() - t0
+    writer.close()  # flush
+    t_total = time.perf_counter() - t0
+    report("ScoreWriter.submit", n, t_submit, calls)
+    report("ScoreWriter (until saved)", writer.written, t_total, calls)
+
+    check = ScoreStore(tmp / "writer.db", cache_size=1)
+    print(f"writer db best score: {check.best_score()} (expected {n - 1})")
+    check.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import math
+
+# Continuous collision detection (CCD) = "did they touch at ANY moment during this
+# step?", not just "do they overlap at the end of it?".
+# A body that moves further than its own radius in one step can jump clean over a
+# small one (tunneling). These time-of-impact (TOI) tests follow the motion instead:
+# they return t in [0, 1], how far along the step contact first happens, or None.
+#
+# Also copied into the other game; keep the copies in sync (benchmarks/check_copies.py).
+
+
+def swept_circle_toi(px, py, dx, dy, r):
+    """
+    Relative form: one circle starts at offset (px, py) from the other and moves
+    by (dx, dy) relative to it; r = sum of the radii.
+    Returns None if they don't meet. Touching/overlapping at the start and moving
+    further in counts as contact at t = 0 (resting contact must not tunnel either).
+    """
+    c = px * px + py * py - r * r
+    a = dx * dx + dy * dy
+    b = 2 * (px * dx + py * dy)
+    if a == 0 or b >= 0:  # not moving, or moving apart
+        return None
+    if c <= 0:
+        return 0.0
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+    t = (-b - math.sqrt(disc)) / (2 * a)
+    return t if t <= 1 else None
+
+
+def swept_aabb_toi(left, top, right, bottom, dx, dy, b_left, b_top, b_right, b_bottom):
+    """
+    Box A = (left, top, right, bottom) moves by (dx, dy); box B stays put.
+    Slab test: per axis, find when the extents start and stop overlapping, then
+    intersect those time windows. Touching edges don't count (like Rect.colliderect).
+    """
+    t_enter, t_exit = 0.0, 1.0
+    for a_min, a_max, b_min, b_max, d in ((left, right, b_left, b_right, dx),
+                                          (top, bottom, b_top, b_bottom, dy)):
+        if d == 0:
+            if a_max <= b_min or a_min >= b_max:
+                return None
+            continue
+        t1 = (b_min - a_max) / d
+        t2 = (b_max - a_min) / d
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_enter = max(t_enter, t1)
+        t_exit = min(t_exit, t2)
+        if t_enter >= t_exit:
+            return None
+    return t_enter
@@ -1,6 +1,7 @@
 import os
 import sqlite3
 import sys
+import threading
 from pathlib import Path
 from typing import List, Tuple
 from settings import APP_NAME
@@ -18,36 +19,89 @@ def user_data_dir() -> Path:
 
 DB_PATH = user_data_dir() / "scores.db"
 
-def db_connect():
-    conn = sqlite3.connect(DB_PATH)
-    with conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS scores(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                player TEXT NOT NULL,
-                points INTEGER NOT NULL,
-                ts DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        )
-    return conn
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player TEXT NOT NULL,
+    points INTEGER NOT NULL,
+    ts DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_scores_points ON scores(points DESC, ts ASC);
+"""
 
-def add_score(player: str, points: int) -> None:
-    player = (player or "Player").strip() or "Player"
-    with db_connect() as conn:
-        conn.execute("INSERT INTO scores(player, points) VALUES (?, ?)", (player, points))
+class ScoreStore:
+    """
+    One long-lived SQLite connection + an in-memory copy of the leaderboard.
+    The UI asks for best/top scores every frame; those come from memory.
+    The database is only read again after add_score() changes it.
+    """
+    def __init__(self, path=DB_PATH, cache_size: int = 10):
+        self.conn = sqlite3.connect(path)
+        # WAL: writers don't block readers, and commits are cheaper
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        self.cache_size = cache_size
+        self._top = None  # best `cache_size` rows, None = needs reloading
+        # invalidate() runs on the ScoreWriter thread: it bumps the generation, and a
+        # list loaded before that bump is returned but not kept as the cache
+        self._lock = threading.Lock()
+        self._generation = 0
 
-def best_score() -> int:
-    with db_connect() as conn:
-        cur = conn.execute("SELECT MAX(points) FROM scores")
-        (mx,) = cur.fetchone()
-        return mx or 0
+    def add_score(self, player: str, points: int) -> None:
+        player = (player or "Player").strip() or "Player"
+        with self.conn:
+            self.conn.execute("INSERT INTO scores(player, points) VALUES (?, ?)", (player, points))
+        self.invalidate()
 
-def top_scores(limit: int = 5) -> List[Tuple[str, int]]:
-    with db_connect() as conn:
-        cur = conn.execute(
+    def invalidate(self) -> None:
+        """Someone else wrote to the DB (e.g. ScoreWriter): reload on next read. Thread-safe."""
+        with self._lock:
+            self._generation += 1
+            self._top = None
+
+    def _load(self, limit: int) -> List[Tuple[str, int]]:
+        cur = self.conn.execute(
             "SELECT player, points FROM scores ORDER BY points DESC, ts ASC LIMIT ?",
             (limit,),
         )
         return list(cur.fetchall())
+
+    def top_scores(self, limit: int = 5) -> List[Tuple[str, int]]:
+        if limit > self.cache_size:
+            return self._load(limit)  # bigger than what we keep: ask the DB
+        top = self._top  # read once: invalidate() may clear it meanwhile
+        if top is None:
+            with self._lock:
+                generation = self._generation
+            top = self._load(self.cache_size)
+            with self._lock:
+                if self._generation == generation:
+                    self._top = top
+        return top[:limit]
+
+    def best_score(self) -> int:
+        top = self.top_scores(1)
+        return top[0][1] if top else 0
+
+    def close(self) -> None:
+        self.conn.close()
+
+_store = None
+
+def store() -> ScoreStore:
+    """The shared ScoreStore, opened on first use."""
+    global _store
+    if _store is None:
+        _store = ScoreStore()
+    return _store
+
+def add_score(player: str, points: int) -> None:
+    store().add_score(player, points)
+
+def best_score() -> int:
+    return store().best_score()
+
+def top_scores(limit: int = 5) -> List[Tuple[str, int]]:
+    return store().top_scores(limit)
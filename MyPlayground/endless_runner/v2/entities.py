@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 import pygame
 from settings import PLAYER_W, PLAYER_H, GROUND_Y, PLAYER_COLOR, GRAVITY, JUMP_VELOCITY
+from sprite_cache import SpriteCache
+from ccd import swept_aabb_toi
+
+# Rounded rects are rasterized once per (color, size, radius) and blitted after that
+SPRITES = SpriteCache()
 
 @dataclass
 class Player:
@@ -17,28 +22,174 @@ class Player:
             self.vy = JUMP_VELOCITY
             self.on_ground = False
 
-    def update(self):
-        self.vy += GRAVITY
-        self.y += self.vy
+    def update(self, dt: float):
+        # GRAVITY / velocities are tuned "per 60 fps frame", so scale seconds to frames
+        k = dt * 60
+        self.vy += GRAVITY * k
+        self.y += self.vy * k
         if self.y + PLAYER_H >= GROUND_Y:
             self.y = GROUND_Y - PLAYER_H
             self.vy = 0
             self.on_ground = True
 
-    def draw(self, surf: pygame.Surface):
-        pygame.draw.rect(surf, PLAYER_COLOR, self.rect(), border_radius=10)
+    def draw(self, surf: pygame.Surface, pos=None):
+        # pos: optional interpolated (x, y) to draw at instead of the simulated one
+        x, y = pos if pos is not None else (self.x, self.y)
+        sprite, _, _ = SPRITES.rect(PLAYER_COLOR, PLAYER_W, PLAYER_H, 10)
+        surf.blit(sprite, (int(x), int(y)))
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Obstacle:
     x: float
     w: int
     h: int
 
+    @property
+    def y(self) -> int:
+        return GROUND_Y - self.h
+
     def rect(self) -> pygame.Rect:
         return pygame.Rect(int(self.x), GROUND_Y - self.h, self.w, self.h)
 
     def update(self, dx: float):
         self.x -= dx
 
-    def draw(self, surf: pygame.Surface, color):
-        pygame.draw.rect(surf, color, self.rect(), border_radius=6)
+    def draw(self, surf: pygame.Surface, color, pos=None):
+        x = pos[0] if pos is not None else self.x
+        sprite, _, _ = SPRITES.rect(color, self.w, self.h, 6)
+        surf.blit(sprite, (int(x), GROUND_Y - self.h))
+
+
+class ObstaclePool:
+    """
+    The live obstacles, left to right, in a fixed ring of reusable Obstacle objects.
+
+        slots: [ . . A B C D . . ]      head -> A, count = 4
+                     ^left     ^right
+
+    Obstacles enter on the right and leave on the left, all moving at the same
+    speed, so they are always sorted by x:
+      spawn()     -> fills the slot after the rightmost one (no new object)
+      cull()      -> just moves head past the ones that left the screen
+      rightmost() -> O(1), it's the last one
+    One slot is always kept spare (the ring grows if needed), so an obstacle that is
+    culled is never respawned in the same tick (interpolation would slide it across).
+    """
+    def __init__(self, capacity: int = 16):
+        self.slots = [Obstacle(0.0, 0, 0) for _ in range(capacity)]
+        self.head = 0
+        self.count = 0
+        self.created = capacity  # Obstacle objects ever made (stays flat in steady state)
+        self._rects = []    # reusable Rects for collidelist(), one per live obstacle
+        self._spare_rects = []
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        slots, cap = self.slots, len(self.slots)
+        for i in range(self.count):
+            yield slots[(self.head + i) % cap]
+
+    def __getitem__(self, i: int) -> Obstacle:
+        """i-th obstacle from the left (negative counts from the right)."""
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("obstacle index out of range")
+        return self.slots[(self.head + i) % len(self.slots)]
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def rightmost(self) -> float:
+        """Right edge of the rightmost obstacle (0 if there are none)."""
+        if self.count == 0:
+            return 0
+        ob = self.slots[(self.head + self.count - 1) % len(self.slots)]
+        return ob.x + ob.w
+
+    def spawn(self, x: float, w: int, h: int) -> Obstacle:
+        if self.count + 1 >= len(self.slots):
+            self._grow()
+        ob = self.slots[(self.head + self.count) % len(self.slots)]
+        ob.x, ob.w, ob.h = x, w, h
+        self.count += 1
+        return ob
+
+    def move(self, dx: float):
+        slots, cap = self.slots, len(self.slots)
+        i, end = self.head, self.head + self.count
+        while i < end:
+            slots[i % cap].x -= dx
+            i += 1
+
+    def cull(self, left: float):
+        """Drop obstacles whose right edge is at or left of `left`."""
+        slots, cap = self.slots, len(self.slots)
+        while self.count:
+            ob = slots[self.head]
+            if ob.x + ob.w > left:
+                break
+            self.head = (self.head + 1) % cap
+            self.count -= 1
+
+    # --- collision ---
+    def first_hit(self, left: int, top: int, right: int, bottom: int, dx: float = 0.0, dy: float = 0.0):
+        """
+        First obstacle overlapping the box (same test as Rect.colliderect), or None.
+        Walks left to right and stops at the first obstacle starting past the box:
+        only the few obstacles around the box's x-span are ever looked at.
+
+        dx, dy: how far the box moved relative to the obstacles during the tick (it
+        ENDED at left/top/right/bottom). If that's more than half its size, the whole
+        motion is swept (ccd.py), so fast ticks can't skip over an obstacle.
+        """
+        fast = 2 * abs(dx) > right - left or 2 * abs(dy) > bottom - top
+        span_left, span_right = min(left, left - dx), max(right, right - dx)
+        slots, cap = self.slots, len(self.slots)
+        i, end = self.head, self.head + self.count
+        while i < end:
+            ob = slots[i % cap]
+            i += 1
+            x = int(ob.x)
+            if x >= span_right:
+                return None  # this one and everything after it is further right
+            if x + ob.w <= span_left:
+                continue
+            ob_top = GROUND_Y - ob.h
+            if x + ob.w > left and x < right and ob_top < bottom and GROUND_Y > top:
+                return ob
+            if fast and swept_aabb_toi(left - dx, top - dy, right - dx, bottom - dy, dx, dy,
+                                       x, ob_top, x + ob.w, GROUND_Y) is not None:
+                return ob
+        return None
+
+    def collidelist(self, rect: pygame.Rect):
+        """Alternative to first_hit(): one Rect.collidelist call over reused Rects."""
+        rects, spare = self._rects, self._spare_rects
+        while len(rects) < self.count:
+            rects.append(spare.pop() if spare else pygame.Rect(0, 0, 0, 0))
+        while len(rects) > self.count:
+            spare.append(rects.pop())
+        slots, cap = self.slots, len(self.slots)
+        for k in range(self.count):
+            ob = slots[(self.head + k) % cap]
+            r = rects[k]
+            r.x = int(ob.x)
+            r.y = GROUND_Y - ob.h
+            r.w = ob.w
+            r.h = ob.h
+        k = rect.collidelist(rects)
+        return None if k < 0 else slots[(self.head + k) % cap]
+
+    def _grow(self):
+        live = list(self)
+        extra = len(self.slots)
+        spare = [Obstacle(0.0, 0, 0) for _ in range(extra)]
+        self.created += extra
+        dead = [self.slots[(self.head + self.count + i) % len(self.slots)]
+                for i in range(len(self.slots) - self.count)]
+        self.slots = live + dead + spare
+        self.head = 0
@@ -1,28 +1,62 @@
+import random
 import sys
 import pygame
 
-from settings import WIDTH, HEIGHT, FPS, PLAYER_H, GROUND_Y
-from states import STATE_MENU, STATE_PLAY, STATE_GAME_OVER
+from settings import (WIDTH, HEIGHT, FPS, TICK_RATE, MAX_SUBSTEPS, RENDER_MODE, TRACE_PATH,
+                      COLLISION, PLAYER_W, PLAYER_H, GROUND_Y)
+from states import (STATE_MENU, STATE_PLAY, STATE_GAME_OVER,
+                    ACT_JUMP, ACT_BACK, ACT_RESTART, ACT_SUBMIT)
 from entities import Player
 from world import World
 from ui import UI
-from db import add_score
+from db import store, best_score
+from score_writer import ScoreWriter
+from loop import FixedTimestep
+from renderer import Renderer
+from profiler import FrameProfiler, ProfilerOverlay
+from replay import Recorder, Replay, CHECK_EVERY, checksum
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless: bool = False, seed: int = None, record: str = None):
+        """
+        headless=True: no window and no score database. The screen is a plain
+        off-screen Surface, so update() (and even the draw_* methods) can be driven
+        by a script as fast as it likes. run()/present() need a real window.
+        seed: for the obstacle generator (default: a random one).
+        record: path to record every tick's input to (see replay.py).
+        """
         pygame.init()
-        pygame.display.set_caption("Endless Runner • Pygame + SQLite")
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.headless = headless
+        if headless:
+            self.screen = pygame.Surface((WIDTH, HEIGHT))
+        else:
+            pygame.display.set_caption("Endless Runner • Pygame + SQLite")
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.clock = pygame.time.Clock()
+        self.loop = FixedTimestep(tick_rate=TICK_RATE, max_substeps=MAX_SUBSTEPS)
 
         self.ui = UI()
-        self.world = World()
+        # Scores are saved on a background thread; the cached leaderboard is
+        # refreshed as soon as a save commits
+        self.scores = None if headless else ScoreWriter(on_commit=store().invalidate)
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.world = World(seed=self.seed)
+        # Batches blits; in "dirty" mode only changed rects reach the display
+        self.renderer = Renderer(self.screen, mode=RENDER_MODE,
+                                 background=self.world.static_background())
+        # F3 = performance overlay, F4 = record a Chrome trace
+        self.profiler = FrameProfiler()
+        self.overlay = ProfilerOverlay(self.profiler)
 
         self.state = STATE_MENU
+        self.drawn_state = None  # state shown on screen last frame
         self.name_input = ""
         self.game_over_score = 0
         # NOTE: use PLAYER_H here (small bugfix from earlier draft)
         self.player = Player(120, GROUND_Y - PLAYER_H)
+        # ACT_* bits pressed since the last tick; update() applies them (and records them)
+        self.actions = 0
+        self.recorder = Recorder(record, self.loop.step, self.seed) if record else None
 
     # --- lifecycle helpers ---
     def reset_run(self):
@@ -30,47 +64,52 @@ class Game:
         self.player = Player(120, GROUND_Y - PLAYER_H)
         self.game_over_score = 0
 
+    def quit(self):
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.scores is not None:
+            self.scores.close()  # make sure queued scores hit the disk
+        pygame.quit(); sys.exit()
+
     # --- event handling ---
     def handle_events(self):
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-
-            if self.state == STATE_MENU:
-                if e.type == pygame.KEYDOWN:
-                    if e.key in (pygame.K_SPACE, pygame.K_UP):
-                        self.reset_run()
-                        self.state = STATE_PLAY
-                    elif e.key == pygame.K_ESCAPE:
-                        pygame.quit(); sys.exit()
-
-            elif self.state == STATE_PLAY:
-                if e.type == pygame.KEYDOWN:
-                    if e.key in (pygame.K_SPACE, pygame.K_UP):
-                        self.player.jump()
-                    elif e.key == pygame.K_ESCAPE:
-                        self.reset_run()
-                        self.state = STATE_MENU
+                self.quit()
+            if e.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.renderer.invalidate()
+            if e.type == pygame.KEYDOWN and e.key == pygame.K_F3:
+                self.overlay.toggle()
+                continue
+            if e.type == pygame.KEYDOWN and e.key == pygame.K_F4:
+                if self.profiler.recording:
+                    n = self.profiler.stop_trace(TRACE_PATH)
+                    print(f"wrote {n} trace events to {TRACE_PATH}")
+                else:
+                    self.profiler.start_trace()
+                continue
 
+            # Anything that changes the simulation becomes an ACT_* bit for the next
+            # tick; only quitting and typing a name happen right here
+            if e.type != pygame.KEYDOWN:
+                continue
+            if e.key in (pygame.K_SPACE, pygame.K_UP):
+                self.actions |= ACT_JUMP
+            elif e.key == pygame.K_ESCAPE:
+                if self.state == STATE_MENU:
+                    self.quit()
+                self.actions |= ACT_BACK
             elif self.state == STATE_GAME_OVER:
-                if e.type == pygame.KEYDOWN:
-                    if e.key == pygame.K_RETURN:
-                        add_score(self.name_input or "Player", self.game_over_score)
-                        self.reset_run()
-                        self.state = STATE_MENU
-                    elif e.key == pygame.K_BACKSPACE:
-                        self.name_input = self.name_input[:-1]
-                    elif e.key == pygame.K_r:
-                        self.reset_run()
-                        self.state = STATE_PLAY
-                    elif e.key == pygame.K_ESCAPE:
-                        self.reset_run()
-                        self.state = STATE_MENU
-                    else:
-                        if len(self.name_input) < 16:
-                            ch = e.unicode
-                            if ch.isprintable() and not ch.isspace():
-                                self.name_input += ch
+                if e.key == pygame.K_RETURN:
+                    self.actions |= ACT_SUBMIT
+                elif e.key == pygame.K_r:
+                    self.actions |= ACT_RESTART
+                elif e.key == pygame.K_BACKSPACE:
+                    self.name_input = self.name_input[:-1]
+                elif len(self.name_input) < 16:
+                    ch = e.unicode
+                    if ch.isprintable() and not ch.isspace():
+                        self.name_input += ch
 
     # --- update/draw per-state ---
     def update_menu(self, dt: float):
@@ -81,48 +120,146 @@ class Game:
         self.world.update_menu(dt)
 
     def update_play(self, dt: float):
-        self.player.update()
+        y0 = self.player.y
+        self.player.update(dt)
         self.world.update_play(dt)
-        # Collision check
-        pr = self.player.rect()
-        for ob in self.world.obstacles:
-            if pr.colliderect(ob.rect()):
-                self.state = STATE_GAME_OVER
-                self.game_over_score = int(self.world.distance // 5)
-                self.name_input = ""
-                break
+        # Collision check (obstacles are sorted by x; see ObstaclePool)
+        if COLLISION == "collidelist":
+            hit = self.world.obstacles.collidelist(self.player.rect())
+        else:
+            # relative to the obstacles, the player moved right by the scroll step
+            x, y = int(self.player.x), int(self.player.y)
+            hit = self.world.obstacles.first_hit(x, y, x + PLAYER_W, y + PLAYER_H,
+                                                 dx=self.world.last_step, dy=self.player.y - y0)
+        if hit is not None:
+            self.state = STATE_GAME_OVER
+            self.game_over_score = int(self.world.distance // 5)
+            self.name_input = ""
+
+    def apply_actions(self, actions: int):
+        if self.state == STATE_MENU:
+            if actions & ACT_JUMP:
+                self.reset_run()
+                self.state = STATE_PLAY
+        elif self.state == STATE_PLAY:
+            if actions & ACT_BACK:
+                self.reset_run()
+                self.state = STATE_MENU
+            elif actions & ACT_JUMP:
+                self.player.jump()
+        elif self.state == STATE_GAME_OVER:
+            if actions & ACT_SUBMIT:
+                if self.scores is not None:
+                    self.scores.submit(self.name_input or "Player", self.game_over_score)
+                self.reset_run()
+                self.state = STATE_MENU
+            elif actions & ACT_RESTART:
+                self.reset_run()
+                self.state = STATE_PLAY
+            elif actions & ACT_BACK:
+                self.reset_run()
+                self.state = STATE_MENU
+
+    def checksum(self) -> int:
+        """Of the simulation state, for replay checkpoints."""
+        p = self.player
+        return checksum(self.state, self.world.distance, p.y, p.vy, len(self.world.obstacles))
+
+    def update(self, dt: float):
+        """One fixed simulation tick for whatever state we're in."""
+        actions, self.actions = self.actions, 0
+        if actions:
+            self.apply_actions(actions)
+        if self.state == STATE_MENU:
+            self.update_menu(dt)
+        elif self.state == STATE_PLAY:
+            self.update_play(dt)
+
+        rec = self.recorder
+        if rec is not None:
+            rec.tick(actions)
+            if rec.ticks % CHECK_EVERY == 0:
+                rec.checkpoint(self.checksum())
 
     def draw_world(self):
-        self.world.draw_background(self.screen)
-        self.world.draw_obstacles(self.screen)
-        self.player.draw(self.screen)
+        # Draw between the last two ticks (smooth even when render rate != tick rate)
+        lerp = self.loop.lerp
+        r = self.renderer
+        r.begin()  # static background (whole screen, or just last frame's rects)
+        r.mark(self.world.draw_layers(self.screen))
+        self.world.draw_obstacles(r, lerp)
+        self.player.draw(r, lerp(self.player))
 
     def draw_menu(self):
+        # Menus aren't hot: full repaint, and text drawn straight on the screen
+        self.renderer.invalidate()
         self.draw_world()
+        self.renderer.flush()
         self.ui.draw_menu(self.screen, WIDTH, 90, 220)
 
     def draw_play(self):
         self.draw_world()
         score = int(self.world.distance // 5)
-        self.ui.draw_score_hud(self.screen, score)
+        with self.profiler.section("best_score"):
+            best = best_score()
+        self.ui.draw_score_hud(self.renderer, score, best)
 
     def draw_game_over(self):
+        self.renderer.invalidate()
         self.draw_world()
+        self.renderer.flush()
         self.ui.draw_game_over(self.screen, WIDTH, self.game_over_score, self.name_input)
 
     # --- main loop ---
     def run(self):
+        prof = self.profiler
         while True:
-            dt = self.clock.tick(FPS) / 1000.0
+            prof.begin_frame()
+            prof.phase("Time")
+            frame_time = self.clock.tick(FPS) / 1000.0
+            prof.phase("Events")
             self.handle_events()
 
+            # Fixed ticks (0..MAX_SUBSTEPS of them), then one draw
+            prof.phase("Update")
+            self.loop.advance(frame_time, self.update, [self.player, *self.world.obstacles])
+
+            if self.state != self.drawn_state:  # different screen layout -> repaint all
+                self.renderer.invalidate()
+                self.drawn_state = self.state
+
+            prof.phase("Draw")
             if self.state == STATE_MENU:
-                self.update_menu(dt)
                 self.draw_menu()
             elif self.state == STATE_PLAY:
-                self.update_play(dt)
                 self.draw_play()
             elif self.state == STATE_GAME_OVER:
                 self.draw_game_over()
+            panel = self.overlay.draw()
+            if panel is not None:
+                self.renderer.blit(panel, (WIDTH - panel.get_width() - 10, 10))
+
+            prof.phase("Present")
+            self.renderer.present()
+            prof.count("obstacles", len(self.world.obstacles))
+            prof.count("draw calls", self.renderer.blit_count)
+            prof.end_frame()
+
 
-            pygame.display.flip()
+def play(rec, verify: bool = True):
+    """
+    Run a recording (a replay.Replay or a path) through a headless Game at full speed.
+    Returns the Game after the last tick.
+    verify: raise RuntimeError at the first checkpoint that doesn't match.
+    """
+    if not isinstance(rec, Replay):
+        rec = Replay(rec)
+    game = Game(headless=True, seed=rec.seed)
+    checkpoints = rec.checkpoints if verify else {}
+    for tick, bits in enumerate(rec.inputs, 1):
+        game.actions = bits
+        game.update(rec.step)
+        expected = checkpoints.get(tick)
+        if expected is not None and expected != game.checksum():
+            raise RuntimeError(f"replay diverged from the recording by tick {tick}")
+    return game
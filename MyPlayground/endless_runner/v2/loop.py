@@ -0,0 +1,62 @@
+# Fixed timestep = the simulation always advances in equal slices of time,
+# no matter how fast or slow frames are drawn.
+#
+#   frame time --> accumulator --> run N ticks of exactly `step` seconds
+#                                  (leftover stays in the accumulator)
+#
+# Rendering happens "between" two ticks, so positions are blended with
+# alpha = leftover / step to keep motion smooth when render rate != tick rate.
+# If a frame takes so long that we'd need more than max_substeps ticks to catch up,
+# the extra time is dropped (the "spiral of death" guard: otherwise slow frames
+# cause more ticks, which cause slower frames, ...).
+#
+# Also copied into the other game; keep the copies in sync (benchmarks/check_copies.py).
+
+
+class FixedTimestep:
+    def __init__(self, tick_rate: float = 60, max_substeps: int = 5):
+        self.step = 1.0 / tick_rate   # seconds per tick
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0
+        self.alpha = 0.0              # 0..1, how far we are between the last two ticks
+        self.ticks = 0                # total ticks run so far
+        self.dropped = 0.0            # total seconds thrown away by the guard
+        self._prev = {}               # id(object) -> (object, x, y) before the latest tick
+
+    def advance(self, frame_time: float, update, objects=()) -> int:
+        """
+        Feed in real elapsed seconds, run as many update(step) ticks as fit.
+        objects: things with x/y whose pre-tick positions are remembered for lerp().
+        Returns how many ticks ran this frame.
+        """
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator >= self.step:
+            if steps == self.max_substeps:
+                # too far behind: drop the backlog, keep the partial tick
+                backlog = self.accumulator - self.accumulator % self.step
+                self.dropped += backlog
+                self.accumulator -= backlog
+                break
+            self.snapshot(objects)
+            update(self.step)
+            self.accumulator -= self.step
+            self.ticks += 1
+            steps += 1
+
+        self.alpha = self.accumulator / self.step
+        return steps
+
+    def snapshot(self, objects) -> None:
+        prev = self._prev
+        prev.clear()
+        for o in objects:
+            prev[id(o)] = (o, o.x, o.y)  # by id: dataclasses aren't hashable
+
+    def lerp(self, o):
+        """Render position of o: blend of its position before and after the latest tick."""
+        p = self._prev.get(id(o))
+        if p is None or p[0] is not o:  # new since the last tick (or never tracked)
+            return o.x, o.y
+        a = self.alpha
+        return p[1] + (o.x - p[1]) * a, p[2] + (o.y - p[2]) * a
@@ -1,4 +1,23 @@
-from game import Game
+import argparse
+
+from game import Game, play
 
 if __name__ == "__main__":
-    Game().run()
+    parser = argparse.ArgumentParser(description="Endless runner")
+    parser.add_argument("--seed", type=int, help="obstacle generator seed (default: random)")
+    parser.add_argument("--record", metavar="PATH", help="record this session's input (replay.py)")
+    parser.add_argument("--replay", metavar="PATH", help="re-run a recording headless, as fast as possible")
+    args = parser.parse_args()
+
+    if args.replay:
+        import time
+        from replay import Replay
+
+        rec = Replay(args.replay)
+        t = time.perf_counter()
+        game = play(rec)
+        s = time.perf_counter() - t
+        print(f"replayed {len(rec)} ticks ({len(rec) * rec.step / 60:.1f} min of play) in {s:.2f} s "
+              f"({len(rec) / s:.0f} ticks/s), state={game.state}, distance={game.world.distance:.0f}")
+    else:
+        Game(seed=args.seed, record=args.record).run()
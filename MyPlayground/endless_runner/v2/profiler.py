@@ -0,0 +1,229 @@
+import json
+from array import array
+from time import perf_counter_ns
+
+import pygame
+
+from text_cache import GlyphAtlas
+
+# FrameProfiler = a stopwatch for each phase of the main loop.
+#
+#   profiler.begin_frame()
+#   profiler.phase("Time")      ... work ...
+#   profiler.phase("Physics")   ... work ...     (starting a phase ends the previous one)
+#   with profiler.section("best_score"):         (optional: time something INSIDE a phase;
+#       ...                                       its time also counts toward that phase)
+#   profiler.count("objects", len(world.objects))
+#   profiler.end_frame()
+#
+# Every phase has a ring buffer holding its time (ns) for the last `capacity` frames,
+# so the numbers cost nothing to keep and nothing to throw away.
+# start_trace()/stop_trace(path) additionally records every phase as an event and
+# writes a Chrome trace (open it in chrome://tracing or https://ui.perfetto.dev).
+#
+# ProfilerOverlay draws it: frame-time graph, one bar per phase, counters.
+#
+# Also copied into the other game; keep the copies in sync (benchmarks/check_copies.py).
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+
+    def __exit__(self, *exc):
+        self.profiler._add(self.name, self.start, perf_counter_ns())
+
+
+class FrameProfiler:
+    def __init__(self, capacity: int = 240):
+        self.capacity = capacity
+        self.frames = 0                                 # frames completed so far
+        self.frame_ns = array("q", bytes(8 * capacity))  # ring: whole frame time
+        self.phases = {}                                # name -> ring of times (in first-seen order)
+        self.counters = {}                              # name -> latest value
+        self._slot = 0
+        self._frame_start = 0
+        self._phase = None
+        self._phase_start = 0
+        self._sections = {}                             # name -> reusable _Section
+        self._trace = None                              # list of (name, start_ns, dur_ns) while recording
+        self._trace_limit = 0
+
+    # --- recording ---
+    def begin_frame(self) -> None:
+        self._slot = slot = self.frames % self.capacity
+        for ring in self.phases.values():
+            ring[slot] = 0
+        self._phase = None
+        self._frame_start = perf_counter_ns()
+
+    def phase(self, name: str) -> None:
+        """End the running phase (if any) and start timing `name`."""
+        now = perf_counter_ns()
+        if self._phase is not None:
+            self._add(self._phase, self._phase_start, now)
+        self._phase = name
+        self._phase_start = now
+
+    def section(self, name: str) -> _Section:
+        """Context manager timing a block inside the current phase."""
+        s = self._sections.get(name)
+        if s is None:
+            s = self._sections[name] = _Section(self, name)
+        return s
+
+    def count(self, name: str, value) -> None:
+        self.counters[name] = value
+
+    def end_frame(self) -> None:
+        now = perf_counter_ns()
+        if self._phase is not None:
+            self._add(self._phase, self._phase_start, now)
+            self._phase = None
+        self.frame_ns[self._slot] = now - self._frame_start
+        if self._trace is not None and len(self._trace) < self._trace_limit:
+            self._trace.append(("frame", self._frame_start, now - self._frame_start))
+        self.frames += 1
+
+    def _add(self, name, start, end):
+        ring = self.phases.get(name)
+        if ring is None:
+            ring = self.phases[name] = array("q", bytes(8 * self.capacity))
+        ring[self._slot] += end - start
+        if self._trace is not None and len(self._trace) < self._trace_limit:
+            self._trace.append((name, start, end - start))
+
+    # --- reading ---
+    def _filled(self) -> int:
+        return min(self.frames, self.capacity)
+
+    def average_ms(self, name: str = None) -> float:
+        """Average over the buffered frames: one phase/section, or the whole frame (None)."""
+        n = self._filled()
+        if n == 0:
+            return 0.0
+        ring = self.frame_ns if name is None else self.phases.get(name)
+        if ring is None:
+            return 0.0
+        return sum(ring[:n]) / n / 1e6
+
+    def frame_times_ms(self) -> list:
+        """Whole-frame times, oldest first."""
+        n = self._filled()
+        start = self.frames % self.capacity if self.frames > self.capacity else 0
+        ring = self.frame_ns
+        return [ring[(start + i) % self.capacity] / 1e6 for i in range(n)]
+
+    # --- Chrome trace ---
+    @property
+    def recording(self) -> bool:
+        return self._trace is not None
+
+    def start_trace(self, max_events: int = 500_000) -> None:
+        self._trace = []
+        self._trace_limit = max_events
+
+    def stop_trace(self, path) -> int:
+        """Stop recording and write the Chrome trace JSON. Returns the number of events."""
+        events = self._trace or []
+        self._trace = None
+        with open(path, "w") as f:
+            json.dump({
+                "displayTimeUnit": "ms",
+                "traceEvents": [
+                    {"name": name, "cat": "frame", "ph": "X", "pid": 1, "tid": 1,
+                     "ts": start / 1000, "dur": dur / 1000}
+                    for name, start, dur in events
+                ],
+            }, f)
+        return len(events)
+
+
+PHASE_COLORS = [(255, 99, 132), (54, 162, 235), (255, 206, 86), (75, 192, 192),
+                (153, 102, 255), (255, 159, 64), (120, 220, 120), (200, 200, 200)]
+
+
+class ProfilerOverlay:
+    """
+    Toggleable performance panel. draw() returns the panel Surface (or None when hidden);
+    blit it wherever you like, e.g. renderer.blit(panel, (10, 10)).
+    Bars are scaled so the full width = one 60 fps frame (16.7 ms).
+    The panel is rebuilt every `refresh_every` frames, so watching doesn't cost much.
+    """
+    def __init__(self, profiler: FrameProfiler, font: pygame.font.Font = None, width: int = 320,
+                 refresh_every: int = 10):
+        self.profiler = profiler
+        self.font = font or pygame.font.SysFont("consolas", 14)
+        self.glyphs = GlyphAtlas(self.font, (230, 230, 230))
+        self.width = width
+        self.visible = False
+        self.budget_ms = 1000 / 60
+        self.graph_h = 60
+        self.refresh_every = refresh_every
+        self._panel = None
+        self._built_at = 0
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+        self._panel = None
+
+    def draw(self):
+        if not self.visible:
+            return None
+        p = self.profiler
+        if self._panel is None or p.frames - self._built_at >= self.refresh_every:
+            self._panel = self._build()
+            self._built_at = p.frames
+        return self._panel
+
+    def _value(self, panel, text, right, y):
+        self.glyphs.draw(panel, text, (right - self.glyphs.width(text), y))
+
+    def _build(self):
+        p = self.profiler
+        line = self.glyphs.height + 2
+        rows = len(p.phases) + len(p.counters) + 1
+        w, pad = self.width, 6
+        h = pad + self.graph_h + pad + rows * line + pad
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+
+        # Frame-time graph: one column per frame, newest on the right; line = budget
+        scale = self.graph_h / (2 * self.budget_ms)
+        bottom = pad + self.graph_h
+        times = p.frame_times_ms()[-(w - 2 * pad):]
+        x = w - pad - len(times)
+        for ms in times:
+            bar = min(self.graph_h, int(ms * scale))
+            color = (120, 220, 120) if ms <= self.budget_ms else (255, 99, 99)
+            pygame.draw.line(panel, color, (x, bottom), (x, bottom - bar))
+            x += 1
+        budget_y = bottom - int(self.budget_ms * scale)
+        pygame.draw.line(panel, (255, 255, 255), (pad, budget_y), (w - pad, budget_y))
+
+        # Per-phase bars + numbers
+        y = bottom + pad
+        label_w = w // 2
+        self.glyphs.draw(panel, "frame (ms)", (pad, y))
+        self._value(panel, f"{p.average_ms():.2f}", label_w - pad, y)
+        y += line
+        for i, name in enumerate(p.phases):
+            ms = p.average_ms(name)
+            bar = min(w - label_w - pad, int(ms / self.budget_ms * (w - label_w - pad)))
+            pygame.draw.rect(panel, PHASE_COLORS[i % len(PHASE_COLORS)],
+                             (label_w, y + 2, max(1, bar), line - 4))
+            self.glyphs.draw(panel, name, (pad, y))
+            self._value(panel, f"{ms:.2f}", label_w - pad, y)
+            y += line
+        for name, value in p.counters.items():
+            self.glyphs.draw(panel, name, (pad, y))
+            self._value(panel, str(value), label_w - pad, y)
+            y += line
+        return panel
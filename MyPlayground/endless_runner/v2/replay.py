@@ -0,0 +1,99 @@
+import struct
+import zlib
+
+# Record/replay: everything that can change the simulation, one tick at a time.
+#
+# The simulation only depends on (a) the seed of its random generator (if any) and
+# (b) the input bits applied at each tick (ACT_* in the runner's states.py,
+# Controller.bits in the physics demo), so that's all a recording holds:
+#
+#   header   magic "RPLY", version, seconds per tick, seed
+#   body     one byte per tick with input   0x00..0x7E  = the input bits
+#            runs of idle ticks             0x80..0xFF  = (b & 0x7F) + 1 ticks, no input
+#            checkpoint                     0x7F + tick number + state checksum
+#
+# A 30 minute session is ~108k ticks, mostly idle: a few KB.
+# Checkpoints let a replay notice that it no longer does what the recording did
+# (a code change altered the simulation) instead of silently diverging.
+#
+#   runner:        python main.py --record run.rply / --replay run.rply  (game.play)
+#   physics demo:  main.py RECORD_PATH = "orbit.rply", benchmarks/bench_replay.py
+# Also copied into the other game; keep the copies in sync (benchmarks/check_copies.py).
+
+MAGIC = b"RPLY"
+VERSION = 1
+HEADER = struct.Struct("<4sHHdQ")  # magic, version, unused, tick step (s), seed
+CHECK = struct.Struct("<QI")       # tick, checksum
+CHECKPOINT = 0x7F
+IDLE = 0x80
+MAX_IDLE = 128
+CHECK_EVERY = 600                  # ticks between checkpoints (10 s at 60 Hz)
+
+
+def checksum(*values) -> int:
+    """CRC of some floats/ints/strings: cheap, and the same in every process (unlike hash())."""
+    return zlib.crc32(repr(values).encode())
+
+
+class Recorder:
+    def __init__(self, path, step: float, seed: int):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, 0, step, seed))
+        self.ticks = 0
+        self._idle = 0
+
+    def tick(self, bits: int) -> None:
+        """Input bits applied at the start of the next tick (0 = nothing pressed)."""
+        if bits >= CHECKPOINT:
+            raise ValueError(f"input bits {bits:#x} don't fit in 7 bits")
+        self.ticks += 1
+        if bits == 0:
+            self._idle += 1
+            if self._idle == MAX_IDLE:
+                self._flush_idle()
+            return
+        self._flush_idle()
+        self.file.write(bytes((bits,)))
+
+    def checkpoint(self, value: int) -> None:
+        """Checksum of the state after the current tick."""
+        self._flush_idle()
+        self.file.write(bytes((CHECKPOINT,)) + CHECK.pack(self.ticks, value))
+
+    def _flush_idle(self):
+        if self._idle:
+            self.file.write(bytes((IDLE | (self._idle - 1),)))
+            self._idle = 0
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self._flush_idle()
+            self.file.close()
+
+
+class Replay:
+    """A recording, decoded: inputs[i] = bits for tick i, checkpoints = {tick: checksum}."""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, _, self.step, self.seed = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a version {VERSION} recording")
+        self.inputs = bytearray()
+        self.checkpoints = {}
+        i = HEADER.size
+        while i < len(data):
+            b = data[i]
+            i += 1
+            if b & IDLE:
+                self.inputs.extend(bytes((b & 0x7F) + 1))
+            elif b == CHECKPOINT:
+                tick, value = CHECK.unpack_from(data, i)
+                self.checkpoints[tick] = value
+                i += CHECK.size
+            else:
+                self.inputs.append(b)
+
+    def __len__(self):
+        return len(self.inputs)
+
@@ -0,0 +1,87 @@
+import atexit
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from db import DB_PATH, SCHEMA
+
+# ScoreWriter = saves scores on a background thread so the game never waits on the disk.
+#   submit() drops the score in a queue and returns right away with a Future.
+#   The worker takes everything waiting in the queue, inserts it in ONE transaction
+#   (one commit/fsync for the whole batch), then resolves the Futures.
+#   close() (also run automatically at exit) writes whatever is left and stops the thread.
+
+_STOP = object()
+
+
+class ScoreWriter:
+    def __init__(self, path=DB_PATH, batch_size: int = 1000,
+                 on_commit: Optional[Callable[[], None]] = None):
+        """on_commit: called (on the worker thread) after each batch is saved."""
+        self.path = path
+        self.batch_size = batch_size
+        self.on_commit = on_commit
+        self.queue = queue.Queue()
+        self.written = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ScoreWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, player: str, points: int) -> Future:
+        """Queue one score. The Future resolves (to None) once it's committed."""
+        if self._closed:
+            raise RuntimeError("ScoreWriter is closed")
+        player = (player or "Player").strip() or "Player"
+        fut = Future()
+        self.queue.put((player, points, fut))
+        return fut
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush everything queued so far, then stop the worker."""
+        if self._closed:
+            return
+        self._closed = True
+        self.queue.put(_STOP)
+        self._thread.join(timeout)
+
+    # --- worker thread ---
+    def _run(self):
+        # SQLite connections belong to the thread that made them -> open it here
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            conn.executescript(SCHEMA)
+
+        running = True
+        while running:
+            batch = [self.queue.get()]  # wait for work
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())  # grab whatever else is waiting
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                running = False
+                batch = [item for item in batch if item is not _STOP]
+            if batch:
+                self._write(conn, batch)
+        conn.close()
+
+    def _write(self, conn, batch):
+        try:
+            with conn:
+                conn.executemany("INSERT INTO scores(player, points) VALUES (?, ?)",
+                                 [(player, points) for player, points, _ in batch])
+        except sqlite3.Error as e:
+            for _, _, fut in batch:
+                fut.set_exception(e)
+            return
+        self.written += len(batch)
+        if self.on_commit is not None:
+            self.on_commit()
+        for _, _, fut in batch:
+            fut.set_result(None)
@@ -3,7 +3,14 @@ from pathlib import Path
 # Screen / world
 WIDTH, HEIGHT = 900, 520
 GROUND_Y = HEIGHT - 80
-FPS = 60
+FPS = 0           # render cap (0 = uncapped); the simulation runs at TICK_RATE
+TICK_RATE = 60    # fixed simulation ticks per second (see loop.py)
+MAX_SUBSTEPS = 5  # catch-up limit per frame before time is dropped
+RENDER_MODE = "dirty"  # "flip" = redraw whole window, "dirty" = only what changed (renderer.py)
+TRACE_PATH = "frame_trace.json"  # F4 starts/stops recording a Chrome trace (profiler.py)
+# "sweep" = walk obstacles by x around the player, swept for fast ticks (ccd.py);
+# "collidelist" = one Rect batch call, end-of-tick overlap only
+COLLISION = "sweep"
 
 # Player
 PLAYER_W, PLAYER_H = 50, 60
@@ -23,6 +30,7 @@ OB_GAP_MIN = 220
 # Colors
 BG = (22, 22, 28)
 GROUND = (40, 40, 55)
+STRIPE_COLOR = (55, 55, 75)
 PLAYER_COLOR = (240, 240, 255)
 OB_COLOR = (90, 210, 140)
 TEXT = (230, 233, 240)
@@ -0,0 +1,69 @@
+import math
+import struct
+from array import array
+
+from states import STATE_MENU, STATE_PLAY, STATE_GAME_OVER
+
+# Snapshot = the whole simulation state of a Game as one small bytes blob:
+# quick-save, rollback, or fork a run to look ahead ("what if I jump now?").
+#
+#   data = save(game)
+#   ... play on ...
+#   load(game, data)      # back to exactly where it was, obstacles and RNG included
+#
+# Layout (little-endian, versioned):
+#   header     magic "RSNP", version, state, obstacle count, game over score
+#   numbers    player x, y, vy, world distance, scroll, time_since_spawn, last_step,
+#              random gauss_next (NaN = none), player on_ground
+#   obstacles  count x (x float64, w int32, h int32), left to right
+#   rng        624 + 1 uint32: the Mersenne Twister state of world.rng
+# About 2.6 KB, most of it the RNG. Drawing state (renderer, background, lerp)
+# isn't saved: it follows from the simulation on the next frame.
+
+MAGIC = b"RSNP"
+VERSION = 1
+STATES = (STATE_MENU, STATE_PLAY, STATE_GAME_OVER)
+HEADER = struct.Struct("<4sHHIi")  # magic, version, state, obstacle count, game over score
+NUMBERS = struct.Struct("<8d?")
+OBSTACLE = struct.Struct("<dii")
+RNG_WORDS = 625
+
+
+def save(game) -> bytes:
+    world, p = game.world, game.player
+    rng_version, words, gauss = world.rng.getstate()
+    parts = [
+        HEADER.pack(MAGIC, VERSION, STATES.index(game.state), len(world.obstacles),
+                    game.game_over_score),
+        NUMBERS.pack(p.x, p.y, p.vy, world.distance, world.scroll, world.time_since_spawn,
+                     world.last_step, math.nan if gauss is None else gauss, p.on_ground),
+    ]
+    parts.extend(OBSTACLE.pack(ob.x, ob.w, ob.h) for ob in world.obstacles)
+    parts.append(array("I", words).tobytes())
+    return b"".join(parts)
+
+
+def load(game, data) -> None:
+    """Put a Game back into a save()d state (in place: same Player/World objects)."""
+    magic, version, state, count, score = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a runner snapshot")
+    if version != VERSION:
+        raise ValueError(f"snapshot version {version}, expected {VERSION}")
+    world, p = game.world, game.player
+    offset = HEADER.size
+    (p.x, p.y, p.vy, world.distance, world.scroll, world.time_since_spawn,
+     world.last_step, gauss, p.on_ground) = NUMBERS.unpack_from(data, offset)
+    offset += NUMBERS.size
+
+    world.obstacles.clear()
+    for x, w, h in OBSTACLE.iter_unpack(data[offset:offset + count * OBSTACLE.size]):
+        world.obstacles.spawn(x, w, h)
+    offset += count * OBSTACLE.size
+
+    words = array("I")
+    words.frombytes(data[offset:offset + 4 * RNG_WORDS])
+    world.rng.setstate((3, tuple(words), None if math.isnan(gauss) else gauss))
+
+    game.state = STATES[state]
+    game.game_over_score = score
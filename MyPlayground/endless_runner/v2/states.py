@@ -1,3 +1,10 @@
 STATE_MENU = "menu"
 STATE_PLAY = "play"
 STATE_GAME_OVER = "game_over"
+
+# Input, as bits applied at the start of a tick (so a recording can replay it, replay.py).
+# What each one does depends on the state: ACT_JUMP also starts a run from the menu.
+ACT_JUMP = 1     # Space / Up
+ACT_BACK = 2     # Esc (back to the menu)
+ACT_RESTART = 4  # R on the game over screen
+ACT_SUBMIT = 8   # Enter on the game over screen (save the score)
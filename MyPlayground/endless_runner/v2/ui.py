@@ -1,40 +1,48 @@
 import pygame
 from settings import FONT_NAME, FONT_SIZE, FONT_BIG, TEXT, ACCENT
 from db import best_score, top_scores
+from text_cache import TextCache, GlyphAtlas
 
 class UI:
     def __init__(self):
         self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE)
         self.big = pygame.font.SysFont(FONT_NAME, FONT_BIG, bold=True)
+        # Rendered text is reused until it changes; the score counter is built from glyphs
+        self.text = TextCache()
+        self.score_glyphs = GlyphAtlas(self.font, TEXT)
 
-    def draw_score_hud(self, screen, score: int):
-        s = self.font.render(f"Score: {score}", True, TEXT)
-        b = self.font.render(f"Best: {best_score()}", True, ACCENT)
-        screen.blit(s, (20, 16))
+    def render(self, font, text, color):
+        return self.text.render(font, text, color)
+
+    def draw_score_hud(self, screen, score: int, best: int = None):
+        self.score_glyphs.draw(screen, f"Score: {score}", (20, 16))
+        if best is None:
+            best = best_score()
+        b = self.render(self.font, f"Best: {best}", ACCENT)
         screen.blit(b, (20, 46))
 
     def draw_menu(self, screen, width, title_y, scores_y):
-        title = self.big.render("ENDLESS RUNNER", True, ACCENT)
+        title = self.render(self.big, "ENDLESS RUNNER", ACCENT)
         screen.blit(title, (width//2 - title.get_width()//2, title_y))
-        tip = self.font.render("Press SPACE to Start • Esc to Quit", True, TEXT)
+        tip = self.render(self.font, "Press SPACE to Start • Esc to Quit", TEXT)
         screen.blit(tip, (width//2 - tip.get_width()//2, title_y + 60))
         scores = top_scores(5)
         y = scores_y
-        screen.blit(self.font.render("Top Scores:", True, TEXT), (width//2 - 80, y - 32))
+        screen.blit(self.render(self.font, "Top Scores:", TEXT), (width//2 - 80, y - 32))
         for i, (name, pts) in enumerate(scores, start=1):
-            line = self.font.render(f"{i:>2}. {name:12s}  {pts}", True, TEXT)
+            line = self.render(self.font, f"{i:>2}. {name:12s}  {pts}", TEXT)
             screen.blit(line, (width//2 - 120, y + (i-1) * 28))
 
     def draw_game_over(self, screen, width, score, name_input):
-        over = self.big.render("GAME OVER", True, (255, 120, 120))
+        over = self.render(self.big, "GAME OVER", (255, 120, 120))
         screen.blit(over, (width//2 - over.get_width()//2, 90))
-        s1 = self.font.render(f"Your Score: {score}", True, TEXT)
+        s1 = self.render(self.font, f"Your Score: {score}", TEXT)
         screen.blit(s1, (width//2 - s1.get_width()//2, 150))
-        s2 = self.font.render("Enter Name & Press ENTER to Save", True, TEXT)
+        s2 = self.render(self.font, "Enter Name & Press ENTER to Save", TEXT)
         screen.blit(s2, (width//2 - s2.get_width()//2, 190))
         entry_box = pygame.Rect(width//2 - 180, 230, 360, 40)
         pygame.draw.rect(screen, (70, 70, 95), entry_box, border_radius=8)
-        name_text = self.font.render(name_input or "Player", True, (255, 255, 255))
+        name_text = self.render(self.font, name_input or "Player", (255, 255, 255))
         screen.blit(name_text, (entry_box.x + 10, entry_box.y + 8))
-        s3 = self.font.render("Press R to restart • Esc for menu", True, TEXT)
+        s3 = self.render(self.font, "Press R to restart • Esc for menu", TEXT)
         screen.blit(s3, (width//2 - s3.get_width()//2, 290))
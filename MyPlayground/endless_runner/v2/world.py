@@ -1,29 +1,32 @@
 import math
 import random
-from typing import List
 import pygame
 
-from entities import Obstacle
+from background import build_static, ground_stripes
+from entities import ObstaclePool
 from settings import (
-    WIDTH, HEIGHT, GROUND_Y, GROUND, BG,
-    OB_MIN_W, OB_MAX_W, OB_MIN_H, OB_MAX_H,
+    WIDTH, OB_MIN_W, OB_MAX_W, OB_MIN_H, OB_MAX_H,
     OB_GAP_MIN, SPAWN_COOLDOWN_MIN, SPAWN_COOLDOWN_MAX,
     BASE_SPEED, OB_COLOR
 )
 
 class World:
-    def __init__(self):
-        self.obstacles: List[Obstacle] = []
+    def __init__(self, seed=None):
+        # Own random generator: the same seed spawns the same obstacles (replay.py)
+        self.rng = random.Random(seed)
+        self.obstacles = ObstaclePool()  # left to right, recycled (no allocations per frame)
         self.distance = 0.0
-        self.stripe_offset = 0.0
+        self.scroll = 0.0  # how far the background has moved (pixels, total)
         self.time_since_spawn = 0.0
-        # Pre-build ground stripes
-        self.ground_stripes = [pygame.Rect(i * 40, GROUND_Y + 30, 30, 5)
-                               for i in range((WIDTH // 40) + 4)]
+        self.last_step = 0.0  # how far obstacles moved in the last tick (for swept collision)
+        # Background surfaces are built once, on first use (after the display exists)
+        self.background = None
+        self.layers = []   # ParallaxLayer, back to front; add more for depth
 
     def reset(self):
         self.obstacles.clear()
         self.distance = 0.0
+        self.last_step = 0.0
         self.time_since_spawn = 0.0
 
     # --- difficulty ---
@@ -36,15 +39,11 @@ class World:
         return SPAWN_COOLDOWN_MAX * (1 - t) + SPAWN_COOLDOWN_MIN * t
 
     def maybe_spawn(self, speed: float):
-        w = random.randint(OB_MIN_W, OB_MAX_W)
-        h = random.randint(OB_MIN_H, OB_MAX_H)
-        if self.obstacles:
-            rightmost = max(ob.x + ob.w for ob in self.obstacles)
-        else:
-            rightmost = 0
+        w = self.rng.randint(OB_MIN_W, OB_MAX_W)
+        h = self.rng.randint(OB_MIN_H, OB_MAX_H)
         desired_gap = max(140, OB_GAP_MIN - (speed * 6))
-        if rightmost < WIDTH - desired_gap:
-            self.obstacles.append(Obstacle(WIDTH + random.randint(0, 60), w, h))
+        if self.obstacles.rightmost() < WIDTH - desired_gap:
+            self.obstacles.spawn(WIDTH + self.rng.randint(0, 60), w, h)
 
     # --- update loops ---
     def update_menu(self, dt: float):
@@ -53,32 +52,51 @@ class World:
         self.distance = 0.0
         self.time_since_spawn = 0.0
         # Mild background stripe motion so the menu isn't static
-        self.stripe_offset = (self.stripe_offset + BASE_SPEED * 0.6) % 40
+        self.scroll += BASE_SPEED * 0.6 * dt * 60
 
     def update_play(self, dt: float):
         speed = self.current_speed()
-        self.distance += speed * dt * 60
-        # Move obstacles
-        for ob in list(self.obstacles):
-            ob.update(speed)
-        self.obstacles = [o for o in self.obstacles if o.x + o.w > -10]
+        step = speed * dt * 60  # speed is in pixels per 60 fps frame
+        self.distance += step
+        self.last_step = step
+        # Drop the obstacles that left the screen last tick (they've already been
+        # collision-checked for it), then move the rest
+        self.obstacles.cull(-10)
+        self.obstacles.move(step)
         # Spawn
         self.time_since_spawn += dt
         if self.time_since_spawn >= self.spawn_cooldown(speed):
             self.maybe_spawn(speed)
             self.time_since_spawn = 0.0
-        # Ground stripes
-        self.stripe_offset = (self.stripe_offset + speed) % 40
+        # Ground stripes / parallax layers
+        self.scroll += step
 
     # --- drawing ---
+    def _build_background(self):
+        self.background = build_static()
+        self.layers.append(ground_stripes())  # nearest layer -> drawn last
+
+    def static_background(self) -> pygame.Surface:
+        """Sky + ground: the parts of the background that never move (cached)."""
+        if self.background is None:
+            self._build_background()
+        return self.background
+
+    def draw_layers(self, screen: pygame.Surface) -> pygame.Rect:
+        """Scrolling layers (one blit each). Returns the screen area they cover (dirty rect)."""
+        if self.background is None:
+            self._build_background()
+        area = None
+        for layer in self.layers:
+            r = layer.draw(screen, self.scroll)
+            area = r if area is None else area.union(r)
+        return area if area is not None else pygame.Rect(0, 0, 0, 0)
+
     def draw_background(self, screen: pygame.Surface):
-        screen.fill(BG)
-        pygame.draw.rect(screen, GROUND, (0, GROUND_Y, WIDTH, HEIGHT - GROUND_Y))
-        for r in self.ground_stripes:
-            rr = r.copy()
-            rr.x = (r.x - int(self.stripe_offset)) % (WIDTH + 160)
-            pygame.draw.rect(screen, (55, 55, 75), rr)
+        screen.blit(self.static_background(), (0, 0))
+        self.draw_layers(screen)
 
-    def draw_obstacles(self, screen: pygame.Surface):
+    def draw_obstacles(self, screen: pygame.Surface, positions=None):
+        # positions: optional ob -> (x, y) lookup (e.g. FixedTimestep.lerp)
         for ob in self.obstacles:
-            ob.draw(screen, OB_COLOR)
+            ob.draw(screen, OB_COLOR, positions(ob) if positions is not None else None)
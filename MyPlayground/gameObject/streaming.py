@@ -0,0 +1,87 @@
+import queue
+import threading
+
+from gameObject.platform import Platform
+
+# ChunkStreamer keeps only the part of a level file (levels.py) near the camera in the
+# World. Each frame, update(camera) works out which chunks should be resident, asks a
+# background thread to read the missing ones, adds whatever that thread has finished,
+# and drops chunks that are far behind/ahead. The frame never waits on the disk:
+# a chunk that isn't read yet just isn't there for a frame or two, which is why we
+# load `ahead` chunks past the screen edge.
+
+
+class ChunkStreamer:
+    def __init__(self, world, level, ahead=1, keep=2):
+        """
+        level: levels.LevelFile. ahead: extra chunks loaded beyond each screen edge.
+        keep: chunks beyond that before one is evicted (so walking back and forth
+        across a chunk border doesn't load/unload every frame).
+        """
+        self.world = world
+        self.level = level
+        self.ahead = ahead
+        self.keep = keep
+        self.resident = {}        # chunk number -> its Platforms in the world
+        self._pending = set()     # requested, not back yet
+        self._requests = queue.Queue()
+        self._loaded = queue.Queue()
+        self.loads = 0
+        self.evictions = 0
+        self._thread = threading.Thread(target=self._worker, name="chunk-loader", daemon=True)
+        self._thread.start()
+
+    def _worker(self):
+        level = self.level
+        while True:
+            c = self._requests.get()
+            if c is None:
+                return
+            rows = level.chunk(c)
+            platforms = [Platform(world_x=rows[i], world_y=rows[i + 1], width=rows[i + 2],
+                                  height=rows[i + 3]) for i in range(0, len(rows), 4)]
+            self._loaded.put((c, platforms))
+
+    def _span(self, left, right, margin):
+        cw = self.level.chunk_width
+        # a platform is stored in the chunk it starts in, so look back by the widest one
+        first = int((left - self.level.max_width) // cw) - margin
+        last = int(right // cw) + margin
+        return first, last
+
+    def update(self, camera) -> None:
+        left, right = camera.camera_x, camera.camera_x + camera.width
+
+        # Finished loads -> world (skip ones we stopped wanting while they were read)
+        lo, hi = self._span(left, right, self.ahead + self.keep)
+        while True:
+            try:
+                c, platforms = self._loaded.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.discard(c)
+            if lo <= c <= hi and c not in self.resident:
+                self.resident[c] = platforms
+                for p in platforms:
+                    self.world.add_platform(p)
+                self.loads += 1
+
+        # Request what should be here
+        first, last = self._span(left, right, self.ahead)
+        for c in range(first, last + 1):
+            if c not in self.resident and c not in self._pending and c in self.level.chunks:
+                self._pending.add(c)
+                self._requests.put(c)
+
+        # Evict what's far away
+        far = [c for c in self.resident if c < lo or c > hi]
+        if far:
+            gone = []
+            for c in far:
+                gone.extend(self.resident.pop(c))
+            self.world.remove_platforms(gone)
+            self.evictions += len(far)
+
+    def close(self) -> None:
+        self._requests.put(None)
+        self._thread.join()
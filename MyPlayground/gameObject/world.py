@@ -1,24 +1,77 @@
+BUCKET_WIDTH = 256  # world px per x-bucket of the platform index
+
+
 class World:
-    def __init__(self, ground_level):
+    def __init__(self, ground_level, bucket_width=BUCKET_WIDTH):
         self.ground_level = ground_level
         self.platforms = []
+        # x-interval index: bucket number -> platforms overlapping that strip of x.
+        # A platform wider than a bucket is listed in every bucket it covers, so a
+        # query only looks at the one bucket under the player's x.
+        self.bucket_width = bucket_width
+        self.buckets = {}
+
+    def _bucket_range(self, p):
+        bw = self.bucket_width
+        return range(int(p.world_x // bw), int((p.world_x + p.width) // bw) + 1)
 
     def add_platform(self, platform):
         self.platforms.append(platform)
+        for b in self._bucket_range(platform):
+            self.buckets.setdefault(b, []).append(platform)
 
-    def get_ground_height_at(self, player_x, player_y, velocity_y):
-        #Return the Y of the nearest ground/platform below the player.
-        ground_candidates = []
+    def remove_platform(self, platform):
+        self.platforms.remove(platform)
+        for b in self._bucket_range(platform):
+            bucket = self.buckets[b]
+            bucket.remove(platform)
+            if not bucket:
+                del self.buckets[b]
 
-        for p in self.platforms:
-            within_x = p.world_x <= player_x <= p.world_x + p.width
-            above_platform = player_y <= p.world_y
-            falling = velocity_y >= 0
+    def remove_platforms(self, platforms):
+        """Remove many at once (e.g. an unloaded chunk) without a list.remove per platform."""
+        gone = {id(p) for p in platforms}
+        self.platforms = [p for p in self.platforms if id(p) not in gone]
+        for p in platforms:
+            for b in self._bucket_range(p):
+                bucket = self.buckets.get(b)
+                if bucket is not None:
+                    bucket[:] = [q for q in bucket if id(q) not in gone]
+                    if not bucket:
+                        del self.buckets[b]
 
-            if within_x and above_platform and falling:
-                ground_candidates.append(p.world_y)
+    def platforms_between(self, left, right):
+        """Platforms overlapping world x in [left, right] (e.g. the camera's view), no duplicates."""
+        bw = self.bucket_width
+        seen = set()
+        found = []
+        for b in range(int(left // bw), int(right // bw) + 1):
+            for p in self.buckets.get(b, ()):
+                if id(p) not in seen and p.world_x <= right and p.world_x + p.width >= left:
+                    seen.add(id(p))
+                    found.append(p)
+        return found
 
-        # Always include main ground as a fallback
-        ground_candidates.append(self.ground_level)
+    def get_ground_height_at(self, player_x, player_y, velocity_y):
+        #Return the Y of the nearest ground/platform below the player.
+        # Main ground is the fallback; only platforms in the player's bucket can be under it
+        ground = self.ground_level
+        if velocity_y < 0:  # going up: platforms don't catch you
+            return ground
+        for p in self.buckets.get(int(player_x // self.bucket_width), ()):
+            if p.world_x <= player_x <= p.world_x + p.width and player_y <= p.world_y < ground:
+                ground = p.world_y
+        return ground
 
-        return min(ground_candidates)
+    def get_ground_heights(self, queries):
+        """Batch version: [(x, y, velocity_y), ...] -> [ground_y, ...] (e.g. for many entities)."""
+        buckets, bw, level = self.buckets, self.bucket_width, self.ground_level
+        out = []
+        for x, y, vy in queries:
+            ground = level
+            if vy >= 0:
+                for p in buckets.get(int(x // bw), ()):
+                    if p.world_x <= x <= p.world_x + p.width and y <= p.world_y < ground:
+                        ground = p.world_y
+            out.append(ground)
+        return out
@@ -0,0 +1,111 @@
+import mmap
+import random
+import struct
+from array import array
+
+from gameObject.platform import Platform
+
+# Generated test levels: a long strip of platforms going right, at a few heights,
+# some overlapping in x (stacked), some wide. Same seed = same level.
+#
+# Level files: platforms cut into fixed-width chunks of world x, so a game can load
+# just the chunks around the camera (see gameObject/streaming.py).
+#
+#   header   magic "PLVL", version, chunk_width, max platform width, counts, table offset
+#   data     per chunk: float32 x, y, w, h for each platform starting in that chunk
+#   table    per non-empty chunk: chunk number, byte offset, platform count
+#
+# Write a 1M-platform level:  python levels.py level.plvl 1000000
+
+MAGIC = b"PLVL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHffIIQ")  # magic, version, unused, chunk_width, max_width, chunks, platforms, table
+ENTRY = struct.Struct("<iQI")         # chunk number, offset, platform count
+ROW = 16                              # 4 float32 per platform
+
+
+def generate_rows(count, seed=0, ground_level=860, spacing=140):
+    """(x, y, width, height) tuples, sorted by x."""
+    rng = random.Random(seed)
+    x = 300.0
+    for _ in range(count):
+        width = rng.choice((60, 120, 200, 200, 400, 900))
+        y = ground_level - rng.randrange(40, 400, 20)
+        yield x, y, width, 20
+        x += rng.uniform(0.3, 1.5) * spacing
+
+
+def generate_platforms(count, seed=0, ground_level=860, spacing=140):
+    for x, y, w, h in generate_rows(count, seed, ground_level, spacing):
+        yield Platform(world_x=x, world_y=y, width=w, height=h)
+
+
+def write_level(path, rows, chunk_width=2048):
+    """rows: (x, y, w, h) sorted by x (e.g. generate_rows()). Streams, so any size fits."""
+    table = []
+    max_width = 0.0
+    total = 0
+    with open(path, "wb") as f:
+        f.write(bytes(HEADER.size))
+        chunk, data, last_x = None, array("f"), float("-inf")
+        for x, y, w, h in rows:
+            if x < last_x:
+                raise ValueError("write_level: rows must be sorted by x")
+            last_x = x
+            c = int(x // chunk_width)
+            if c != chunk:
+                if data:
+                    table.append((chunk, f.tell(), len(data) // 4))
+                    data.tofile(f)
+                chunk, data = c, array("f")
+            data.extend((x, y, w, h))
+            max_width = max(max_width, w)
+            total += 1
+        if data:
+            table.append((chunk, f.tell(), len(data) // 4))
+            data.tofile(f)
+        table_offset = f.tell()
+        for entry in table:
+            f.write(ENTRY.pack(*entry))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, chunk_width, max_width, len(table), total, table_offset))
+    return total
+
+
+class LevelFile:
+    """Read-only, memory-mapped level file; chunk(n) reads one chunk's rows."""
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.chunk_width, self.max_width, chunks, self.platform_count, table = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a version {VERSION} level file")
+        self.chunks = {}  # chunk number -> (offset, count)
+        for i in range(chunks):
+            c, offset, count = ENTRY.unpack_from(self._map, table + i * ENTRY.size)
+            self.chunks[c] = (offset, count)
+
+    def chunk(self, c) -> array:
+        """Flat float32 x, y, w, h, x, y, ... of the platforms starting in chunk c (empty if none)."""
+        rows = array("f")
+        entry = self.chunks.get(c)
+        if entry is not None:
+            offset, count = entry
+            rows.frombytes(self._map[offset:offset + count * ROW])
+        return rows
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    out = sys.argv[1] if len(sys.argv) > 1 else "level.plvl"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    t = time.perf_counter()
+    write_level(out, generate_rows(count, seed=1))
+    print(f"wrote {count} platforms to {out} in {time.perf_counter() - t:.1f} s")
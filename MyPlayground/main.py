@@ -1,10 +1,14 @@
 import pygame
+import sys
 import time
 
 from gameObject.player import Player
 from gameObject.world import World
 from gameObject.camera import Camera
 from gameObject.platform import Platform
+from gameObject.streaming import ChunkStreamer
+from levels import LevelFile
+from simulation import step
 
 pygame.init()
 pygame.font.init()
@@ -27,9 +31,13 @@ player = Player(world_x=0, world_y=screenH-40, radius=10)
 world = World(ground_level=screenH-40)
 camera = Camera(screenW, screenH)
 
-# Create a test platform
-test_platform = Platform(world_x=300, world_y=screenH-120, width=200, height=20)
-world.add_platform(test_platform)
+# python main.py level.plvl streams that level (see levels.py); otherwise one test platform
+streamer = None
+if len(sys.argv) > 1:
+    streamer = ChunkStreamer(world, LevelFile(sys.argv[1]))
+else:
+    test_platform = Platform(world_x=300, world_y=screenH-120, width=200, height=20)
+    world.add_platform(test_platform)
 
 running = True
 while running:
@@ -53,25 +61,17 @@ while running:
             screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
             screenW, screenH = infoObject.current_w, infoObject.current_h
 
-    # Movement
-    player.velocity_x = 0
-    if keys[pygame.K_a]:
-        player.velocity_x = -2
-    if keys[pygame.K_d]:
-        player.velocity_x = 2
-    if keys[pygame.K_w]:
-        player.jump()
+    if streamer is not None:
+        streamer.update(camera)
 
-    # Update
-    ground_y = world.get_ground_height_at(player.world_x, player.world_y, player.velocity_y)
-    player.update(ground_y)
-    camera.follow_x(player)
+    # Movement + Update (see simulation.py)
+    step(player, world, camera, left=keys[pygame.K_a], right=keys[pygame.K_d], jump=keys[pygame.K_w])
 
     # Draw
     screen.fill((0, 0, 0))
     screen_x, screen_y = camera.world_to_screen(player.world_x, player.world_y)
     pygame.draw.circle(screen, (0, 255, 255), (int(screen_x), int(screen_y)), 10)
-    for platform in world.platforms:
+    for platform in world.platforms_between(camera.camera_x, camera.camera_x + screenW):
         platform.draw(screen, camera)
 
     # Update and draw the text
@@ -0,0 +1,19 @@
+# One simulation step of the playground, with no pygame in sight.
+# main.py calls it with the keyboard state; the headless benchmarks call it with
+# scripted input, as fast as they can.
+
+
+def step(player, world, camera, left=False, right=False, jump=False):
+    # Movement
+    player.velocity_x = 0
+    if left:
+        player.velocity_x = -2
+    if right:
+        player.velocity_x = 2
+    if jump:
+        player.jump()
+
+    # Update
+    ground_y = world.get_ground_height_at(player.world_x, player.world_y, player.velocity_y)
+    player.update(ground_y)
+    camera.follow_x(player)
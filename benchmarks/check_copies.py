@@ -0,0 +1,69 @@
+# The engine modules both games use are copied, not shared: each project runs
+# standalone from its own folder (there is no common import path or package), so
+# "Intermediate-Organization & Physics/core/" and "MyPlayground/endless_runner/v2/"
+# each keep their own copy. This checks the copies haven't drifted apart.
+#
+# Compared per definition: every function, class attribute, method and module-level
+# constant the two copies BOTH have must be identical (import lines are ignored:
+# "from core.text_cache" in one project is "from text_cache" in the other).
+# A helper only one project needs may live only in that project's copy.
+# Run from the repo root:
+#   python benchmarks/check_copies.py
+import ast
+import difflib
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PHYSICS = ROOT / "Intermediate-Organization & Physics" / "core"
+RUNNER = ROOT / "MyPlayground" / "endless_runner" / "v2"
+COPIES = ("ccd", "loop", "profiler", "renderer", "replay", "sprite_cache", "text_cache")
+
+
+def definitions(path) -> dict:
+    """name -> source: "f", "Class", "Class.method", "CONSTANT" (class body = its non-def lines)."""
+    source = path.read_text()
+    found = {}
+
+    def add(prefix, nodes):
+        for node in nodes:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                continue
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                found[prefix + node.name] = ast.get_source_segment(source, node, padded=True)
+            elif isinstance(node, ast.ClassDef):
+                body = [n for n in node.body if not isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+                header = ast.get_source_segment(source, node).splitlines()[0]
+                found[prefix + node.name] = "\n".join(
+                    [header] + [ast.get_source_segment(source, n, padded=True) for n in body])
+                add(f"{prefix}{node.name}.", node.body)
+            elif not prefix:
+                targets = getattr(node, "targets", None) or [getattr(node, "target", None)]
+                name = ",".join(ast.unparse(t) for t in targets if t is not None) or ast.unparse(node)
+                found[name] = ast.get_source_segment(source, node)
+
+    add("", ast.parse(source).body)
+    return found
+
+
+def main():
+    drifted = 0
+    for name in COPIES:
+        a, b = PHYSICS / f"{name}.py", RUNNER / f"{name}.py"
+        da, db = definitions(a), definitions(b)
+        for key in sorted(da.keys() & db.keys()):
+            if da[key] != db[key]:
+                drifted += 1
+                sys.stdout.writelines(difflib.unified_diff(
+                    (da[key] + "\n").splitlines(keepends=True), (db[key] + "\n").splitlines(keepends=True),
+                    f"{a.relative_to(ROOT)}:{key}", f"{b.relative_to(ROOT)}:{key}"))
+        for only, where in ((da.keys() - db.keys(), a), (db.keys() - da.keys(), b)):
+            if only:
+                print(f"only in {where.relative_to(ROOT)}: {', '.join(sorted(only))}")
+    if drifted:
+        sys.exit(f"{drifted} shared definitions differ")
+    print(f"{len(COPIES)} copied modules in sync")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+
+# Headless runner = call one simulation tick over and over, as fast as possible,
+# with no window and no clock.tick() in the way.
+#   pass 1 (timed):  every tick timed with perf_counter_ns -> ticks/sec, p50/p99/worst
+#   pass 2 (traced): a shorter run under tracemalloc -> how much memory the ticks churn
+#                    through (peak) and how much they keep (retained, should be ~0)
+# The two passes are separate because tracemalloc slows Python down a lot.
+
+
+@dataclass
+class Result:
+    name: str
+    ticks: int
+    seconds: float
+    ticks_per_sec: float
+    p50_us: float
+    p99_us: float
+    worst_us: float
+    gc_runs: int            # generation-0 collections during the timed pass
+    peak_kib: float         # tracemalloc: highest memory above the start of the traced pass
+    retained_kib: float     # tracemalloc: memory still held after the traced pass
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def measure(name, step, ticks, warmup=60, trace_ticks=600) -> Result:
+    """Run step() `ticks` times (after `warmup` untimed ticks) and summarize.
+    The traced pass is at most trace_ticks long (and a fifth of `ticks`)."""
+    for _ in range(warmup):
+        step()
+
+    # Pass 1: timing
+    times = [0] * ticks
+    clock = time.perf_counter_ns
+    gc_before = gc.get_stats()[0]["collections"]
+    t0 = clock()
+    for i in range(ticks):
+        s = clock()
+        step()
+        times[i] = clock() - s
+    total = (clock() - t0) / 1e9
+    gc_runs = gc.get_stats()[0]["collections"] - gc_before
+    times.sort()
+
+    # Pass 2: allocations
+    trace_ticks = max(1, min(trace_ticks, ticks // 5))
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for _ in range(trace_ticks):
+        step()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(
+        name=name,
+        ticks=ticks,
+        seconds=total,
+        ticks_per_sec=ticks / total if total > 0 else float("inf"),
+        p50_us=percentile(times, 0.50) / 1000,
+        p99_us=percentile(times, 0.99) / 1000,
+        worst_us=times[-1] / 1000 if times else 0.0,
+        gc_runs=gc_runs,
+        peak_kib=(peak - start) / 1024,
+        retained_kib=(current - start) / 1024,
+    )
+
+
+HEADER = (f"{'scenario':<22}{'ticks':>8}{'ticks/sec':>12}{'p50 (us)':>11}{'p99 (us)':>11}"
+          f"{'worst (us)':>12}{'gc runs':>9}{'peak KiB':>10}{'kept KiB':>10}")
+
+
+def row(r: Result) -> str:
+    return (f"{r.name:<22}{r.ticks:>8}{r.ticks_per_sec:>12.0f}{r.p50_us:>11.1f}{r.p99_us:>11.1f}"
+            f"{r.worst_us:>12.1f}{r.gc_runs:>9}{r.peak_kib:>10.1f}{r.retained_kib:>10.1f}")
@@ -0,0 +1,99 @@
+"""
+Headless benchmark suite for all the game loops in this repo (no window needed).
+Run from the repo root:
+  python benchmarks/run.py                       all scenarios
+  python benchmarks/run.py runner-10min orbit-200
+  python benchmarks/run.py --scale 0.1           shorter runs (quick check)
+  python benchmarks/run.py --save before.json    keep the numbers...
+  python benchmarks/run.py --compare before.json ...and later, see what changed
+  python benchmarks/run.py --list
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from harness import HEADER, Result, measure, row
+from scenarios import BY_NAME, SCENARIOS
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_child(name, ticks):
+    """Inside the scenario's own process: build it, measure it, print the result as JSON."""
+    scenario = BY_NAME[name]
+    project = ROOT / scenario.project
+    os.chdir(project)
+    sys.path.insert(0, str(project))
+    step = scenario.build()
+    result = measure(name, step, ticks, warmup=min(60, ticks))
+    print(json.dumps(result.as_dict()))
+
+
+def run_scenario(name, ticks) -> Result:
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    proc = subprocess.run([sys.executable, __file__, "--child", name, "--ticks", str(ticks)],
+                          capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f"scenario {name} failed:\n{proc.stderr}")
+    return Result(**json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+def compare(results, path):
+    before = {r["name"]: r for r in json.loads(Path(path).read_text())}
+    print(f"\nvs {path}:")
+    print(f"{'scenario':<22}{'ticks/sec':>12}{'p99':>10}{'peak KiB':>10}")
+    for r in results:
+        old = before.get(r.name)
+        if old is None:
+            continue
+
+        def change(new, was):
+            return f"{(new - was) / was * 100:+.1f}%" if was else "-"
+        print(f"{r.name:<22}{change(r.ticks_per_sec, old['ticks_per_sec']):>12}"
+              f"{change(r.p99_us, old['p99_us']):>10}{change(r.peak_kib, old['peak_kib']):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", help="names (default: all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every scenario's length")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON file from an earlier --save")
+    parser.add_argument("--list", action="store_true")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--ticks", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.ticks)
+        return
+    if args.list:
+        for s in SCENARIOS:
+            print(f"{s.name:<22}{s.ticks:>8} ticks  {s.about}")
+        return
+
+    unknown = [n for n in args.scenarios if n not in BY_NAME]
+    if unknown:
+        parser.error(f"unknown scenario(s) {unknown}, see --list")
+    chosen = [BY_NAME[n] for n in args.scenarios] or SCENARIOS
+
+    print(HEADER)
+    results = []
+    for s in chosen:
+        r = run_scenario(s.name, max(1, int(s.ticks * args.scale)))
+        results.append(r)
+        print(row(r), flush=True)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps([r.as_dict() for r in results], indent=2))
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
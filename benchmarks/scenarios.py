@@ -0,0 +1,167 @@
+import math
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+# Each scenario builds one of the games WITHOUT a window and returns step(),
+# a no-argument function that advances the simulation by one fixed tick.
+# Scenarios import their project's modules inside build(), because run.py starts
+# every scenario in its own process with that project's folder on sys.path
+# (the three projects have clashing module names: world, entities, ...).
+
+PHYSICS = "Intermediate-Organization & Physics"
+RUNNER = "MyPlayground/endless_runner/v2"
+PLAYGROUND = "MyPlayground"
+
+
+@dataclass
+class Scenario:
+    name: str
+    project: str          # folder (relative to the repo root) the imports resolve from
+    ticks: int            # default length, 60 ticks = 1 simulated second
+    build: Callable[[], Callable[[], None]]
+    about: str = ""
+
+
+def orbit_rows(n, seed=1):
+    """(x, y, vx, vy, mass, radius) for n moons in circular orbits around (0, 0), G=1, M=5000."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        a = rng.uniform(0, 2 * math.pi)
+        d = rng.uniform(80, 3000)
+        v = math.sqrt(5000 / d)
+        rows.append((d * math.cos(a), d * math.sin(a), -v * math.sin(a), v * math.cos(a),
+                     rng.uniform(0.5, 2), rng.uniform(2, 5)))
+    return rows
+
+
+# --- Intermediate-Organization & Physics ---
+def physics_orbit(n, **physics_args):
+    def build():
+        from components.physics_body import PhysicsBody
+        from core.physics import Physics
+
+        bodies = [PhysicsBody(0.0, 0.0, mass=5000, radius=40)]
+        bodies += [PhysicsBody(*r) for r in orbit_rows(n)]
+        physics = Physics(G=1, **physics_args)
+        return lambda: physics.update(bodies, 1.0)
+    return build
+
+
+def ecs_orbit(n):
+    def build():
+        from components.physics_body import PhysicsBody, Static
+        from core.ecs import Registry
+        from core.physics import Physics
+        from core.systems import PhysicsSystem
+
+        reg = Registry()
+        reg.add(reg.create(PhysicsBody(0.0, 0.0, mass=5000, radius=40)), Static())
+        for r in orbit_rows(n):
+            reg.create(PhysicsBody(*r))
+        system = PhysicsSystem(reg, Physics(G=1))
+        return lambda: system.update(1.0)
+    return build
+
+
+def physics_world_orbit(n):
+    def build():
+        from core.physics_world import PhysicsWorld
+
+        pw = PhysicsWorld(G=1, capacity=n + 1, min_attractor_mass=100.0)
+        pw.add_body(0, 0, mass=5000, radius=40, static=True)
+        for r in orbit_rows(n):
+            pw.add_body(*r)
+        return lambda: pw.step(1.0)
+    return build
+
+
+# --- endless runner v2 ---
+def runner_session():
+    """Game.update() in the PLAY state with an autopilot that jumps obstacles.
+    A crash starts a new run straight away, like pressing R on the game over screen."""
+    def build():
+        from game import Game
+        from settings import PLAYER_W
+        from states import STATE_PLAY, STATE_GAME_OVER
+
+        game = Game(headless=True, seed=1234)
+        game.reset_run()
+        game.state = STATE_PLAY
+        dt = game.loop.step
+
+        def step():
+            player = game.player
+            if player.on_ground:
+                front = player.x + PLAYER_W
+                lookahead = game.world.current_speed() * 8
+                for ob in game.world.obstacles:
+                    if 0 <= ob.x - front <= lookahead:
+                        player.jump()
+                        break
+            game.update(dt)
+            if game.state == STATE_GAME_OVER:
+                game.reset_run()
+                game.state = STATE_PLAY
+        return step
+    return build
+
+
+# --- MyPlayground ---
+def playground_walk(platforms, generated=False):
+    """
+    Walks right for a while, then left, jumping every 45 ticks, over a row of platforms
+    (or over a levels.generate_platforms level when generated=True).
+    """
+    def build():
+        from gameObject.camera import Camera
+        from gameObject.platform import Platform
+        from gameObject.player import Player
+        from gameObject.world import World
+        from simulation import step as sim_step
+
+        w, h = 1600, 900
+        player = Player(world_x=0, world_y=h - 40, radius=10)
+        world = World(ground_level=h - 40)
+        camera = Camera(w, h)
+        if generated:
+            from levels import generate_platforms
+            for p in generate_platforms(platforms, seed=1, ground_level=h - 40):
+                world.add_platform(p)
+        else:
+            for i in range(platforms):
+                world.add_platform(Platform(world_x=300 + i * 260, world_y=h - 120 - (i % 3) * 40,
+                                            width=200, height=20))
+        tick = 0
+
+        def step():
+            nonlocal tick
+            right = (tick // 3000) % 2 == 0
+            sim_step(player, world, camera, left=not right, right=right, jump=tick % 45 == 0)
+            tick += 1
+        return step
+    return build
+
+
+MINUTE = 60 * 60  # ticks
+
+SCENARIOS = [
+    Scenario("orbit-200", PHYSICS, 300, physics_orbit(200),
+             "Physics.update, 200 moons around a planet, exact pairwise gravity"),
+    Scenario("orbit-200-ecs", PHYSICS, 300, ecs_orbit(200),
+             "ECS PhysicsSystem (core/systems.py), same 200 moons, planet tagged Static"),
+    Scenario("orbit-1000-bh", PHYSICS, 120,
+             physics_orbit(1000, solver="barnes_hut", broadphase="sweep_and_prune"),
+             "Physics.update, 1000 moons, Barnes-Hut + sweep and prune"),
+    Scenario("orbit-20000-pw", PHYSICS, 600, physics_world_orbit(20000),
+             "PhysicsWorld.step (NumPy), 20000 moons, planet is the only attractor"),
+    Scenario("runner-10min", RUNNER, 10 * MINUTE, runner_session(),
+             "endless runner Game.update, a 10 minute session on autopilot"),
+    Scenario("playground-10min", PLAYGROUND, 10 * MINUTE, playground_walk(100),
+             "playground simulation.step, 100 platforms, 10 minutes of walking/jumping"),
+    Scenario("playground-10k", PLAYGROUND, 10 * MINUTE, playground_walk(10_000, generated=True),
+             "playground simulation.step on a generated 10k-platform level"),
+]
+
+BY_NAME = {s.name: s for s in SCENARIOS}